@@ -3,6 +3,7 @@ import uuid
 from datetime import datetime
 from supabase import create_client
 from dotenv import load_dotenv
+from postgrest.exceptions import APIError
 
 # 환경변수 로드
 load_dotenv()
@@ -24,12 +25,11 @@ def list_tables():
         existing_tables = []
         for table in tables:
             try:
-                # Try to get a single row from the table
-                response = supabase.table(table).select('*').limit(1).execute()
-                if hasattr(response, 'error') and response.error:
-                    print(f"  Table {table} exists but is empty or has an error: {response.error}")
-                else:
-                    existing_tables.append(table)
+                # Try to get a single row from the table (supabase-py v2 raises APIError on failure)
+                supabase.table(table).select('*').limit(1).execute()
+                existing_tables.append(table)
+            except APIError as e:
+                print(f"  Table {table} exists but is empty or has an error: {e}")
             except Exception as e:
                 print(f"  Error checking table {table}: {e}")
         
@@ -43,12 +43,9 @@ def get_table_columns(table_name):
     """Get column information for a specific table"""
     try:
         # Get a single row to infer column names and types
+        # APIError is handled by the except clause below
         response = supabase.table(table_name).select('*').limit(1).execute()
         
-        if hasattr(response, 'error') and response.error:
-            print(f"  Error getting columns for {table_name}: {response.error}")
-            return []
-            
         if not response.data:
             print(f"  No data in table {table_name}")
             return []
@@ -26,3 +26,45 @@ COMMENT ON TABLE public.lesson_completions IS '강의 완료 상태를 추적하
 -- RLS(행 수준 보안) 활성화
 ALTER TABLE public.course_reviews ENABLE ROW LEVEL SECURITY;
 ALTER TABLE public.lesson_completions ENABLE ROW LEVEL SECURITY;
+
+-- 여러 테이블의 행 수를 한 번의 RPC 호출로 조회 (진단 스크립트용)
+-- 존재하지 않는 테이블은 오류 대신 cnt = NULL로 반환
+CREATE OR REPLACE FUNCTION public.get_table_counts(names TEXT[])
+RETURNS TABLE (name TEXT, cnt BIGINT)
+LANGUAGE plpgsql STABLE
+AS $$
+BEGIN
+    FOREACH name IN ARRAY names LOOP
+        IF to_regclass(format('public.%I', name)) IS NULL THEN
+            cnt := NULL;
+        ELSE
+            EXECUTE format('SELECT count(*) FROM public.%I', name) INTO cnt;
+        END IF;
+        RETURN NEXT;
+    END LOOP;
+END;
+$$;
+
+-- 여러 테이블의 컬럼 정보를 한 번의 RPC 호출로 조회 (진단 스크립트용)
+CREATE OR REPLACE FUNCTION public.get_public_schema(table_names TEXT[])
+RETURNS TABLE (table_name TEXT, column_name TEXT, data_type TEXT, is_nullable TEXT)
+LANGUAGE sql STABLE
+AS $$
+    SELECT c.table_name::TEXT, c.column_name::TEXT, c.data_type::TEXT, c.is_nullable::TEXT
+    FROM information_schema.columns c
+    WHERE c.table_schema = 'public' AND c.table_name = ANY(table_names)
+    ORDER BY c.table_name, c.ordinal_position;
+$$;
+
+-- 컬럼 구성의 해시 (스키마가 바뀌었는지 확인하는 용도, 진단 스크립트의 캐시 키)
+CREATE OR REPLACE FUNCTION public.get_schema_fingerprint(table_names TEXT[])
+RETURNS TEXT
+LANGUAGE sql STABLE
+AS $$
+    SELECT md5(string_agg(
+        c.table_name || '|' || c.column_name || '|' || c.data_type || '|' || c.is_nullable,
+        ',' ORDER BY c.table_name, c.ordinal_position
+    ))
+    FROM information_schema.columns c
+    WHERE c.table_schema = 'public' AND c.table_name = ANY(table_names);
+$$;
@@ -0,0 +1,20 @@
+import functools
+from sqlalchemy import create_engine
+from sqlalchemy.pool import NullPool
+
+@functools.lru_cache(maxsize=None)
+def get_engine(url, application_name=None):
+    """URL별로 하나의 엔진을 만들어 재사용하는 함수
+
+    점검 스크립트는 연결을 한 번만 쓰고 종료하므로 풀을 두지 않고(NullPool)
+    연결을 반납하는 즉시 닫습니다. application_name을 주면 pg_stat_activity에서
+    스크립트의 연결을 구분할 수 있습니다.
+    """
+    connect_args = {'connect_timeout': 5}
+    if application_name:
+        connect_args['application_name'] = application_name
+    return create_engine(
+        url,
+        poolclass=NullPool,
+        connect_args=connect_args,
+    )
@@ -0,0 +1,85 @@
+"""
+사용자 활동 로그를 메모리 큐에 모았다가 주기적으로 일괄 기록합니다.
+
+요청 처리 중에는 큐에 넣기만 하고, 백그라운드 작업이 interval마다(또는 max_batch가
+찰 때마다) UserActivity.bulk_log로 한 트랜잭션에 기록합니다. 프로세스가 비정상
+종료되면 마지막 interval 동안의 로그는 유실될 수 있습니다.
+"""
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional
+
+from database import SessionLocal
+from models.user import UserActivity
+
+logger = logging.getLogger(__name__)
+
+
+class ActivityQueue:
+    def __init__(self, maxsize: int = 10_000, interval: float = 1.0, max_batch: int = 500):
+        self.maxsize = maxsize
+        self.interval = interval
+        self.max_batch = max_batch
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def put(self, activity: Dict[str, Any]) -> None:
+        """활동 로그를 큐에 추가합니다. 큐가 가득 차면 요청을 막지 않고 버립니다."""
+        if self._queue is None:
+            logger.warning("활동 로그 큐가 시작되지 않아 로그를 버립니다.")
+            return
+        try:
+            self._queue.put_nowait(activity)
+        except asyncio.QueueFull:
+            logger.warning("활동 로그 큐가 가득 차 로그를 버립니다.")
+
+    async def start(self) -> None:
+        """백그라운드 기록 작업을 시작합니다. (앱 startup 이벤트에서 호출)"""
+        if self._task is None:
+            self._queue = asyncio.Queue(maxsize=self.maxsize)
+            self._task = asyncio.create_task(self._flush_loop())
+
+    async def stop(self) -> None:
+        """기록 작업을 멈추고 남은 로그를 모두 기록합니다. (앱 shutdown 이벤트에서 호출)"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        while self._queue is not None and not self._queue.empty():
+            await self._flush()
+
+    def _drain(self) -> List[Dict[str, Any]]:
+        batch = []
+        while len(batch) < self.max_batch and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        return batch
+
+    async def _flush(self) -> None:
+        batch = self._drain()
+        if batch:
+            await asyncio.to_thread(_write_batch, batch)
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                # 적체된 경우 interval을 기다리지 않고 max_batch 단위로 연속 기록
+                await self._flush()
+                while self._queue.qsize() >= self.max_batch:
+                    await self._flush()
+            except Exception:
+                logger.exception("활동 로그 일괄 기록 중 오류가 발생했습니다.")
+
+
+def _write_batch(batch: List[Dict[str, Any]]) -> None:
+    db = SessionLocal()
+    try:
+        UserActivity.bulk_log(db, batch)
+    finally:
+        db.close()
+
+
+activity_queue = ActivityQueue()
@@ -3,7 +3,7 @@ API 엔드포인트에서 사용할 의존성 주입 함수들을 정의합니
 """
 from typing import Generator, Optional
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
 from pydantic import ValidationError
@@ -12,7 +12,13 @@ from sqlalchemy.orm import Session
 from app.core import security
 from app.core.config import settings
 from app.core.database import get_db
-from app.models.user import User, Role
+from app.core.permissions import (
+    Permissions,
+    get_cached_permissions,
+    merge_role_permissions,
+    set_cached_permissions,
+)
+from app.models.user import User, Role, user_roles
 from app.schemas.user import UserInToken, TokenData
 
 # OAuth2 스키마 설정 (토큰이 필요할 때 사용)
@@ -23,13 +29,18 @@ reusable_oauth2 = OAuth2PasswordBearer(
 
 
 def get_current_user(
+    request: Request,
     db: Session = Depends(get_db),
     token: str = Depends(reusable_oauth2)
 ) -> User:
     """
     현재 인증된 사용자를 가져오는 의존성 함수입니다.
     
+    사용자의 역할 이름 집합은 request.state.role_set에 저장되어
+    같은 요청의 권한 검사에서 재사용됩니다.
+    
     Args:
+        request: FastAPI 요청 객체
         db: 데이터베이스 세션
         token: JWT 액세스 토큰
         
@@ -69,7 +80,8 @@ def get_current_user(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="비활성화된 사용자입니다."
             )
-            
+        
+        request.state.role_set = user.role_name_set
         return user
         
     except (JWTError, ValidationError):
@@ -101,6 +113,51 @@ def get_current_active_superuser(
     return current_user
 
 
+def require_role(role_name: str):
+    """
+    특정 역할을 가진 사용자만 허용하는 의존성 함수입니다.
+    
+    Args:
+        role_name: 필요한 역할 이름 (예: 'admin', 'instructor')
+        
+    Returns:
+        Callable: 역할 검사 의존성 함수
+    """
+    def _check_role(
+        request: Request,
+        current_user: User = Depends(get_current_active_user),
+    ) -> User:
+        if current_user.is_superuser or role_name in request.state.role_set:
+            return current_user
+        
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"'{role_name}' 역할이 필요합니다."
+        )
+    
+    return _check_role
+
+
+def get_user_permissions(db: Session, user: User) -> Permissions:
+    """
+    사용자의 모든 역할 권한을 병합하여 반환합니다.
+    
+    결과는 app.core.permissions 캐시에 TTL 동안 보관되므로, 캐시 적중 시에는
+    역할을 조회하지 않습니다.
+    """
+    permissions = get_cached_permissions(user.id)
+    if permissions is None:
+        rows = (
+            db.query(Role.permissions)
+            .join(user_roles, user_roles.c.role_id == Role.id)
+            .filter(user_roles.c.user_id == user.id)
+            .all()
+        )
+        permissions = merge_role_permissions(row[0] for row in rows)
+        set_cached_permissions(user.id, permissions)
+    return permissions
+
+
 def has_permission(permission: str, resource: str):
     """
     사용자에게 특정 리소스에 대한 권한이 있는지 확인하는 의존성 함수입니다.
@@ -113,6 +170,7 @@ def has_permission(permission: str, resource: str):
         Callable: 권한 검사 의존성 함수
     """
     def _check_permission(
+        db: Session = Depends(get_db),
         current_user: User = Depends(get_current_active_user),
     ) -> User:
         # 슈퍼유저는 모든 권한 보유
@@ -120,10 +178,8 @@ def has_permission(permission: str, resource: str):
             return current_user
             
         # 사용자 역할에서 권한 확인
-        for role in current_user.roles:
-            if resource in role.permissions:
-                if permission in role.permissions[resource]:
-                    return current_user
+        if permission in get_user_permissions(db, current_user).get(resource, ()):
+            return current_user
                 
         # 권한이 없는 경우
         raise HTTPException(
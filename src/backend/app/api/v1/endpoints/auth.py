@@ -1,14 +1,18 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordRequestForm
 from datetime import timedelta
 from typing import Any
+from sqlalchemy.orm import Session
 
-from app.core.database import supabase
+from app.core.database import get_db, get_supabase
 from app.core.security import (
+    blacklist_token,
     create_access_token,
     get_current_user,
     verify_password,
     get_password_hash,
+    oauth2_scheme,
+    verify_token,
     UserInToken,
     TokenData
 )
@@ -26,7 +30,7 @@ async def register(user: UserCreate):
     """
     try:
         # 이메일 중복 확인
-        existing_user = supabase.table("users").select("*").eq("email", user.email).execute()
+        existing_user = get_supabase().table("users").select("*").eq("email", user.email).execute()
         if existing_user.data:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -34,7 +38,7 @@ async def register(user: UserCreate):
             )
         
         # 사용자명 중복 확인
-        existing_username = supabase.table("users").select("*").eq("username", user.username).execute()
+        existing_username = get_supabase().table("users").select("*").eq("username", user.username).execute()
         if existing_username.data:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -45,7 +49,7 @@ async def register(user: UserCreate):
         hashed_password = get_password_hash(user.password)
         
         # Supabase Auth에 사용자 등록
-        auth_response = supabase.auth.sign_up({
+        auth_response = get_supabase().auth.sign_up({
             "email": user.email,
             "password": user.password,
             "options": {
@@ -94,7 +98,7 @@ async def login(form_data: OAuth2PasswordRequestForm = Depends()):
     """
     try:
         # 사용자 인증
-        auth_response = supabase.auth.sign_in_with_password({
+        auth_response = get_supabase().auth.sign_in_with_password({
             "email": form_data.username,
             "password": form_data.password
         })
@@ -142,7 +146,7 @@ async def read_users_me(current_user: UserInToken = Depends(get_current_user)):
     """
     try:
         # Supabase에서 사용자 정보 조회
-        user = supabase.auth.get_user(current_user.user_id)
+        user = get_supabase().auth.get_user(current_user.user_id)
         
         if not user:
             raise HTTPException(
@@ -184,7 +188,7 @@ async def refresh_token(current_user: UserInToken = Depends(get_current_user)):
         )
         
         # 사용자 정보 조회
-        user = supabase.auth.get_user(current_user.user_id)
+        user = get_supabase().auth.get_user(current_user.user_id)
         
         return {
             "access_token": access_token,
@@ -209,14 +213,25 @@ async def refresh_token(current_user: UserInToken = Depends(get_current_user)):
         )
 
 @router.post("/logout")
-async def logout(current_user: UserInToken = Depends(get_current_user)):
+async def logout(
+    request: Request,
+    token: str = Depends(oauth2_scheme),
+    db: Session = Depends(get_db),
+    current_user: UserInToken = Depends(get_current_user),
+):
     """
-    사용자 로그아웃 (클라이언트에서 토큰 삭제)
+    사용자 로그아웃 (현재 액세스 토큰을 블랙리스트에 등록)
     """
     try:
+        # 만료 전까지 같은 토큰으로 다시 인증하지 못하도록 JTI를 폐기
+        payload = verify_token(token, expected_type="access", request=request)
+        blacklist_token(db, token, payload, reason="logout")
+        
         # Supabase Auth에서 로그아웃
-        supabase.auth.sign_out()
+        get_supabase().auth.sign_out()
         return {"message": "성공적으로 로그아웃되었습니다."}
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
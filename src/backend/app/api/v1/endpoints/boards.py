@@ -1,7 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from typing import List, Optional
-from app.core.database import supabase
-from app.schemas.board import Board, BoardCreate, BoardUpdate, BoardInDBBase
+from app.core.database import get_supabase
+from app.schemas.board import Board, BoardCreate, BoardUpdate, BoardInDBBase, BoardListAdapter
 from app.core.security import get_current_user
 
 router = APIRouter()
@@ -20,7 +21,7 @@ async def read_boards(
     - **is_active**: 활성화된 게시판만 조회 (기본값: None, 전체 조회)
     """
     try:
-        query = supabase.table("boards").select("*")
+        query = get_supabase().table("boards").select("*")
         
         # 활성화 여부 필터링
         if is_active is not None:
@@ -32,7 +33,8 @@ async def read_boards(
         # 페이징 처리
         response = query.range(skip, skip + limit - 1).execute()
         
-        return response.data
+        boards = BoardListAdapter.validate_python(response.data)
+        return ORJSONResponse(BoardListAdapter.dump_python(boards))
         
     except Exception as e:
         raise HTTPException(
@@ -48,7 +50,7 @@ async def read_board(board_id: int):
     - **board_id**: 조회할 게시판 ID
     """
     try:
-        response = supabase.table("boards").select("*").eq("id", board_id).execute()
+        response = get_supabase().table("boards").select("*").eq("id", board_id).execute()
         
         if not response.data:
             raise HTTPException(
@@ -85,7 +87,7 @@ async def create_board(
     
     try:
         # 중복 이름 확인
-        existing = supabase.table("boards").select("*").eq("name", board.name).execute()
+        existing = get_supabase().table("boards").select("*").eq("name", board.name).execute()
         if existing.data:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -93,7 +95,7 @@ async def create_board(
             )
         
         # 게시판 생성
-        response = supabase.table("boards").insert(board.dict()).execute()
+        response = get_supabase().table("boards").insert(board.dict()).execute()
         
         if not response.data:
             raise HTTPException(
@@ -132,7 +134,7 @@ async def update_board(
     
     try:
         # 게시판 존재 여부 확인
-        existing = supabase.table("boards").select("*").eq("id", board_id).execute()
+        existing = get_supabase().table("boards").select("*").eq("id", board_id).execute()
         if not existing.data:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -145,7 +147,7 @@ async def update_board(
             return existing.data[0]
             
         # 게시판 업데이트
-        response = supabase.table("boards").update(update_data).eq("id", board_id).execute()
+        response = get_supabase().table("boards").update(update_data).eq("id", board_id).execute()
         
         if not response.data:
             raise HTTPException(
@@ -182,7 +184,7 @@ async def delete_board(
     
     try:
         # 게시판 존재 여부 확인
-        existing = supabase.table("boards").select("*").eq("id", board_id).execute()
+        existing = get_supabase().table("boards").select("*").eq("id", board_id).execute()
         if not existing.data:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -190,7 +192,7 @@ async def delete_board(
             )
         
         # 게시판 삭제
-        response = supabase.table("boards").delete().eq("id", board_id).execute()
+        response = get_supabase().table("boards").delete().eq("id", board_id).execute()
         
         if not response.data:
             raise HTTPException(
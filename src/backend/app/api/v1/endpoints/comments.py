@@ -1,10 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Path, Body, Query
+from fastapi.responses import ORJSONResponse
 from typing import List, Optional
 from datetime import datetime
 
-from app.core.database import supabase
+from app.core.database import get_supabase
 from app.core.security import get_current_user
-from app.schemas.comment import Comment, CommentCreate, CommentUpdate, CommentListResponse
+from app.schemas.comment import Comment, CommentCreate, CommentUpdate, CommentListAdapter, CommentListResponse
 from app.schemas.like import LikeStatus
 
 router = APIRouter()
@@ -22,7 +23,7 @@ async def create_comment(
     """
     try:
         # 게시글 존재 여부 확인
-        post = supabase.table("posts").select("id").eq("id", comment.post_id).execute()
+        post = get_supabase().table("posts").select("id").eq("id", comment.post_id).execute()
         if not post.data:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -31,7 +32,7 @@ async def create_comment(
         
         # 부모 댓글 확인 (대댓글인 경우)
         if comment.parent_id:
-            parent_comment = supabase.table("comments").select("id").eq("id", comment.parent_id).execute()
+            parent_comment = get_supabase().table("comments").select("id").eq("id", comment.parent_id).execute()
             if not parent_comment.data:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
@@ -43,7 +44,7 @@ async def create_comment(
         comment_data["user_id"] = current_user.user_id
         
         # 댓글 생성
-        response = supabase.table("comments").insert(comment_data).execute()
+        response = get_supabase().table("comments").insert(comment_data).execute()
         
         if not response.data:
             raise HTTPException(
@@ -52,14 +53,14 @@ async def create_comment(
             )
         
         # 게시글의 댓글 수 증가
-        supabase.table("posts")\
+        get_supabase().table("posts")\
             .update({"comment_count": post.data[0].get("comment_count", 0) + 1})\
             .eq("id", comment.post_id)\
             .execute()
         
         # 부모 댓글이 있는 경우, 부모 댓글의 대댓글 수 증가
         if comment.parent_id:
-            supabase.table("comments")\
+            get_supabase().table("comments")\
                 .update({"reply_count": parent_comment.data[0].get("reply_count", 0) + 1})\
                 .eq("id", comment.parent_id)\
                 .execute()
@@ -89,7 +90,7 @@ async def update_comment(
     """
     try:
         # 댓글 존재 여부 확인
-        response = supabase.table("comments").select("*").eq("id", comment_id).execute()
+        response = get_supabase().table("comments").select("*").eq("id", comment_id).execute()
         if not response.data:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -109,7 +110,7 @@ async def update_comment(
         update_data = comment_update.dict()
         update_data["updated_at"] = datetime.utcnow().isoformat()
         
-        response = supabase.table("comments")\
+        response = get_supabase().table("comments")\
             .update(update_data)\
             .eq("id", comment_id)\
             .execute()
@@ -143,7 +144,7 @@ async def delete_comment(
     """
     try:
         # 댓글 존재 여부 확인
-        response = supabase.table("comments").select("*").eq("id", comment_id).execute()
+        response = get_supabase().table("comments").select("*").eq("id", comment_id).execute()
         if not response.data:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -166,20 +167,20 @@ async def delete_comment(
             "updated_at": datetime.utcnow().isoformat()
         }
         
-        supabase.table("comments")\
+        get_supabase().table("comments")\
             .update(update_data)\
             .eq("id", comment_id)\
             .execute()
         
         # 게시글의 댓글 수 감소
-        supabase.table("posts")\
+        get_supabase().table("posts")\
             .update({"comment_count": comment.get("comment_count", 1) - 1})\
             .eq("id", comment["post_id"])\
             .execute()
         
         # 부모 댓글이 있는 경우, 부모 댓글의 대댓글 수 감소
         if comment.get("parent_id"):
-            supabase.table("comments")\
+            get_supabase().table("comments")\
                 .update({"reply_count": comment.get("reply_count", 1) - 1})\
                 .eq("id", comment["parent_id"])\
                 .execute()
@@ -207,7 +208,7 @@ async def toggle_comment_like(
     """
     try:
         # 댓글 존재 여부 확인
-        comment = supabase.table("comments").select("*").eq("id", comment_id).execute()
+        comment = get_supabase().table("comments").select("*").eq("id", comment_id).execute()
         if not comment.data:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -215,7 +216,7 @@ async def toggle_comment_like(
             )
         
         # 이미 좋아요를 눌렀는지 확인
-        like = supabase.table("comment_likes")\
+        like = get_supabase().table("comment_likes")\
             .select("*")\
             .eq("comment_id", comment_id)\
             .eq("user_id", current_user.user_id)\
@@ -225,13 +226,13 @@ async def toggle_comment_like(
         
         if like.data:
             # 좋아요 취소
-            supabase.table("comment_likes")\
+            get_supabase().table("comment_likes")\
                 .delete()\
                 .eq("id", like.data[0]["id"])\
                 .execute()
             
             # 좋아요 수 감소
-            supabase.table("comments")\
+            get_supabase().table("comments")\
                 .update({"like_count": comment.data[0].get("like_count", 1) - 1})\
                 .eq("id", comment_id)\
                 .execute()
@@ -239,7 +240,7 @@ async def toggle_comment_like(
             is_liked = False
         else:
             # 좋아요 추가
-            supabase.table("comment_likes")\
+            get_supabase().table("comment_likes")\
                 .insert({
                     "comment_id": comment_id,
                     "user_id": current_user.user_id
@@ -247,7 +248,7 @@ async def toggle_comment_like(
                 .execute()
             
             # 좋아요 수 증가
-            supabase.table("comments")\
+            get_supabase().table("comments")\
                 .update({"like_count": comment.data[0].get("like_count", 0) + 1})\
                 .eq("id", comment_id)\
                 .execute()
@@ -255,7 +256,7 @@ async def toggle_comment_like(
             is_liked = True
         
         # 최신 좋아요 수 조회
-        updated_comment = supabase.table("comments").select("like_count").eq("id", comment_id).execute()
+        updated_comment = get_supabase().table("comments").select("like_count").eq("id", comment_id).execute()
         like_count = updated_comment.data[0].get("like_count", 0) if updated_comment.data else 0
         
         return {
@@ -288,12 +289,12 @@ async def read_user_comments(
     """
     try:
         # 사용자 존재 여부 확인 (간단하게 댓글 존재 여부로 대체)
-        user_comments = supabase.table("comments").select("id").eq("user_id", user_id).limit(1).execute()
+        user_comments = get_supabase().table("comments").select("id").eq("user_id", user_id).limit(1).execute()
         if not user_comments.data:
             return {"total": 0, "items": []}
         
         # 댓글 조회
-        query = supabase.table("comments")\
+        query = get_supabase().table("comments")\
             .select("*")\
             .eq("user_id", user_id)\
             .eq("is_deleted", False)\
@@ -315,17 +316,18 @@ async def read_user_comments(
         comments = response.data
         if comments:
             post_ids = list({comment["post_id"] for comment in comments})
-            posts = supabase.table("posts").select("id,title").in_("id", post_ids).execute()
+            posts = get_supabase().table("posts").select("id,title").in_("id", post_ids).execute()
             
             post_title_map = {post["id"]: post["title"] for post in posts.data}
             
             for comment in comments:
                 comment["post_title"] = post_title_map.get(comment["post_id"], "")
         
-        return {
+        items = CommentListAdapter.validate_python(comments)
+        return ORJSONResponse({
             "total": total,
-            "items": comments
-        }
+            "items": CommentListAdapter.dump_python(items)
+        })
         
     except HTTPException:
         raise
@@ -1,10 +1,13 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Path
+from fastapi.responses import ORJSONResponse
 from typing import List, Optional
+from uuid import UUID
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
 from app.core.security import get_current_active_user
 from app.schemas.user import UserInToken
+from app.schemas.trusted import dump_trusted
 from app import schemas, crud
 
 router = APIRouter()
@@ -27,8 +30,11 @@ def read_contents(
     limit: int = 100,
     content_type: Optional[str] = None,
     is_published: Optional[bool] = None,
+    difficulty: Optional[str] = None,
     creator_id: Optional[int] = None,
     section_id: Optional[int] = None,
+    tag: Optional[str] = None,
+    source: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user: UserInToken = Depends(get_current_active_user),
 ):
@@ -41,10 +47,13 @@ def read_contents(
         limit=limit,
         content_type=content_type,
         is_published=is_published,
+        difficulty=difficulty,
         creator_id=creator_id,
         section_id=section_id,
+        tag=tag,
+        source=source,
     )
-    return contents
+    return ORJSONResponse([dump_trusted(schemas.Content, content) for content in contents])
 
 @router.get("/contents/{content_id}", response_model=schemas.Content)
 def read_content(
@@ -58,7 +67,7 @@ def read_content(
     db_content = crud.get_content(db, content_id=content_id)
     if db_content is None:
         raise HTTPException(status_code=404, detail="Content not found")
-    return db_content
+    return ORJSONResponse(dump_trusted(schemas.Content, db_content))
 
 @router.put("/contents/{content_id}", response_model=schemas.Content)
 def update_content(
@@ -133,7 +142,7 @@ def create_section(
 def read_sections(
     skip: int = 0,
     limit: int = 100,
-    course_id: Optional[int] = None,
+    course_id: Optional[UUID] = None,
     db: Session = Depends(get_db),
     current_user: UserInToken = Depends(get_current_active_user),
 ):
@@ -227,17 +236,14 @@ def create_course(
             detail="Only instructors can create courses"
         )
     
-    # 강사 ID 설정
-    course.instructor_id = current_user.id
-    
-    return crud.create_course(db=db, course=course)
+    return crud.create_course(db=db, course=course, instructor_id=current_user.id)
 
 @router.get("/courses/", response_model=List[schemas.Course])
 def read_courses(
     skip: int = 0,
     limit: int = 100,
     is_published: Optional[bool] = None,
-    instructor_id: Optional[int] = None,
+    instructor_id: Optional[UUID] = None,
     category_id: Optional[int] = None,
     db: Session = Depends(get_db),
     current_user: UserInToken = Depends(get_current_active_user),
@@ -260,7 +266,7 @@ def read_courses(
 
 @router.get("/courses/{course_id}", response_model=schemas.Course)
 def read_course(
-    course_id: int,
+    course_id: UUID,
     db: Session = Depends(get_db),
     current_user: UserInToken = Depends(get_current_active_user),
 ):
@@ -282,7 +288,7 @@ def read_course(
 
 @router.put("/courses/{course_id}", response_model=schemas.Course)
 def update_course(
-    course_id: int,
+    course_id: UUID,
     course: schemas.CourseUpdate,
     db: Session = Depends(get_db),
     current_user: UserInToken = Depends(get_current_active_user),
@@ -312,7 +318,7 @@ def update_course(
 
 @router.delete("/courses/{course_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_course(
-    course_id: int,
+    course_id: UUID,
     db: Session = Depends(get_db),
     current_user: UserInToken = Depends(get_current_active_user),
 ):
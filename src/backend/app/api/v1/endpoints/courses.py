@@ -4,11 +4,13 @@
 from typing import List, Optional
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 
 from app import crud, models, schemas
 from app.api import deps
 from app.core.config import settings
+from app.schemas.trusted import dump_trusted
 
 router = APIRouter()
 
@@ -42,7 +44,7 @@ async def read_courses(
         instructor_id=instructor_id,
         level=level,
     )
-    return courses
+    return ORJSONResponse([dump_trusted(schemas.Course, course) for course in courses])
 
 
 @router.post("/", response_model=schemas.Course, status_code=status.HTTP_201_CREATED)
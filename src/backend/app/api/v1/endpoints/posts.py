@@ -1,14 +1,15 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Path, Body
+from fastapi.responses import ORJSONResponse
 from typing import List, Optional
 from datetime import datetime
 from uuid import UUID
 
-from app.core.database import supabase
+from app.core.database import get_supabase
 from app.core.security import get_current_user
 from app.schemas.post import (
-    Post, PostCreate, PostUpdate, PostListResponse, PostSortBy
+    Post, PostCreate, PostUpdate, PostListAdapter, PostListResponse, PostSortBy
 )
-from app.schemas.comment import CommentListResponse
+from app.schemas.comment import CommentListAdapter, CommentListResponse
 from app.schemas.like import LikeStatus
 from app.schemas.bookmark import BookmarkStatus
 
@@ -35,14 +36,14 @@ async def read_posts(
     """
     try:
         # 기본 쿼리 구성
-        query = supabase.table("posts").select("*")
+        query = get_supabase().table("posts").select("*")
         
         # 게시판 필터링
         if board_id is not None:
             query = query.eq("board_id", board_id)
             
             # 게시판 존재 여부 확인
-            board = supabase.table("boards").select("*").eq("id", board_id).execute()
+            board = get_supabase().table("boards").select("*").eq("id", board_id).execute()
             if not board.data:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
@@ -88,7 +89,7 @@ async def read_posts(
             post_ids = [post["id"] for post in posts]
             
             # 좋아요 상태 확인
-            likes = supabase.table("post_likes")\
+            likes = get_supabase().table("post_likes")\
                 .select("post_id")\
                 .in_("post_id", post_ids)\
                 .eq("user_id", current_user.user_id)\
@@ -97,7 +98,7 @@ async def read_posts(
             liked_post_ids = {like["post_id"] for like in likes.data}
             
             # 북마크 상태 확인
-            bookmarks = supabase.table("bookmarks")\
+            bookmarks = get_supabase().table("bookmarks")\
                 .select("post_id")\
                 .in_("post_id", post_ids)\
                 .eq("user_id", current_user.user_id)\
@@ -110,10 +111,11 @@ async def read_posts(
                 post["is_liked"] = post["id"] in liked_post_ids
                 post["is_bookmarked"] = post["id"] in bookmarked_post_ids
         
-        return {
+        items = PostListAdapter.validate_python(posts)
+        return ORJSONResponse({
             "total": total,
-            "items": posts
-        }
+            "items": PostListAdapter.dump_python(items)
+        })
         
     except HTTPException:
         raise
@@ -136,7 +138,7 @@ async def read_post(
     """
     try:
         # 게시글 조회
-        response = supabase.table("posts").select("*").eq("id", post_id).execute()
+        response = get_supabase().table("posts").select("*").eq("id", post_id).execute()
         
         if not response.data:
             raise HTTPException(
@@ -154,7 +156,7 @@ async def read_post(
             )
         
         # 조회수 증가 (비동기로 처리하는 것이 좋음)
-        supabase.table("posts")\
+        get_supabase().table("posts")\
             .update({"view_count": post["view_count"] + 1})\
             .eq("id", post_id)\
             .execute()
@@ -164,7 +166,7 @@ async def read_post(
         # 작성자 정보 조회 (예시: Supabase Auth 사용 시)
         if "user_id" in post:
             try:
-                user = supabase.auth.admin.get_user_by_id(post["user_id"]).user
+                user = get_supabase().auth.admin.get_user_by_id(post["user_id"]).user
                 if user:
                     post["author"] = {
                         "id": user.id,
@@ -178,7 +180,7 @@ async def read_post(
         # 좋아요 및 북마크 상태 확인
         if current_user:
             # 좋아요 상태 확인
-            like = supabase.table("post_likes")\
+            like = get_supabase().table("post_likes")\
                 .select("id")\
                 .eq("post_id", post_id)\
                 .eq("user_id", current_user.user_id)\
@@ -187,7 +189,7 @@ async def read_post(
             post["is_liked"] = len(like.data) > 0
             
             # 북마크 상태 확인
-            bookmark = supabase.table("bookmarks")\
+            bookmark = get_supabase().table("bookmarks")\
                 .select("id")\
                 .eq("post_id", post_id)\
                 .eq("user_id", current_user.user_id)\
@@ -218,7 +220,7 @@ async def create_post(
     """
     try:
         # 게시판 존재 여부 확인
-        board = supabase.table("boards").select("*").eq("id", post.board_id).execute()
+        board = get_supabase().table("boards").select("*").eq("id", post.board_id).execute()
         if not board.data:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -230,7 +232,7 @@ async def create_post(
         post_data["user_id"] = current_user.user_id
         
         # 게시글 생성
-        response = supabase.table("posts").insert(post_data).execute()
+        response = get_supabase().table("posts").insert(post_data).execute()
         
         if not response.data:
             raise HTTPException(
@@ -239,7 +241,7 @@ async def create_post(
             )
         
         # 게시판의 게시글 수 증가
-        supabase.table("boards")\
+        get_supabase().table("boards")\
             .update({"post_count": (board.data[0].get("post_count", 0) + 1)})\
             .eq("id", post.board_id)\
             .execute()
@@ -269,7 +271,7 @@ async def update_post(
     """
     try:
         # 게시글 존재 여부 확인
-        response = supabase.table("posts").select("*").eq("id", post_id).execute()
+        response = get_supabase().table("posts").select("*").eq("id", post_id).execute()
         if not response.data:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -293,7 +295,7 @@ async def update_post(
         update_data["updated_at"] = datetime.utcnow().isoformat()
         
         # 게시글 업데이트
-        response = supabase.table("posts")\
+        response = get_supabase().table("posts")\
             .update(update_data)\
             .eq("id", post_id)\
             .execute()
@@ -327,7 +329,7 @@ async def delete_post(
     """
     try:
         # 게시글 존재 여부 확인
-        response = supabase.table("posts").select("*").eq("id", post_id).execute()
+        response = get_supabase().table("posts").select("*").eq("id", post_id).execute()
         if not response.data:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -349,17 +351,17 @@ async def delete_post(
             "updated_at": datetime.utcnow().isoformat()
         }
         
-        supabase.table("posts")\
+        get_supabase().table("posts")\
             .update(update_data)\
             .eq("id", post_id)\
             .execute()
         
         # 게시판의 게시글 수 감소
         if post.get("board_id"):
-            board = supabase.table("boards").select("*").eq("id", post["board_id"]).execute()
+            board = get_supabase().table("boards").select("*").eq("id", post["board_id"]).execute()
             if board.data:
                 post_count = max(0, board.data[0].get("post_count", 1) - 1)
-                supabase.table("boards")\
+                get_supabase().table("boards")\
                     .update({"post_count": post_count})\
                     .eq("id", post["board_id"])\
                     .execute()
@@ -387,7 +389,7 @@ async def toggle_post_like(
     """
     try:
         # 게시글 존재 여부 확인
-        post = supabase.table("posts").select("*").eq("id", post_id).execute()
+        post = get_supabase().table("posts").select("*").eq("id", post_id).execute()
         if not post.data:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -395,7 +397,7 @@ async def toggle_post_like(
             )
         
         # 이미 좋아요를 눌렀는지 확인
-        like = supabase.table("post_likes")\
+        like = get_supabase().table("post_likes")\
             .select("*")\
             .eq("post_id", post_id)\
             .eq("user_id", current_user.user_id)\
@@ -405,13 +407,13 @@ async def toggle_post_like(
         
         if like.data:
             # 좋아요 취소
-            supabase.table("post_likes")\
+            get_supabase().table("post_likes")\
                 .delete()\
                 .eq("id", like.data[0]["id"])\
                 .execute()
             
             # 좋아요 수 감소
-            supabase.table("posts")\
+            get_supabase().table("posts")\
                 .update({"like_count": post.data[0].get("like_count", 1) - 1})\
                 .eq("id", post_id)\
                 .execute()
@@ -419,7 +421,7 @@ async def toggle_post_like(
             is_liked = False
         else:
             # 좋아요 추가
-            supabase.table("post_likes")\
+            get_supabase().table("post_likes")\
                 .insert({
                     "post_id": post_id,
                     "user_id": current_user.user_id
@@ -427,7 +429,7 @@ async def toggle_post_like(
                 .execute()
             
             # 좋아요 수 증가
-            supabase.table("posts")\
+            get_supabase().table("posts")\
                 .update({"like_count": post.data[0].get("like_count", 0) + 1})\
                 .eq("id", post_id)\
                 .execute()
@@ -435,7 +437,7 @@ async def toggle_post_like(
             is_liked = True
         
         # 최신 좋아요 수 조회
-        updated_post = supabase.table("posts").select("like_count").eq("id", post_id).execute()
+        updated_post = get_supabase().table("posts").select("like_count").eq("id", post_id).execute()
         like_count = updated_post.data[0].get("like_count", 0) if updated_post.data else 0
         
         return {
@@ -464,7 +466,7 @@ async def toggle_post_bookmark(
     """
     try:
         # 게시글 존재 여부 확인
-        post = supabase.table("posts").select("*").eq("id", post_id).execute()
+        post = get_supabase().table("posts").select("*").eq("id", post_id).execute()
         if not post.data:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -472,7 +474,7 @@ async def toggle_post_bookmark(
             )
         
         # 이미 북마크를 했는지 확인
-        bookmark = supabase.table("bookmarks")\
+        bookmark = get_supabase().table("bookmarks")\
             .select("*")\
             .eq("post_id", post_id)\
             .eq("user_id", current_user.user_id)\
@@ -482,7 +484,7 @@ async def toggle_post_bookmark(
         
         if bookmark.data:
             # 북마크 삭제
-            supabase.table("bookmarks")\
+            get_supabase().table("bookmarks")\
                 .delete()\
                 .eq("id", bookmark.data[0]["id"])\
                 .execute()
@@ -490,7 +492,7 @@ async def toggle_post_bookmark(
             is_bookmarked = False
         else:
             # 북마크 추가
-            supabase.table("bookmarks")\
+            get_supabase().table("bookmarks")\
                 .insert({
                     "post_id": post_id,
                     "user_id": current_user.user_id
@@ -522,13 +524,16 @@ async def read_post_comments(
     """
     게시글의 댓글 목록을 조회합니다.
     
+    페이지 단위는 최상위 댓글이며, 해당 댓글들의 대댓글이 (parent_id, created_at)
+    순으로 뒤에 이어지는 평탄한 목록을 반환합니다. total은 최상위 댓글 수입니다.
+    
     - **post_id**: 댓글을 조회할 게시글 ID
     - **page**: 페이지 번호 (1부터 시작)
     - **limit**: 페이지당 항목 수 (최대 100)
     """
     try:
         # 게시글 존재 여부 확인
-        post = supabase.table("posts").select("id").eq("id", post_id).execute()
+        post = get_supabase().table("posts").select("id").eq("id", post_id).execute()
         if not post.data:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -536,7 +541,7 @@ async def read_post_comments(
             )
         
         # 댓글 조회 (부모 댓글만 먼저 조회)
-        query = supabase.table("comments")\
+        query = get_supabase().table("comments")\
             .select("*")\
             .eq("post_id", post_id)\
             .is_("parent_id", None)\
@@ -556,58 +561,40 @@ async def read_post_comments(
         response = query.range(start, end).execute()
         comments = response.data
         
-        # 대댓글 조회 및 매핑
+        # 대댓글 조회 (트리는 클라이언트가 parent_id로 구성)
         if comments:
-            # 부모 댓글 ID 목록
             parent_ids = [comment["id"] for comment in comments]
             
-            # 대댓글 조회
-            replies = supabase.table("comments")\
+            replies = get_supabase().table("comments")\
                 .select("*")\
                 .in_("parent_id", parent_ids)\
                 .eq("is_deleted", False)\
+                .order("parent_id", desc=False)\
                 .order("created_at", desc=False)\
                 .execute()
             
-            # 대댓글을 부모 댓글에 매핑
-            replies_by_parent = {}
-            for reply in replies.data:
-                parent_id = reply["parent_id"]
-                if parent_id not in replies_by_parent:
-                    replies_by_parent[parent_id] = []
-                replies_by_parent[parent_id].append(reply)
-            
-            # 댓글에 대댓글 추가
-            for comment in comments:
-                comment["replies"] = replies_by_parent.get(comment["id"], [])
+            comments.extend(replies.data)
         
         # 사용자 좋아요 상태 확인 (선택적)
         if current_user and comments:
-            # 모든 댓글 ID 수집 (부모 + 대댓글)
             all_comment_ids = [comment["id"] for comment in comments]
-            for comment in comments:
-                all_comment_ids.extend([reply["id"] for reply in comment.get("replies", [])])
             
-            # 좋아요 상태 확인
-            if all_comment_ids:
-                likes = supabase.table("comment_likes")\
-                    .select("comment_id")\
-                    .in_("comment_id", all_comment_ids)\
-                    .eq("user_id", current_user.user_id)\
-                    .execute()
-                
-                liked_comment_ids = {like["comment_id"] for like in likes.data}
-                
-                # 댓글과 대댓글에 좋아요 상태 추가
-                for comment in comments:
-                    comment["is_liked"] = comment["id"] in liked_comment_ids
-                    for reply in comment.get("replies", []):
-                        reply["is_liked"] = reply["id"] in liked_comment_ids
+            likes = get_supabase().table("comment_likes")\
+                .select("comment_id")\
+                .in_("comment_id", all_comment_ids)\
+                .eq("user_id", current_user.user_id)\
+                .execute()
+            
+            liked_comment_ids = {like["comment_id"] for like in likes.data}
+            
+            for comment in comments:
+                comment["is_liked"] = comment["id"] in liked_comment_ids
         
-        return {
+        items = CommentListAdapter.validate_python(comments)
+        return ORJSONResponse({
             "total": total,
-            "items": comments
-        }
+            "items": CommentListAdapter.dump_python(items)
+        })
         
     except HTTPException:
         raise
@@ -1,11 +1,13 @@
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Path, Body
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
 from app.core.security import get_current_active_user, get_current_active_admin
 from app.schemas.user import UserInToken, UserRole
 from app.schemas import quiz as schemas
+from app.schemas.trusted import dump_trusted
 from app import crud, models
 
 router = APIRouter()
@@ -58,7 +60,11 @@ def create_quiz(
             detail="Not enough permissions to create a quiz for this content"
         )
     
-    return crud.create_quiz(db=db, quiz=quiz, creator_id=current_user.id)
+    db_quiz = crud.create_quiz(db=db, quiz=quiz, creator_id=current_user.id)
+    return ORJSONResponse(
+        dump_trusted(schemas.QuizResponse, db_quiz),
+        status_code=status.HTTP_201_CREATED,
+    )
 
 @router.get("/quizzes/", response_model=List[schemas.QuizListResponse])
 def read_quizzes(
@@ -87,7 +93,7 @@ def read_quizzes(
     # 강사는 자신이 만든 콘텐츠의 퀴즈만 조회 가능
     elif current_user.role == UserRole.INSTRUCTOR:
         # 자신이 만든 콘텐츠 ID 목록 가져오기
-        content_ids = [c.id for c in crud.get_contents(db, creator_id=current_user.id)]
+        content_ids = set(crud.get_content_ids(db, creator_id=current_user.id))
         
         # 자신이 만든 콘텐츠가 없는 경우 빈 목록 반환
         if not content_ids:
@@ -126,13 +132,13 @@ def read_quiz(
     강사: 자신이 생성한 콘텐츠의 퀴즈 조회 가능
     일반 사용자: 공개된 퀴즈만 조회 가능
     """
-    db_quiz = crud.get_quiz(db, quiz_id=quiz_id)
+    db_quiz = crud.get_quiz_detail(db, quiz_id=quiz_id)
     if not db_quiz:
         raise HTTPException(status_code=404, detail="Quiz not found")
     
     # 관리자는 모든 퀴즈 조회 가능
     if current_user.role == UserRole.ADMIN:
-        return db_quiz
+        return ORJSONResponse(dump_trusted(schemas.QuizResponse, db_quiz))
     
     # 강사는 자신이 만든 콘텐츠의 퀴즈만 조회 가능
     if current_user.role == UserRole.INSTRUCTOR:
@@ -148,7 +154,8 @@ def read_quiz(
             detail="This quiz is not published"
         )
     
-    return db_quiz
+    # DB에서 읽은 문항/선택지는 검증 없이 응답으로 변환
+    return ORJSONResponse(dump_trusted(schemas.QuizResponse, db_quiz))
 
 @router.put("/quizzes/{quiz_id}", response_model=schemas.QuizResponse)
 def update_quiz(
@@ -175,7 +182,8 @@ def update_quiz(
                 detail="Not enough permissions to move quiz to this content"
             )
     
-    return crud.update_quiz(db=db, db_quiz=db_quiz, quiz_update=quiz_update)
+    db_quiz = crud.update_quiz(db=db, db_quiz=db_quiz, quiz_update=quiz_update)
+    return ORJSONResponse(dump_trusted(schemas.QuizResponse, db_quiz))
 
 @router.delete("/quizzes/{quiz_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_quiz(
@@ -340,4 +348,5 @@ def get_quiz_statistics(
     # 퀴즈 소유자인지 확인
     check_quiz_owner_or_admin(db, quiz_id, current_user)
     
-    return crud.get_quiz_statistics(db=db, quiz_id=quiz_id)
+    # 서버에서 집계한 값이므로 재검증 없이 그대로 직렬화
+    return ORJSONResponse(crud.get_quiz_statistics(db=db, quiz_id=quiz_id))
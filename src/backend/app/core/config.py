@@ -18,6 +18,10 @@ class Settings(BaseSettings):
     JWT_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 7  # 7일
     REFRESH_TOKEN_EXPIRE_DAYS: int = 30  # 30일
+    TOKEN_CLEANUP_INTERVAL_SECONDS: int = Field(
+        3600,
+        description="만료된 블랙리스트 토큰/오래된 취소 리프레시 토큰 정리 주기(초). 0 이하이면 정리 작업을 실행하지 않습니다."
+    )
     
     # CORS 설정
     BACKEND_CORS_ORIGINS: List[AnyHttpUrl] = [
@@ -46,6 +50,16 @@ class Settings(BaseSettings):
     
     # SQLAlchemy 데이터베이스 URL (자동 생성)
     SQLALCHEMY_DATABASE_URI: Optional[Union[PostgresDsn, str]] = None
+    SQLALCHEMY_QUERY_CACHE_SIZE: int = Field(
+        default=1200,
+        description="컴파일된 SQL 문 캐시 크기 (반복 조회 쿼리의 컴파일 비용 절감)"
+    )
+    
+    # 커넥션 풀 설정 (PostgreSQL)
+    SQLALCHEMY_POOL_SIZE: int = Field(default=10, description="풀에 유지할 커넥션 수")
+    SQLALCHEMY_MAX_OVERFLOW: int = Field(default=20, description="풀 크기를 초과해 생성할 수 있는 커넥션 수")
+    SQLALCHEMY_POOL_TIMEOUT: int = Field(default=30, description="커넥션 대기 시간(초)")
+    SQLALCHEMY_POOL_RECYCLE: int = Field(default=1800, description="커넥션 재생성 주기(초)")
     
     # Redis 설정
     REDIS_URL: str = Field("redis://localhost:6379/0", 
@@ -168,11 +182,11 @@ class Settings(BaseSettings):
         description="자격 증명(쿠키, 인증 헤더 등)을 허용할지 여부"
     )
     CORS_ALLOW_METHODS: List[str] = Field(
-        default=["*"],
+        default=["GET", "POST", "PUT", "PATCH", "DELETE"],
         description="허용할 HTTP 메서드 목록"
     )
     CORS_ALLOW_HEADERS: List[str] = Field(
-        default=["*"],
+        default=["Authorization", "Content-Type", "X-Request-ID"],
         description="허용할 HTTP 헤더 목록"
     )
     CORS_EXPOSE_HEADERS: List[str] = Field(
@@ -5,9 +5,10 @@ SQLAlchemy와 Supabase를 사용하여 데이터베이스와 상호작용합니
 """
 import os
 from contextlib import contextmanager
+from functools import lru_cache
 from typing import Generator, Optional
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker, Session, scoped_session
 from sqlalchemy.pool import StaticPool
@@ -20,11 +21,11 @@ else:
 
 # Import Base and metadata from db.base
 from app.db.base import Base, metadata  # noqa: F401
+from app.db.sqlite import set_sqlite_pragmas
 
 # 전역 변수
 engine: Optional[Engine] = None
 SessionLocal: Optional[scoped_session] = None
-supabase_client = None
 
 
 def get_engine() -> Engine:
@@ -47,9 +48,12 @@ def get_engine() -> Engine:
             db_uri,
             connect_args={"check_same_thread": False},
             poolclass=StaticPool,
+            query_cache_size=settings.SQLALCHEMY_QUERY_CACHE_SIZE,
             echo=settings.DEBUG,
         )
+        event.listen(engine, "connect", set_sqlite_pragmas)
     # PostgreSQL을 사용하는 경우 (운영 환경)
+    # pool_pre_ping: 커넥션 체크아웃 시 끊어진 연결을 감지하여 재연결
     else:
         engine = create_engine(
             settings.SQLALCHEMY_DATABASE_URI,
@@ -58,6 +62,7 @@ def get_engine() -> Engine:
             pool_size=settings.SQLALCHEMY_POOL_SIZE,
             max_overflow=settings.SQLALCHEMY_MAX_OVERFLOW,
             pool_timeout=settings.SQLALCHEMY_POOL_TIMEOUT,
+            query_cache_size=settings.SQLALCHEMY_QUERY_CACHE_SIZE,
             echo=settings.DEBUG,
         )
 
@@ -115,30 +120,39 @@ def get_db() -> Generator[Session, None, None]:
         session.close()
 
 
-def init_supabase() -> None:
-    """Supabase 클라이언트를 초기화합니다.
+@lru_cache(maxsize=None)
+def get_supabase():
+    """Supabase 클라이언트를 반환합니다.
 
-    Supabase를 사용하는 경우, 이 함수를 호출하여 클라이언트를 초기화합니다.
-    """
-    global supabase_client
+    클라이언트는 처음 호출될 때 한 번만 생성되므로, 모듈 임포트나
+    Supabase를 쓰지 않는 CLI 도구에서는 연결을 만들지 않습니다.
 
+    Returns:
+        Supabase 클라이언트 (설정 또는 패키지가 없으면 None)
+    """
     supabase_url = settings.SUPABASE_URL
     supabase_key = settings.SUPABASE_KEY
 
     if not supabase_url or not supabase_key:
         print("Supabase URL 또는 키가 설정되어 있지 않습니다.")
-        return
+        return None
 
     try:
         # Lazy import to avoid requiring supabase package
         from supabase import create_client  # type: ignore
-
-        supabase_client = create_client(
-            supabase_url,  # type: ignore
-            supabase_key  # type: ignore
-        )
     except ImportError:
         print("Supabase 패키지가 설치되어 있지 않습니다. pip install supabase로 설치해주세요.")
+        return None
+
+    return create_client(
+        supabase_url,  # type: ignore
+        supabase_key  # type: ignore
+    )
+
+
+def init_supabase() -> None:
+    """Supabase 클라이언트를 미리 생성합니다."""
+    get_supabase()
 
 
 def init_db() -> None:
@@ -0,0 +1,113 @@
+"""
+사용자별 권한 조회 결과를 프로세스 메모리에 캐시합니다.
+
+역할과 권한은 거의 바뀌지 않으므로 인증된 요청마다 역할을 다시 읽지 않고
+TTL 동안 병합된 권한 목록을 재사용합니다. User.roles 변경 시 해당 사용자의 항목을,
+Role.permissions 변경 시 캐시 전체를 트랜잭션 커밋 후에 무효화합니다
+(커밋 전에 지우면 동시 요청이 이전 데이터로 캐시를 다시 채울 수 있음).
+다른 프로세스의 변경은 TTL이 지나면 반영됩니다.
+"""
+import time
+from typing import Any, Dict, FrozenSet, Optional, Set, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+
+# 리소스 이름 -> 허용된 권한 집합
+Permissions = Dict[str, FrozenSet[str]]
+
+PERMISSION_CACHE_TTL = 60  # 초
+PERMISSION_CACHE_MAXSIZE = 10_000
+
+# 사용자 ID -> (만료 시각, 권한)
+_permission_cache: Dict[Any, Tuple[float, Permissions]] = {}
+
+# session.info에 커밋 후 무효화할 사용자 ID를 모아두는 키 (_ALL_USERS가 있으면 전체 무효화)
+_PENDING_KEY = "pending_permission_invalidations"
+_ALL_USERS = object()
+
+
+def get_cached_permissions(user_id: Any) -> Optional[Permissions]:
+    """캐시된 권한을 반환합니다. 없거나 만료되었으면 None을 반환합니다."""
+    entry = _permission_cache.get(user_id)
+    if entry is None:
+        return None
+    expires_at, permissions = entry
+    if expires_at < time.monotonic():
+        _permission_cache.pop(user_id, None)
+        return None
+    return permissions
+
+
+def set_cached_permissions(user_id: Any, permissions: Permissions) -> None:
+    """사용자 권한을 캐시에 저장합니다. 최대 크기를 넘으면 캐시를 비웁니다."""
+    if len(_permission_cache) >= PERMISSION_CACHE_MAXSIZE:
+        _permission_cache.clear()
+    _permission_cache[user_id] = (time.monotonic() + PERMISSION_CACHE_TTL, permissions)
+
+
+def invalidate_user_permissions(user_id: Any) -> None:
+    """사용자의 캐시된 권한을 제거합니다."""
+    _permission_cache.pop(user_id, None)
+
+
+def _pending_invalidations(instance: Any) -> Optional[Set[Any]]:
+    """instance가 속한 세션의 커밋 후 무효화 대상 집합을 반환합니다 (세션이 없으면 None)."""
+    session = object_session(instance)
+    if session is None:
+        return None
+    return session.info.setdefault(_PENDING_KEY, set())
+
+
+def invalidate_user_permissions_on_commit(user: Any) -> None:
+    """user가 속한 트랜잭션이 커밋된 뒤 해당 사용자의 캐시를 무효화합니다."""
+    if user.id is None:
+        # 아직 flush되지 않은 사용자는 캐시에 없음
+        return
+    pending = _pending_invalidations(user)
+    if pending is None:
+        invalidate_user_permissions(user.id)
+    else:
+        pending.add(user.id)
+
+
+def clear_permissions_on_commit(role: Any) -> None:
+    """role이 속한 트랜잭션이 커밋된 뒤 캐시 전체를 비웁니다.
+
+    역할을 가진 사용자를 모두 조회하지 않도록 전체를 비우며, 역할 권한 변경은 드뭅니다.
+    """
+    if role.id is None:
+        # 아직 flush되지 않은 역할을 가진 사용자는 캐시에 없음
+        return
+    pending = _pending_invalidations(role)
+    if pending is None:
+        _permission_cache.clear()
+    else:
+        pending.add(_ALL_USERS)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session: Session) -> None:
+    pending = session.info.pop(_PENDING_KEY, None)
+    if not pending:
+        return
+    if _ALL_USERS in pending:
+        _permission_cache.clear()
+        return
+    for user_id in pending:
+        invalidate_user_permissions(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session: Session) -> None:
+    # 롤백된 변경은 캐시에 영향을 주지 않음
+    session.info.pop(_PENDING_KEY, None)
+
+
+def merge_role_permissions(role_permissions) -> Permissions:
+    """역할별 권한 JSON({리소스: [권한, ...]}) 목록을 하나로 병합합니다."""
+    merged: Dict[str, set] = {}
+    for permissions in role_permissions:
+        for resource, actions in (permissions or {}).items():
+            merged.setdefault(resource, set()).update(actions)
+    return {resource: frozenset(actions) for resource, actions in merged.items()}
@@ -6,8 +6,10 @@ JWT 토큰 생성/검증, 인증 관련 기능을 제공합니다.
 import logging
 import secrets
 import string
+import time
 from datetime import datetime, timedelta
-from typing import Any, Dict, Optional, Tuple, Union
+from typing import Any, Dict, Optional, Tuple
+from uuid import UUID
 
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer, SecurityScopes
@@ -19,7 +21,7 @@ from app.core.config import settings
 from app.core.database import get_db
 from app.core.redis import redis_client
 from app.models.token_blacklist import TokenBlacklist
-from app.models.user import User
+from app.models.user import RefreshToken, User
 from app.utils.password import verify_password, get_password_hash
 
 # 로깅 설정
@@ -40,8 +42,13 @@ oauth2_scheme = OAuth2PasswordBearer(
     auto_error=False,
 )
 
-# 토큰 블랙리스트 캐시 (메모리 내)
-_token_blacklist_cache = set()
+# 토큰 블랙리스트 캐시 (메모리 내, JTI -> 토큰 만료 시각(monotonic))
+# Redis/DB가 원본이므로 가득 차면 만료된 항목과 가장 오래된 항목부터 버림
+_token_blacklist_cache: Dict[str, float] = {}
+_TOKEN_BLACKLIST_CACHE_MAXSIZE = 10_000
+
+# Redis 블랙리스트 키 접두사 (bl:{jti})
+_BLACKLIST_KEY_PREFIX = "bl:"
 
 
 class TokenData(BaseModel):
@@ -93,66 +100,6 @@ def generate_secure_password(length: int = 16) -> str:
             return password
 
 
-def get_password_hash(password: str, salt: Optional[str] = None) -> Union[str, Tuple[str, str]]:
-    """비밀번호를 해시합니다.
-
-    Args:
-        password: 해시할 평문 비밀번호
-        salt: 사용할 솔트 (None이면 새로 생성)
-
-    Returns:
-        str: salt가 None인 경우 해시된 비밀번호
-        Tuple[str, str]: salt가 주어진 경우 (해시된 비밀번호, 사용된 솔트)
-    """
-    if salt is None:
-        # salt 없이 단순 해시 (기본 사용)
-        return pwd_context.hash(password)
-    
-    # salt와 함께 해시 (레거시 호환용)
-    to_hash = f"{password}:{salt}"
-    hashed = pwd_context.hash(to_hash)
-    return hashed, salt
-
-
-def verify_password(plain_password: str, hashed_password: str, salt: Optional[str] = None) -> bool:
-    """평문 비밀번호와 해시된 비밀번호가 일치하는지 확인합니다.
-
-    Args:
-        plain_password: 검증할 평문 비밀번호
-        hashed_password: 저장된 해시된 비밀번호
-        salt: 비밀번호에 사용된 솔트 (선택사항, 레거시 호환용)
-
-    Returns:
-        bool: 비밀번호가 일치하면 True, 아니면 False
-    """
-    if not all([plain_password, hashed_password]):
-        return False
-    
-    try:
-        # 저장된 해시 형식이 유효한지 확인
-        if not pwd_context.identify(hashed_password):
-            security_logger.warning("잘못된 비밀번호 해시 형식")
-            return False
-            
-        # 비밀번호 검증
-        if salt:
-            to_verify = f"{plain_password}:{salt}"
-            is_valid = pwd_context.verify(to_verify, hashed_password)
-        else:
-            is_valid = pwd_context.verify(plain_password, hashed_password)
-        
-        # 검증 실패 시 로깅 (보안 로그에만 기록)
-        if not is_valid:
-            security_logger.warning("잘못된 비밀번호 시도")
-        
-        return is_valid
-        
-    except Exception as e:
-        # 예상치 못한 오류 로깅
-        security_logger.error(f"비밀번호 검증 중 오류: {e}", exc_info=True)
-        return False
-
-
 def create_jwt_token(
     subject: str,
     token_type: str = "access",
@@ -353,7 +300,7 @@ def verify_token(
 
         # 4. JTI 검증 (토큰 폐기 확인)
         jti = payload.get("jti")
-        if jti and jti in _token_blacklist_cache:
+        if jti and is_jti_blacklisted(jti):
             security_logger.warning(
                 "Blacklisted token used",
                 extra={
@@ -409,6 +356,143 @@ def verify_token(
         raise credentials_exception
 
 
+def blacklist_jti(jti: str, ttl: int) -> None:
+    """JTI를 Redis 블랙리스트에 추가합니다.
+
+    키는 토큰의 남은 수명(ttl)이 지나면 자동으로 만료됩니다.
+
+    Args:
+        jti: 폐기할 토큰의 JWT ID
+        ttl: 토큰 만료까지 남은 시간(초)
+    """
+    if ttl <= 0:
+        return
+    now = time.monotonic()
+    if len(_token_blacklist_cache) >= _TOKEN_BLACKLIST_CACHE_MAXSIZE:
+        for key in [k for k, expires_at in _token_blacklist_cache.items() if expires_at <= now]:
+            del _token_blacklist_cache[key]
+        while len(_token_blacklist_cache) >= _TOKEN_BLACKLIST_CACHE_MAXSIZE:
+            del _token_blacklist_cache[next(iter(_token_blacklist_cache))]
+    _token_blacklist_cache[jti] = now + ttl
+    if redis_client:
+        try:
+            redis_client.setex(f"{_BLACKLIST_KEY_PREFIX}{jti}", ttl, 1)
+        except Exception as e:
+            security_logger.error(f"Redis 블랙리스트 저장 실패: {e}")
+
+
+def blacklist_token(
+    db: Session, token: str, payload: Dict[str, Any], reason: Optional[str] = None
+) -> None:
+    """토큰을 폐기합니다.
+
+    조회는 Redis(bl:{jti})에서 처리하고, 데이터베이스에는 감사용 기록만 남깁니다.
+
+    Args:
+        db: 데이터베이스 세션
+        token: 폐기할 JWT 토큰
+        payload: 디코딩된 토큰 페이로드
+        reason: 폐기 사유 (선택 사항)
+    """
+    expires_at = datetime.utcfromtimestamp(payload["exp"])
+    jti = payload.get("jti")
+    subject = payload.get("sub")
+
+    db.add(
+        TokenBlacklist(
+            token=token,
+            jti=jti,
+            user_id=UUID(subject) if subject else None,
+            token_type=payload.get("type", "access"),
+            reason=reason,
+            expires_at=expires_at,
+        )
+    )
+    db.commit()
+
+    if jti:
+        blacklist_jti(jti, int((expires_at - datetime.utcnow()).total_seconds()))
+
+
+def is_jti_blacklisted(jti: str, db: Optional[Session] = None) -> bool:
+    """JTI가 폐기되었는지 확인합니다.
+
+    메모리 캐시 → Redis(EXISTS) 순으로 확인하며, Redis를 사용할 수 없을 때만
+    데이터베이스를 조회합니다.
+
+    Args:
+        jti: 확인할 JWT ID
+        db: 데이터베이스 세션 (Redis를 사용할 수 없을 때의 대체 경로)
+
+    Returns:
+        bool: 폐기 여부
+    """
+    expires_at = _token_blacklist_cache.get(jti)
+    if expires_at is not None:
+        if expires_at > time.monotonic():
+            return True
+        _token_blacklist_cache.pop(jti, None)
+
+    if redis_client:
+        try:
+            return bool(redis_client.exists(f"{_BLACKLIST_KEY_PREFIX}{jti}"))
+        except Exception as e:
+            security_logger.error(f"Redis 블랙리스트 조회 실패: {e}")
+
+    if db is None:
+        return False
+
+    return (
+        db.query(TokenBlacklist.id)
+        .filter(
+            TokenBlacklist.jti == jti,
+            TokenBlacklist.expires_at > datetime.utcnow(),
+        )
+        .first()
+        is not None
+    )
+
+
+def cleanup_expired_blacklist_tokens(db: Session) -> int:
+    """만료된 블랙리스트 토큰을 삭제합니다.
+
+    만료된 토큰은 어차피 검증 단계에서 거부되므로 보관할 필요가 없습니다.
+
+    Args:
+        db: 데이터베이스 세션
+
+    Returns:
+        int: 삭제된 토큰 수
+    """
+    deleted = (
+        db.query(TokenBlacklist)
+        .filter(TokenBlacklist.expires_at <= datetime.utcnow())
+        .delete(synchronize_session=False)
+    )
+    db.commit()
+    return deleted
+
+
+def cleanup_revoked_refresh_tokens(db: Session, older_than_days: int = 30) -> int:
+    """오래된 취소 리프레시 토큰을 삭제합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        older_than_days: 이 기간(일)보다 오래전에 생성된 취소 토큰만 삭제
+
+    Returns:
+        int: 삭제된 토큰 수
+    """
+    cutoff = datetime.utcnow() - timedelta(days=older_than_days)
+    deleted = (
+        db.query(RefreshToken)
+        .filter(RefreshToken.is_revoked.is_(True), RefreshToken.created_at < cutoff)
+        .delete(synchronize_session=False)
+    )
+    db.commit()
+    return deleted
+
+
 def generate_password_reset_token(user_id: str, email: str) -> Tuple[str, dict]:
     """비밀번호 재설정을 위한 토큰을 생성합니다.
 
@@ -455,31 +539,6 @@ def verify_password_reset_token(token: str) -> Optional[dict]:
         return None
 
 
-def get_password_hash(password: str) -> str:
-    """비밀번호를 해시합니다.
-
-    Args:
-        password: 해시할 평문 비밀번호
-
-    Returns:
-        str: 해시된 비밀번호
-    """
-    return pwd_context.hash(password)
-
-
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """평문 비밀번호와 해시된 비밀번호가 일치하는지 확인합니다.
-
-    Args:
-        plain_password: 검증할 평문 비밀번호
-        hashed_password: 저장된 해시된 비밀번호
-
-    Returns:
-        bool: 비밀번호가 일치하면 True, 아니면 False
-    """
-    return pwd_context.verify(plain_password, hashed_password)
-
-
 async def get_current_user(
     request: Request,
     security_scopes: SecurityScopes,
@@ -552,7 +611,7 @@ async def get_current_user(
 
         # 5. 토큰 JTI 검증 (토큰 폐기 확인)
         jti = payload.get("jti")
-        if jti and jti in _token_blacklist_cache:
+        if jti and is_jti_blacklisted(jti, db):
             security_logger.warning(
                 "Blacklisted token used",
                 extra={
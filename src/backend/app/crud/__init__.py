@@ -17,7 +17,7 @@ from .user_progress import UserProgressCRUD
 
 # 퀴즈 관리 관련 CRUD 함수
 from .quiz import (
-    get_quiz, get_quizzes, create_quiz, update_quiz, delete_quiz,
+    get_quiz, get_quiz_detail, get_quizzes, create_quiz, update_quiz, delete_quiz,
     get_question, create_question, update_question, delete_question,
     create_choice, update_choice, delete_choice,
     start_quiz_attempt, submit_quiz_attempt, get_quiz_attempt, get_user_quiz_attempts,
@@ -45,7 +45,7 @@ __all__ = [
     "crud_user_progress",
     
     # 퀴즈 관리 관련
-    "get_quiz", "get_quizzes", "create_quiz", "update_quiz", "delete_quiz",
+    "get_quiz", "get_quiz_detail", "get_quizzes", "create_quiz", "update_quiz", "delete_quiz",
     "get_question", "create_question", "update_question", "delete_question",
     "create_choice", "update_choice", "delete_choice",
     "start_quiz_attempt", "submit_quiz_attempt", "get_quiz_attempt", "get_user_quiz_attempts",
@@ -1,17 +1,30 @@
 from typing import List, Optional, Dict, Any, Union
+from uuid import UUID
+from sqlalchemy import exists, func, select, type_coerce
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Session, joinedload
 from fastapi import HTTPException, status
 
 from app.models.content import (
-    Content, Section, Course, Category, UserContentProgress
+    Content, Section, Category, UserContentProgress
 )
+from app.models.course import Course
 from app.schemas.content import (
     ContentCreate, ContentUpdate,
     SectionCreate, SectionUpdate,
-    CourseCreate, CourseUpdate,
     CategoryCreate, CategoryUpdate,
     UserContentProgressCreate, UserContentProgressUpdate
 )
+from app.schemas.course import CourseCreate, CourseUpdate
+
+def _has_tag(db: Session, tag: str):
+    """태그 포함 조건 (일반 JSON 타입의 contains는 문자열 LIKE로 컴파일되므로 방언별로 작성)"""
+    if db.get_bind().dialect.name == "postgresql":
+        # JSONB 포함 연산자(@>)로 ix_contents_tags GIN 인덱스를 사용
+        return type_coerce(Content.tags, JSONB).contains([tag])
+    # SQLite 등: 배열 요소를 펼쳐 정확히 일치하는 태그가 있는지 확인
+    elements = func.json_each(Content.tags).table_valued("value")
+    return exists(select(1).select_from(elements).where(elements.c.value == tag))
 
 # Content CRUD operations
 def get_content(db: Session, content_id: int) -> Optional[Content]:
@@ -23,21 +36,43 @@ def get_contents(
     limit: int = 100,
     content_type: Optional[str] = None,
     is_published: Optional[bool] = None,
+    difficulty: Optional[str] = None,
     creator_id: Optional[int] = None,
     section_id: Optional[int] = None,
+    tag: Optional[str] = None,
+    source: Optional[str] = None,
 ) -> List[Content]:
     query = db.query(Content)
     
-    if content_type:
-        query = query.filter(Content.content_type == content_type)
+    # 필터/정렬 순서는 ix_contents_list 인덱스 컬럼 순서에 맞춤
     if is_published is not None:
         query = query.filter(Content.is_published == is_published)
+    if content_type:
+        query = query.filter(Content.content_type == content_type)
+    if difficulty:
+        query = query.filter(Content.difficulty == difficulty)
     if creator_id is not None:
         query = query.filter(Content.creator_id == creator_id)
     if section_id is not None:
         query = query.filter(Content.section_id == section_id)
-    
-    return query.offset(skip).limit(limit).all()
+    if tag:
+        query = query.filter(_has_tag(db, tag))
+    if source:
+        query = query.filter(Content.metadata_['source'].as_string() == source)
+    
+    return (
+        query.order_by(Content.created_at.desc())
+        .offset(skip)
+        .limit(limit)
+        .all()
+    )
+
+def get_content_ids(db: Session, creator_id: int) -> List[int]:
+    """작성자의 콘텐츠 ID 목록만 조회 (본문/메타데이터 컬럼은 읽지 않음)"""
+    return [
+        content_id
+        for (content_id,) in db.query(Content.id).filter(Content.creator_id == creator_id)
+    ]
 
 def create_content(db: Session, content: ContentCreate, creator_id: int) -> Content:
     db_content = Content(**content.model_dump(), creator_id=creator_id)
@@ -76,7 +111,7 @@ def get_sections(
     db: Session,
     skip: int = 0,
     limit: int = 100,
-    course_id: Optional[int] = None,
+    course_id: Optional[UUID] = None,
 ) -> List[Section]:
     query = db.query(Section)
     
@@ -115,7 +150,7 @@ def delete_section(db: Session, section_id: int) -> bool:
     return True
 
 # Course CRUD operations
-def get_course(db: Session, course_id: int) -> Optional[Course]:
+def get_course(db: Session, course_id: UUID) -> Optional[Course]:
     return db.query(Course).filter(Course.id == course_id).first()
 
 def get_courses(
@@ -123,7 +158,7 @@ def get_courses(
     skip: int = 0,
     limit: int = 100,
     is_published: Optional[bool] = None,
-    instructor_id: Optional[int] = None,
+    instructor_id: Optional[UUID] = None,
     category_id: Optional[int] = None,
 ) -> List[Course]:
     query = db.query(Course)
@@ -137,8 +172,8 @@ def get_courses(
     
     return query.offset(skip).limit(limit).all()
 
-def create_course(db: Session, course: CourseCreate) -> Course:
-    db_course = Course(**course.model_dump(exclude={"category_ids"}))
+def create_course(db: Session, course: CourseCreate, instructor_id: UUID) -> Course:
+    db_course = Course(**course.model_dump(exclude={"category_ids"}), instructor_id=instructor_id)
     
     if hasattr(course, 'category_ids') and course.category_ids:
         categories = db.query(Category).filter(Category.id.in_(course.category_ids)).all()
@@ -169,7 +204,7 @@ def update_course(
     db.refresh(db_course)
     return db_course
 
-def delete_course(db: Session, course_id: int) -> bool:
+def delete_course(db: Session, course_id: UUID) -> bool:
     db_course = get_course(db, course_id)
     if not db_course:
         return False
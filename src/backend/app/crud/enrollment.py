@@ -158,7 +158,13 @@ class EnrollmentCRUD(CRUDBase[Enrollment, EnrollmentCreate, EnrollmentUpdate]):
             else:
                 query = query.filter(self.model.completed_at.is_(None))
         
-        return query.offset(skip).limit(limit).all()
+        # 최근 수강 신청 순 (ix_enrollments_user_active 인덱스 순서와 일치)
+        return (
+            query.order_by(self.model.enrolled_at.desc())
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
     
     def get_course_students(
         self, db: Session, *, course_id: str, skip: int = 0, limit: int = 100, **kwargs
@@ -1,13 +1,90 @@
-from typing import List, Optional, Dict, Any
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_, or_, func, desc
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import List, Optional, Dict, Any, Tuple
+from sqlalchemy.orm import Session, joinedload, selectinload, load_only, raiseload
+from sqlalchemy import and_, or_, func, desc, insert, update, case, select, literal
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 import json
 
 from app import models, schemas
 
+# 퀴즈별 채점 테이블 캐시: (quiz_id, updated_at) -> {question_id: (question_type, points, 정답)}
+# 퀴즈가 수정되면 updated_at이 바뀌므로 다른 프로세스의 캐시도 자동으로 무효화됩니다.
+ScoringTable = Dict[int, Tuple[str, int, Any]]
+_SCORING_TABLE_CACHE_SIZE = 512
+_scoring_table_cache: "OrderedDict[Tuple[int, Optional[datetime]], ScoringTable]" = OrderedDict()
+_scoring_table_lock = threading.Lock()
+
+def _get_quiz_scoring_table(db: Session, quiz: models.Quiz) -> ScoringTable:
+    """퀴즈의 채점 테이블을 반환합니다 (LRU 캐시)"""
+    key = (quiz.id, quiz.updated_at)
+    with _scoring_table_lock:
+        table = _scoring_table_cache.get(key)
+        if table is not None:
+            _scoring_table_cache.move_to_end(key)
+            return table
+    
+    questions = (
+        db.query(models.Question)
+        .options(selectinload(models.Question.choices))
+        .filter(models.Question.quiz_id == quiz.id)
+        .all()
+    )
+    
+    table = {}
+    for question in questions:
+        if question.question_type == "multiple_choice":
+            expected = frozenset(c.id for c in question.choices if c.is_correct)
+        elif question.question_type == "true_false":
+            expected = any(
+                c.is_correct for c in question.choices if c.choice_text.lower() == "true"
+            )
+        else:
+            expected = None
+        table[question.id] = (question.question_type, question.points, expected)
+    
+    with _scoring_table_lock:
+        _scoring_table_cache[key] = table
+        if len(_scoring_table_cache) > _SCORING_TABLE_CACHE_SIZE:
+            _scoring_table_cache.popitem(last=False)
+    
+    return table
+
+def _evict_quiz_scoring_table(quiz_id: int) -> None:
+    """퀴즈의 채점 테이블 캐시를 제거합니다"""
+    with _scoring_table_lock:
+        for key in [k for k in _scoring_table_cache if k[0] == quiz_id]:
+            del _scoring_table_cache[key]
+
 def get_quiz(db: Session, quiz_id: int) -> Optional[models.Quiz]:
-    """퀴즈 ID로 퀴즈 조회"""
-    return db.query(models.Quiz).filter(models.Quiz.id == quiz_id).first()
+    """퀴즈 ID로 퀴즈 조회
+    
+    Session.get()은 요청 단위 세션의 identity map을 먼저 확인하므로,
+    같은 요청 안에서 반복 호출되어도 SELECT는 한 번만 실행됩니다.
+    """
+    return db.get(models.Quiz, quiz_id)
+
+def get_quiz_detail(db: Session, quiz_id: int) -> Optional[models.Quiz]:
+    """상세 응답용 퀴즈 조회
+    
+    콘텐츠(권한 확인용)와 문항/선택지만 로드하고, 그 밖의 관계에 접근하면
+    추가 쿼리 대신 예외가 발생하도록 raiseload("*")를 지정합니다.
+    
+    db.get()은 세션에 이미 있는 퀴즈를 로더 옵션 없이 그대로 반환하므로,
+    항상 SELECT를 실행해 문항/선택지가 일괄 로드되도록 합니다.
+    """
+    stmt = (
+        select(models.Quiz)
+        .options(
+            joinedload(models.Quiz.content),
+            selectinload(models.Quiz.questions).selectinload(models.Question.choices),
+            raiseload("*"),
+        )
+        .where(models.Quiz.id == quiz_id)
+    )
+    return db.execute(stmt).unique().scalar_one_or_none()
 
 def get_quizzes(
     db: Session,
@@ -15,10 +92,23 @@ def get_quizzes(
     limit: int = 100,
     content_id: Optional[int] = None,
     is_published: Optional[bool] = None,
-    user_id: Optional[int] = None,
 ) -> List[models.Quiz]:
-    """여러 퀴즈 조회"""
-    query = db.query(models.Quiz)
+    """여러 퀴즈 조회 (목록 응답에 필요한 컬럼만 로드)"""
+    query = db.query(models.Quiz).options(
+        load_only(
+            models.Quiz.id,
+            models.Quiz.title,
+            models.Quiz.description,
+            models.Quiz.content_id,
+            models.Quiz.time_limit,
+            models.Quiz.max_attempts,
+            models.Quiz.passing_score,
+            models.Quiz.is_published,
+            models.Quiz.created_at,
+        ),
+        # 목록 응답에는 문항이 없으므로 selectin 로딩을 막음
+        raiseload(models.Quiz.questions),
+    )
     
     if content_id is not None:
         query = query.filter(models.Quiz.content_id == content_id)
@@ -26,16 +116,6 @@ def get_quizzes(
     if is_published is not None:
         query = query.filter(models.Quiz.is_published == is_published)
     
-    # 사용자 진행 상황과 함께 조회
-    if user_id is not None:
-        query = query.outerjoin(
-            models.UserQuizProgress,
-            and_(
-                models.UserQuizProgress.quiz_id == models.Quiz.id,
-                models.UserQuizProgress.user_id == user_id
-            )
-        )
-    
     return query.offset(skip).limit(limit).all()
 
 def create_quiz(db: Session, quiz: schemas.QuizCreate, creator_id: int) -> models.Quiz:
@@ -88,9 +168,16 @@ def update_quiz(
     
     # 질문 업데이트
     if quiz_update.questions is not None:
-        # 기존 질문 ID 목록
-        existing_question_ids = {q.id for q in db_quiz.questions if q.id}
+        # 기존 질문 ID 인덱스 (반복 탐색 대신 해시 조회, 선택지는 IN 배치 쿼리로 함께 로드)
+        existing_questions = db.execute(
+            select(models.Question)
+            .options(selectinload(models.Question.choices))
+            .where(models.Question.quiz_id == db_quiz.id)
+        ).scalars().all()
+        questions_by_id = {q.id: q for q in existing_questions if q.id}
+        existing_question_ids = set(questions_by_id)
         updated_question_ids = set()
+        deleted_choice_ids = set()
         
         for q_idx, question in enumerate(quiz_update.questions):
             question_data = question.dict(exclude_unset=True, exclude={"choices"})
@@ -98,7 +185,7 @@ def update_quiz(
             
             # 질문 업데이트 또는 생성
             if question.id and question.id in existing_question_ids:
-                db_question = next((q for q in db_quiz.questions if q.id == question.id), None)
+                db_question = questions_by_id.get(question.id)
                 if db_question:
                     for field, value in question_data.items():
                         setattr(db_question, field, value)
@@ -113,7 +200,8 @@ def update_quiz(
             
             # 선택지 업데이트
             if question.choices is not None:
-                existing_choice_ids = {c.id for c in db_question.choices if c.id}
+                choices_by_id = {c.id: c for c in db_question.choices if c.id}
+                existing_choice_ids = set(choices_by_id)
                 updated_choice_ids = set()
                 
                 for c_idx, choice in enumerate(question.choices):
@@ -121,7 +209,7 @@ def update_quiz(
                     choice_data["order_num"] = choice_data.get("order_num", c_idx)
                     
                     if choice.id and choice.id in existing_choice_ids:
-                        db_choice = next((c for c in db_question.choices if c.id == choice.id), None)
+                        db_choice = choices_by_id.get(choice.id)
                         if db_choice:
                             for field, value in choice_data.items():
                                 setattr(db_choice, field, value)
@@ -133,37 +221,76 @@ def update_quiz(
                         db.add(db_choice)
                         updated_choice_ids.add(db_choice.id)
                 
-                # 삭제된 선택지 제거
-                for choice_id in existing_choice_ids - updated_choice_ids:
-                    db.query(models.Choice).filter(models.Choice.id == choice_id).delete()
+                # 삭제된 선택지 수집 (루프 종료 후 한 번에 삭제)
+                deleted_choice_ids |= existing_choice_ids - updated_choice_ids
+        
+        # 삭제된 선택지 제거
+        if deleted_choice_ids:
+            db.query(models.Choice).filter(
+                models.Choice.id.in_(deleted_choice_ids)
+            ).delete(synchronize_session=False)
+        
+        # 삭제된 질문 제거 (선택지는 ON DELETE CASCADE로 함께 삭제됨)
+        deleted_question_ids = existing_question_ids - updated_question_ids
+        if deleted_question_ids:
+            db.query(models.Question).filter(
+                models.Question.id.in_(deleted_question_ids)
+            ).delete(synchronize_session=False)
         
-        # 삭제된 질문 제거
-        for question_id in existing_question_ids - updated_question_ids:
-            db.query(models.Question).filter(models.Question.id == question_id).delete()
+        # 질문만 변경된 경우에도 채점 테이블 캐시 키가 바뀌도록 수정 시각 갱신
+        db_quiz.updated_at = func.now()
     
     db.add(db_quiz)
     db.commit()
     db.refresh(db_quiz)
+    _evict_quiz_scoring_table(db_quiz.id)
     return db_quiz
 
 def delete_quiz(db: Session, quiz_id: int) -> None:
     """퀴즈 삭제"""
     db.query(models.Quiz).filter(models.Quiz.id == quiz_id).delete()
     db.commit()
+    _evict_quiz_scoring_table(quiz_id)
 
 # 퀴즈 시도 관련 함수
+def _start_quiz_attempt_stmt(quiz_id: int, user_id: int):
+    """다음 회차 시도를 삽입하는 INSERT ... SELECT ... RETURNING 문 생성
+    
+    퀴즈에 사용자의 기존 시도를 외부 조인해 퀴즈 단위로 집계하므로 첫 시도도 한 행이 되고,
+    최대 시도 횟수를 넘으면 HAVING에서 걸러져 삽입되는 행이 없습니다.
+    status/score 등 나머지 컬럼은 모델의 기본값이 적용됩니다.
+    """
+    Quiz, QuizAttempt = models.Quiz, models.QuizAttempt
+    last_attempt = func.coalesce(func.max(QuizAttempt.attempt_number), 0)
+    source = (
+        select(Quiz.id, literal(user_id), last_attempt + 1)
+        .outerjoin(
+            QuizAttempt,
+            and_(QuizAttempt.quiz_id == Quiz.id, QuizAttempt.user_id == user_id),
+        )
+        .where(Quiz.id == quiz_id)
+        .group_by(Quiz.id, Quiz.max_attempts)
+        # 최대 시도 횟수 검사 (0이면 무제한)
+        .having(or_(Quiz.max_attempts == 0, last_attempt < Quiz.max_attempts))
+    )
+    return (
+        insert(QuizAttempt)
+        .from_select(["quiz_id", "user_id", "attempt_number"], source)
+        .returning(QuizAttempt)
+    )
+
 def get_quiz_attempt(
     db: Session, 
     attempt_id: int, 
     user_id: Optional[int] = None
 ) -> Optional[models.QuizAttempt]:
-    """퀴즈 시도 조회"""
-    query = db.query(models.QuizAttempt).filter(models.QuizAttempt.id == attempt_id)
+    """퀴즈 시도 조회 (세션 identity map 우선)"""
+    attempt = db.get(models.QuizAttempt, attempt_id)
     
-    if user_id is not None:
-        query = query.filter(models.QuizAttempt.user_id == user_id)
+    if attempt is not None and user_id is not None and attempt.user_id != user_id:
+        return None
     
-    return query.first()
+    return attempt
 
 def get_user_quiz_attempts(
     db: Session,
@@ -189,34 +316,23 @@ def start_quiz_attempt(
     quiz_id: int, 
     user_id: int
 ) -> models.QuizAttempt:
-    """새 퀴즈 시도 시작"""
-    # 이전 시도 횟수 확인
-    attempt_count = db.query(models.QuizAttempt).filter(
-        models.QuizAttempt.quiz_id == quiz_id,
-        models.QuizAttempt.user_id == user_id
-    ).count()
+    """새 퀴즈 시도 시작
     
-    # 퀴즈 정보 가져오기
-    quiz = get_quiz(db, quiz_id)
-    if not quiz:
-        raise ValueError("Quiz not found")
+    이전 시도 횟수 확인, 최대 시도 횟수 검사, 시도 생성을 단일 INSERT ... SELECT
+    문으로 처리합니다. 삽입된 행이 없으면 퀴즈가 없거나 시도 횟수를 초과한 것입니다.
+    """
+    stmt = select(models.QuizAttempt).from_statement(
+        _start_quiz_attempt_stmt(quiz_id, user_id)
+    )
+    attempt = db.execute(stmt).scalar_one_or_none()
     
-    # 최대 시도 횟수 확인 (0이면 무제한)
-    if quiz.max_attempts > 0 and attempt_count >= quiz.max_attempts:
+    if attempt is None:
+        if get_quiz(db, quiz_id) is None:
+            raise ValueError("Quiz not found")
+        # 최대 시도 횟수 초과 (0이면 무제한)
         raise ValueError("Maximum number of attempts reached")
     
-    # 새 시도 생성
-    attempt = models.QuizAttempt(
-        quiz_id=quiz_id,
-        user_id=user_id,
-        attempt_number=attempt_count + 1,
-        status="in_progress"
-    )
-    
-    db.add(attempt)
     db.commit()
-    db.refresh(attempt)
-    
     return attempt
 
 def submit_quiz_answers(
@@ -240,6 +356,9 @@ def submit_quiz_answers(
     if not quiz:
         raise ValueError("Quiz not found")
     
+    # 채점용 정답 테이블 (질문별로 한 번만 계산, 퀴즈 단위로 캐시)
+    scoring_table = _get_quiz_scoring_table(db, quiz)
+    
     # 기존 답변 삭제
     db.query(models.QuestionAnswer).filter(
         models.QuestionAnswer.attempt_id == attempt.id
@@ -247,6 +366,7 @@ def submit_quiz_answers(
     
     total_points = 0
     max_possible_points = 0
+    answer_rows = []
     
     # 각 질문에 대한 답변 처리
     for answer in answers:
@@ -254,73 +374,78 @@ def submit_quiz_answers(
         answer_data = answer.get("answer_data", {})
         
         # 질문 정보 가져오기
-        question = next((q for q in quiz.questions if q.id == question_id), None)
-        if not question:
+        scoring = scoring_table.get(question_id)
+        if not scoring:
             continue
         
-        max_possible_points += question.points
+        question_type, points, expected = scoring
+        max_possible_points += points
         is_correct = False
         points_awarded = 0
         
         # 자동 채점 (객관식, 참/거짓)
-        if auto_grade and question.question_type in ["multiple_choice", "true_false"]:
-            if question.question_type == "multiple_choice":
+        if auto_grade and question_type in ["multiple_choice", "true_false"]:
+            if question_type == "multiple_choice":
                 # 다중 선택 답변 처리 (선택된 선택지 ID 목록)
-                selected_choice_ids = set(answer_data.get("selected_choices", []))
-                correct_choice_ids = {c.id for c in question.choices if c.is_correct}
+                selected_choice_ids = frozenset(answer_data.get("selected_choices", []))
                 
                 # 정답 여부 확인 (선택한 답이 정답과 완전히 일치해야 함)
-                is_correct = (selected_choice_ids == correct_choice_ids)
+                is_correct = (selected_choice_ids == expected)
                 
-            elif question.question_type == "true_false":
+            elif question_type == "true_false":
                 # 참/거짓 문제 처리
                 user_answer = answer_data.get("answer")
-                correct_answer = any(c.is_correct for c in question.choices if c.choice_text.lower() == "true")
-                is_correct = (user_answer == correct_answer)
+                is_correct = (user_answer == expected)
             
             # 점수 계산
-            points_awarded = question.points if is_correct else 0
+            points_awarded = points if is_correct else 0
             total_points += points_awarded
         
-        # 답변 저장
-        db_answer = models.QuestionAnswer(
-            attempt_id=attempt.id,
-            question_id=question_id,
-            answer_data=answer_data,
-            is_correct=is_correct if auto_grade else None,
-            points_awarded=points_awarded
-        )
-        db.add(db_answer)
+        # 답변 저장 (루프 종료 후 일괄 INSERT)
+        answer_rows.append({
+            "attempt_id": attempt.id,
+            "question_id": question_id,
+            "answer_data": answer_data,
+            "is_correct": is_correct if auto_grade else None,
+            "points_awarded": points_awarded,
+        })
+    
+    if answer_rows:
+        db.execute(insert(models.QuestionAnswer), answer_rows)
     
     # 시도 정보 업데이트
-    attempt.completed_at = db.func.now()
+    attempt.completed_at = func.now()
     attempt.status = "completed" if auto_grade else "submitted"
     
     if max_possible_points > 0:
         attempt.score = int((total_points / max_possible_points) * 100)
         attempt.passed = (attempt.score >= quiz.passing_score)
     
-    # 사용자 진행 상황 업데이트
-    progress = db.query(models.UserQuizProgress).filter(
-        models.UserQuizProgress.user_id == user_id,
-        models.UserQuizProgress.quiz_id == quiz.id
-    ).first()
-    
-    if not progress:
-        progress = models.UserQuizProgress(
-            user_id=user_id,
-            quiz_id=quiz.id,
-            completed_attempts=1,
-            best_score=attempt.score,
-            passed=attempt.passed,
-            last_attempt_at=attempt.completed_at
-        )
-        db.add(progress)
+    # 사용자 진행 상황 업데이트 (INSERT ... ON CONFLICT DO UPDATE 한 번으로 처리)
+    # SQLite는 GREATEST 대신 인자 두 개짜리 MAX()를 사용
+    if db.get_bind().dialect.name == "sqlite":
+        dialect_insert, greatest = sqlite_insert, func.max
     else:
-        progress.completed_attempts += 1
-        progress.best_score = max(progress.best_score, attempt.score)
-        progress.passed = progress.passed or attempt.passed
-        progress.last_attempt_at = attempt.completed_at
+        dialect_insert, greatest = pg_insert, func.greatest
+    progress_table = models.UserQuizProgress.__table__
+    upsert = dialect_insert(progress_table).values(
+        user_id=user_id,
+        quiz_id=quiz.id,
+        completed_attempts=1,
+        best_score=attempt.score,
+        passed=attempt.passed,
+        last_attempt_at=attempt.completed_at
+    )
+    upsert = upsert.on_conflict_do_update(
+        index_elements=[progress_table.c.user_id, progress_table.c.quiz_id],
+        set_={
+            "completed_attempts": progress_table.c.completed_attempts + 1,
+            "best_score": greatest(progress_table.c.best_score, upsert.excluded.best_score),
+            "passed": or_(progress_table.c.passed, upsert.excluded.passed),
+            "last_attempt_at": upsert.excluded.last_attempt_at,
+        }
+    )
+    db.execute(upsert)
     
     db.commit()
     db.refresh(attempt)
@@ -342,26 +467,44 @@ def grade_quiz_attempt(
     if not attempt:
         raise ValueError("Quiz attempt not found or not ready for grading")
     
-    # 각 답변 채점
-    total_points = 0
-    max_possible_points = 0
+    # 각 답변 채점 (채점 데이터가 있는 답변만 한 번의 UPDATE ... CASE로 갱신)
+    if grading_data:
+        question_id = models.QuestionAnswer.question_id
+        db.execute(
+            update(models.QuestionAnswer)
+            .where(
+                models.QuestionAnswer.attempt_id == attempt.id,
+                question_id.in_(list(grading_data))
+            )
+            .values(
+                points_awarded=case(
+                    {q_id: grade["points_awarded"] for q_id, grade in grading_data.items()},
+                    value=question_id
+                ),
+                is_correct=case(
+                    {q_id: grade["is_correct"] for q_id, grade in grading_data.items()},
+                    value=question_id
+                ),
+                feedback=case(
+                    {q_id: grade.get("feedback") for q_id, grade in grading_data.items()},
+                    value=question_id
+                ),
+                graded_by=grader_id,
+                graded_at=func.now(),
+            )
+            .execution_options(synchronize_session=False)
+        )
     
-    for answer in attempt.answers:
-        question = answer.question
-        max_possible_points += question.points
-        
-        # 채점 데이터가 있는 경우에만 업데이트
-        if answer.question_id in grading_data:
-            grade = grading_data[answer.question_id]
-            answer.points_awarded = grade["points_awarded"]
-            answer.is_correct = grade["is_correct"]
-            answer.feedback = grade.get("feedback")
-            answer.graded_by = grader_id
-            answer.graded_at = db.func.now()
-            
-            total_points += answer.points_awarded
-        else:
-            total_points += answer.points_awarded or 0
+    # 총점 계산 (DB에서 집계)
+    total_points, max_possible_points = (
+        db.query(
+            func.coalesce(func.sum(models.QuestionAnswer.points_awarded), 0),
+            func.coalesce(func.sum(models.Question.points), 0),
+        )
+        .join(models.Question, models.Question.id == models.QuestionAnswer.question_id)
+        .filter(models.QuestionAnswer.attempt_id == attempt.id)
+        .one()
+    )
     
     # 시도 정보 업데이트
     attempt.status = "graded"
@@ -389,11 +532,8 @@ def get_user_quiz_progress(
     user_id: int,
     quiz_id: int
 ) -> Optional[models.UserQuizProgress]:
-    """사용자의 퀴즈 진행 상황 조회"""
-    return db.query(models.UserQuizProgress).filter(
-        models.UserQuizProgress.user_id == user_id,
-        models.UserQuizProgress.quiz_id == quiz_id
-    ).first()
+    """사용자의 퀴즈 진행 상황 조회 (세션 identity map 우선)"""
+    return db.get(models.UserQuizProgress, (user_id, quiz_id))
 
 def get_quiz_statistics(
     db: Session,
@@ -424,49 +564,73 @@ def get_quiz_statistics(
             "answer_distribution": {}
         }
     
-    # 시도 통계
-    attempts = db.query(models.QuizAttempt).filter(
+    # 시도 통계 (DB에서 집계)
+    finished = and_(
         models.QuizAttempt.quiz_id == quiz_id,
         models.QuizAttempt.status.in_(["completed", "graded"])
-    ).all()
+    )
+    total_attempts, average_score, passed_attempts = db.query(
+        func.count(models.QuizAttempt.id),
+        func.avg(models.QuizAttempt.score),
+        func.sum(case((models.QuizAttempt.passed == True, 1), else_=0)),  # noqa
+    ).filter(finished).one()
     
-    if not attempts:
+    if not total_attempts:
         return stats
     
     # 기본 통계 계산
-    total_scores = sum(a.score for a in attempts)
-    passed_attempts = sum(1 for a in attempts if a.passed)
-    
-    stats["total_attempts"] = len(attempts)
-    stats["average_score"] = total_scores / len(attempts)
-    stats["pass_rate"] = (passed_attempts / len(attempts)) * 100
-    
-    # 질문별 통계 계산
-    for attempt in attempts:
-        for answer in attempt.answers:
-            if answer.question_id not in stats["question_stats"]:
-                continue
-                
-            q_stats = stats["question_stats"][answer.question_id]
-            q_stats["total_answers"] += 1
-            
-            if answer.is_correct:
-                q_stats["correct_answers"] += 1
-            
-            # 답변 분포 (객관식/참거짓)
-            if answer.question.question_type in ["multiple_choice", "true_false"]:
-                answer_key = str(answer.answer_data.get("selected_choices", []))
-                q_stats["answer_distribution"][answer_key] = q_stats["answer_distribution"].get(answer_key, 0) + 1
-            
-            # 평균 점수
-            max_points = answer.question.points
-            if max_points > 0:
-                q_stats["average_score"] += (answer.points_awarded / max_points) * 100
-    
-    # 질문별 평균 점수 계산
-    for q_id in stats["question_stats"]:
-        q_stats = stats["question_stats"][q_id]
-        if q_stats["total_answers"] > 0:
-            q_stats["average_score"] = q_stats["average_score"] / q_stats["total_answers"]
+    stats["total_attempts"] = total_attempts
+    stats["average_score"] = float(average_score or 0)
+    stats["pass_rate"] = ((passed_attempts or 0) / total_attempts) * 100
+    
+    # 질문별 통계 계산 (question_id 기준 GROUP BY)
+    question_rows = (
+        db.query(
+            models.QuestionAnswer.question_id,
+            func.count(models.QuestionAnswer.id),
+            func.sum(case((models.QuestionAnswer.is_correct == True, 1), else_=0)),  # noqa
+            func.sum(case(
+                (models.Question.points > 0,
+                 models.QuestionAnswer.points_awarded * 100.0 / models.Question.points),
+                else_=0
+            )),
+        )
+        .join(models.Question, models.Question.id == models.QuestionAnswer.question_id)
+        .join(models.QuizAttempt, models.QuizAttempt.id == models.QuestionAnswer.attempt_id)
+        .filter(finished)
+        .group_by(models.QuestionAnswer.question_id)
+        .all()
+    )
+    
+    for question_id, total_answers, correct_answers, score_sum in question_rows:
+        if question_id not in stats["question_stats"]:
+            continue
+        
+        q_stats = stats["question_stats"][question_id]
+        q_stats["total_answers"] = total_answers
+        q_stats["correct_answers"] = correct_answers or 0
+        q_stats["average_score"] = float(score_sum or 0) / total_answers
+    
+    # 답변 분포 (객관식/참거짓)
+    answer_key = func.coalesce(
+        models.QuestionAnswer.answer_data["selected_choices"].as_string(), "[]"
+    )
+    distribution_rows = (
+        db.query(
+            models.QuestionAnswer.question_id,
+            answer_key,
+            func.count(models.QuestionAnswer.id),
+        )
+        .join(models.Question, models.Question.id == models.QuestionAnswer.question_id)
+        .join(models.QuizAttempt, models.QuizAttempt.id == models.QuestionAnswer.attempt_id)
+        .filter(finished)
+        .filter(models.Question.question_type.in_(["multiple_choice", "true_false"]))
+        .group_by(models.QuestionAnswer.question_id, answer_key)
+        .all()
+    )
+    
+    for question_id, key, count in distribution_rows:
+        if question_id in stats["question_stats"]:
+            stats["question_stats"][question_id]["answer_distribution"][key] = count
     
     return stats
@@ -6,7 +6,7 @@ from typing import Any, Dict, List, Optional, Union, Tuple
 
 from fastapi.encoders import jsonable_encoder
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, func
+from sqlalchemy import and_, func, select
 from app.crud.base import CRUDBase
 from app.models.course import UserProgress, Lesson, Course, Enrollment
 from app.schemas.course import UserProgressCreate, UserProgressUpdate
@@ -22,16 +22,11 @@ class UserProgressCRUD(CRUDBase[UserProgress, UserProgressCreate, UserProgressUp
         self, db: Session, *, user_id: str, lesson_id: str
     ) -> Optional[UserProgress]:
         """사용자 ID와 수업 ID로 학습 진행 상황 조회"""
-        return (
-            db.query(self.model)
-            .filter(
-                and_(
-                    self.model.user_id == user_id,
-                    self.model.lesson_id == lesson_id
-                )
-            )
-            .first()
+        stmt = select(self.model).where(
+            self.model.user_id == user_id,
+            self.model.lesson_id == lesson_id
         )
+        return db.execute(stmt).scalars().first()
     
     def get_multi_by_user(
         self, db: Session, *, user_id: str, skip: int = 0, limit: int = 100, **kwargs
@@ -142,15 +137,21 @@ class UserProgressCRUD(CRUDBase[UserProgress, UserProgressCreate, UserProgressUp
         self, db: Session, *, user_id: str, course_id: str
     ) -> Dict[str, Any]:
         """강의별 전체 진도율 및 완료 상태 조회"""
-        # 강의의 모든 수업 조회
-        lessons = (
-            db.query(Lesson)
-            .filter(Lesson.course_id == course_id)
+        # 강의의 모든 수업과 사용자의 진행 상황을 한 번의 LEFT JOIN으로 조회
+        rows = db.execute(
+            select(Lesson, self.model)
+            .outerjoin(
+                self.model,
+                and_(
+                    self.model.lesson_id == Lesson.id,
+                    self.model.user_id == user_id
+                )
+            )
+            .where(Lesson.course_id == course_id)
             .order_by(Lesson.order.asc())
-            .all()
-        )
+        ).all()
         
-        if not lessons:
+        if not rows:
             return {
                 "total_lessons": 0,
                 "completed_lessons": 0,
@@ -159,19 +160,12 @@ class UserProgressCRUD(CRUDBase[UserProgress, UserProgressCreate, UserProgressUp
                 "lessons": []
             }
         
-        # 사용자의 학습 진행 상황 조회 (한 번의 쿼리로 최적화)
-        progress_records = {
-            str(record.lesson_id): record 
-            for record in self.get_multi_by_course(db, user_id=user_id, course_id=course_id)
-        }
-        
-        # 결과 계산
+        # 결과 계산 (한 번의 순회로 집계)
         completed_lessons = 0
         last_accessed = None
         lesson_progress = []
         
-        for lesson in lessons:
-            progress = progress_records.get(str(lesson.id))
+        for lesson, progress in rows:
             is_completed = progress.completed if progress else False
             
             if is_completed:
@@ -189,7 +183,7 @@ class UserProgressCRUD(CRUDBase[UserProgress, UserProgressCreate, UserProgressUp
                 "last_accessed": progress.last_accessed if progress else None
             })
         
-        total_lessons = len(lessons)
+        total_lessons = len(rows)
         progress_percentage = int((completed_lessons / total_lessons) * 100) if total_lessons > 0 else 0
         
         # 강의 완료 여부 확인 및 업데이트
@@ -0,0 +1,20 @@
+"""
+SQLite 연결 설정 (app.core.database와 레거시 database 모듈이 공유).
+"""
+
+# SQLite 연결마다 적용할 PRAGMA (WAL 모드에서는 NORMAL 동기화로도 크래시 안전성 유지)
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-64000",
+)
+
+
+def set_sqlite_pragmas(dbapi_conn, _connection_record) -> None:
+    """새 SQLite 연결에 쓰기 성능용 PRAGMA를 설정합니다 ('connect' 이벤트 리스너)."""
+    cursor = dbapi_conn.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
@@ -1,7 +1,18 @@
-from fastapi import FastAPI
+import asyncio
+import logging
+from typing import Optional, Tuple
+
+from fastapi import FastAPI, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from app.core.config import settings
+from app.core.database import get_db
+from app.core.security import cleanup_expired_blacklist_tokens, cleanup_revoked_refresh_tokens
 from app.api.v1.api import api_router
+from app.schemas import rebuild_schemas
+
+logger = logging.getLogger(__name__)
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
@@ -9,20 +20,75 @@ app = FastAPI(
     version="0.1.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
 )
 
 # CORS 미들웨어 설정
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # 실제 운영 환경에서는 적절한 도메인으로 제한하세요
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_origins=[str(origin).rstrip("/") for origin in settings.BACKEND_CORS_ORIGINS],
+    allow_credentials=settings.CORS_ALLOW_CREDENTIALS,
+    allow_methods=settings.CORS_ALLOW_METHODS,
+    allow_headers=settings.CORS_ALLOW_HEADERS,
+    expose_headers=settings.CORS_EXPOSE_HEADERS,
+    max_age=settings.CORS_MAX_AGE,
 )
 
 # API 라우터 등록
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
+# 만료/취소된 토큰 정리 작업
+_token_cleanup_task: Optional[asyncio.Task] = None
+
+
+def _purge_stale_tokens() -> Tuple[int, int]:
+    with get_db() as db:
+        return cleanup_expired_blacklist_tokens(db), cleanup_revoked_refresh_tokens(db)
+
+
+async def _token_cleanup_loop(interval: int) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            blacklisted, refresh = await run_in_threadpool(_purge_stale_tokens)
+            if blacklisted or refresh:
+                logger.info(
+                    "만료된 블랙리스트 토큰 %d개, 취소된 리프레시 토큰 %d개를 삭제했습니다.",
+                    blacklisted,
+                    refresh,
+                )
+        except Exception:
+            logger.exception("토큰 정리 중 오류가 발생했습니다.")
+
+
+@app.on_event("startup")
+async def build_schemas() -> None:
+    # 지연 빌드(defer_build) 스키마를 첫 요청 전에 완성
+    rebuild_schemas()
+    # OpenAPI 문서를 미리 생성 (FastAPI가 app.openapi_schema에 캐시)
+    app.openapi()
+
+
+@app.on_event("startup")
+async def start_token_cleanup() -> None:
+    global _token_cleanup_task
+    interval = settings.TOKEN_CLEANUP_INTERVAL_SECONDS
+    if interval > 0:
+        _token_cleanup_task = asyncio.create_task(_token_cleanup_loop(interval))
+
+
+@app.on_event("shutdown")
+async def stop_token_cleanup() -> None:
+    if _token_cleanup_task is not None:
+        _token_cleanup_task.cancel()
+
+# 루트 응답은 고정값이므로 시작 시 한 번만 직렬화
+_ROOT_RESPONSE_BODY = ORJSONResponse({
+    "message": "LearnFlow API 서버가 정상적으로 실행 중입니다.",
+    "docs": "/docs",
+    "redoc": "/redoc",
+}).body
+
 @app.get("/")
 async def root():
     """
@@ -30,8 +96,4 @@ async def root():
     
     API 서버가 정상적으로 실행 중임을 확인하는 용도로 사용됩니다.
     """
-    return {
-        "message": "LearnFlow API 서버가 정상적으로 실행 중입니다.",
-        "docs": "/docs",
-        "redoc": "/redoc",
-    }
+    return Response(content=_ROOT_RESPONSE_BODY, media_type="application/json")
@@ -1,7 +1,10 @@
-from datetime import datetime
 from typing import List, Optional
 from enum import Enum
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Enum as SQLEnum, JSON, Boolean
+from sqlalchemy import (
+    Column, Integer, String, Text, DateTime, ForeignKey, Enum as SQLEnum, JSON, Boolean,
+    Index, UniqueConstraint, func
+)
+from sqlalchemy.dialects.postgresql import JSONB, UUID as PGUUID
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
@@ -33,9 +36,9 @@ class Content(Base):
     duration = Column(Integer, default=0, comment="콘텐츠 재생/학습 시간(분)")
     thumbnail_url = Column(String(500), nullable=True)
     content_url = Column(String(500), nullable=True, comment="실제 콘텐츠 URL 또는 경로")
-    is_published = Column(Boolean, default=False, index=True)
-    tags = Column(JSON, default=[], comment="태그 목록")
-    metadata_ = Column("metadata", JSON, default={}, comment="추가 메타데이터")
+    is_published = Column(Boolean, default=False)
+    tags = Column(JSON().with_variant(JSONB(), "postgresql"), default=list, comment="태그 목록")
+    metadata_ = Column("metadata", JSON().with_variant(JSONB(), "postgresql"), default=dict, comment="추가 메타데이터")
     
     # 관계
     creator_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -49,8 +52,22 @@ class Content(Base):
     user_progress = relationship("UserContentProgress", back_populates="content")
     
     # 타임스탬프
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+    
+    __table_args__ = (
+        # 목록 조회(공개 여부/유형/난이도 필터 + 최신순 정렬)용 복합 인덱스
+        Index('ix_contents_list', 'is_published', 'content_type', 'difficulty', 'created_at'),
+        # 태그 포함 검색(tags @> '["python"]')용 GIN 인덱스
+        Index(
+            'ix_contents_tags',
+            'tags',
+            postgresql_using='gin',
+            postgresql_ops={'tags': 'jsonb_path_ops'},
+        ),
+        # metadata->>'source' 필터용 표현식 인덱스
+        Index('ix_contents_metadata_source', metadata_['source'].as_string()),
+    )
 
 class Section(Base):
     """콘텐츠 섹션(챕터) 모델"""
@@ -62,43 +79,13 @@ class Section(Base):
     order = Column(Integer, default=0, comment="섹션 정렬 순서")
     
     # 관계
-    course_id = Column(Integer, ForeignKey("courses.id"), nullable=False)
+    course_id = Column(PGUUID(as_uuid=True), ForeignKey("courses.id"), nullable=False)
     course = relationship("Course", back_populates="sections")
     contents = relationship("Content", back_populates="section", order_by="Content.id")
     
     # 타임스탬프
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-
-class Course(Base):
-    """강의/코스 모델"""
-    __tablename__ = "courses"
-    
-    id = Column(Integer, primary_key=True, index=True)
-    title = Column(String(200), nullable=False, index=True)
-    subtitle = Column(String(500), nullable=True)
-    description = Column(Text, nullable=True)
-    thumbnail_url = Column(String(500), nullable=True)
-    is_published = Column(Boolean, default=False, index=True)
-    price = Column(Integer, default=0, comment="가격 (원)")
-    discount_price = Column(Integer, nullable=True, comment="할인 가격 (원)")
-    
-    # 관계
-    instructor_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    instructor = relationship("User", back_populates="courses_taught")
-    
-    # 섹션
-    sections = relationship("Section", back_populates="course", order_by="Section.order")
-    
-    # 카테고리 (다대다 관계를 위한 연결 테이블 필요)
-    categories = relationship("Category", secondary="course_categories", back_populates="courses")
-    
-    # 수강생
-    students = relationship("User", secondary="enrollments", back_populates="enrolled_courses")
-    
-    # 타임스탬프
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
 
 class Category(Base):
     """콘텐츠 카테고리"""
@@ -115,17 +102,8 @@ class Category(Base):
     courses = relationship("Course", secondary="course_categories", back_populates="categories")
     
     # 타임스탬프
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-
-# 다대다 관계 테이블
-course_categories = Table(
-    "course_categories",
-    Base.metadata,
-    Column("course_id", Integer, ForeignKey("courses.id"), primary_key=True),
-    Column("category_id", Integer, ForeignKey("categories.id"), primary_key=True),
-    Column("created_at", DateTime, default=datetime.utcnow)
-)
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
 
 class UserContentProgress(Base):
     """사용자별 콘텐츠 학습 진행 상황"""
@@ -146,7 +124,7 @@ class UserContentProgress(Base):
     # 타임스탬프
     started_at = Column(DateTime, nullable=True)
     completed_at = Column(DateTime, nullable=True)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
     
     # 복합 고유 키 설정
     __table_args__ = (
@@ -1,17 +1,26 @@
 """
 강의(Course) 및 수업(Lesson) 모델을 정의합니다.
 """
-from datetime import datetime
 from typing import List, Optional
 from uuid import UUID, uuid4
 
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Integer, Float, Text, Enum
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Integer, Float, Text, Enum, Index, Table, func, text
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
 
 
+# 강의-카테고리 다대다 연결 테이블
+course_categories = Table(
+    "course_categories",
+    Base.metadata,
+    Column("course_id", PGUUID(as_uuid=True), ForeignKey("courses.id"), primary_key=True),
+    Column("category_id", Integer, ForeignKey("categories.id"), primary_key=True),
+    Column("created_at", DateTime, server_default=func.now())
+)
+
+
 class Course(Base):
     """강의 모델"""
     __tablename__ = "courses"
@@ -25,13 +34,15 @@ class Course(Base):
     duration = Column(Integer, default=0)  # 총 강의 시간 (분)
     thumbnail_url = Column(String(500), nullable=True)
     is_published = Column(Boolean, default=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
 
     # 관계 설정
     instructor = relationship("User", back_populates="courses_taught")
     lessons = relationship("Lesson", back_populates="course", cascade="all, delete-orphan")
     enrollments = relationship("Enrollment", back_populates="course", cascade="all, delete-orphan")
+    sections = relationship("Section", back_populates="course", order_by="Section.order")
+    categories = relationship("Category", secondary="course_categories", back_populates="courses")
 
     def __repr__(self):
         return f"<Course {self.title}>"
@@ -49,8 +60,8 @@ class Lesson(Base):
     duration = Column(Integer, default=0)  # 재생 시간 (초)
     order = Column(Integer, default=0)  # 강의 내 순서
     is_preview = Column(Boolean, default=False)  # 미리보기 가능 여부
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
 
     # 관계 설정
     course = relationship("Course", back_populates="lessons")
@@ -67,7 +78,7 @@ class Enrollment(Base):
     id = Column(PGUUID(as_uuid=True), primary_key=True, default=uuid4)
     user_id = Column(PGUUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     course_id = Column(PGUUID(as_uuid=True), ForeignKey("courses.id"), nullable=False)
-    enrolled_at = Column(DateTime, default=datetime.utcnow)
+    enrolled_at = Column(DateTime, server_default=func.now())
     completed_at = Column(DateTime, nullable=True)
     is_active = Column(Boolean, default=True)
 
@@ -75,6 +86,18 @@ class Enrollment(Base):
     user = relationship("User", back_populates="enrollments")
     course = relationship("Course", back_populates="enrollments")
 
+    __table_args__ = (
+        # 사용자별 수료 여부 조회용
+        Index('ix_enrollments_user_completed', 'user_id', 'completed_at'),
+        # 활성 수강 목록(최신순) 조회용 부분 인덱스
+        Index(
+            'ix_enrollments_user_active',
+            'user_id',
+            'enrolled_at',
+            postgresql_where=text('is_active'),
+        ),
+    )
+
     def __repr__(self):
         return f"<Enrollment User: {self.user_id}, Course: {self.course_id}>"
 
@@ -89,12 +112,17 @@ class UserProgress(Base):
     lesson_id = Column(PGUUID(as_uuid=True), ForeignKey("lessons.id"), nullable=False)
     completed = Column(Boolean, default=False)
     progress = Column(Integer, default=0)  # 0-100% 진행률
-    last_accessed = Column(DateTime, default=datetime.utcnow)
+    last_accessed = Column(DateTime, server_default=func.now())
     completed_at = Column(DateTime, nullable=True)
 
     # 관계 설정
     user = relationship("User", back_populates="progress")
     lesson = relationship("Lesson", back_populates="user_progress")
 
+    __table_args__ = (
+        # 사용자+수업 단위 진행 상황 조회용 (사용자당 수업별 1건)
+        Index('ix_user_progress_user_lesson', 'user_id', 'lesson_id', unique=True),
+    )
+
     def __repr__(self):
         return f"<UserProgress User: {self.user_id}, Lesson: {self.lesson_id}, Progress: {self.progress}%>"
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, Boolean, Enum, DateTime, JSON, func
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, Boolean, Enum, DateTime, JSON, Index, func
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
 import uuid
@@ -21,7 +21,13 @@ class Quiz(Base):
     
     # Relationships
     content = relationship("Content", back_populates="quiz")
-    questions = relationship("Question", back_populates="quiz", cascade="all, delete-orphan")
+    # 문항/선택지가 필요한 조회는 selectinload 옵션을 명시 (get_quiz_detail 등)
+    questions = relationship(
+        "Question",
+        back_populates="quiz",
+        cascade="all, delete-orphan",
+        order_by="Question.order_num",
+    )
     attempts = relationship("QuizAttempt", back_populates="quiz", cascade="all, delete-orphan")
 
 
@@ -40,7 +46,12 @@ class Question(Base):
     
     # Relationships
     quiz = relationship("Quiz", back_populates="questions")
-    choices = relationship("Choice", back_populates="question", cascade="all, delete-orphan")
+    choices = relationship(
+        "Choice",
+        back_populates="question",
+        cascade="all, delete-orphan",
+        order_by="Choice.order_num",
+    )
     answers = relationship("QuestionAnswer", back_populates="question", cascade="all, delete-orphan")
 
 
@@ -76,6 +87,11 @@ class QuizAttempt(Base):
     quiz = relationship("Quiz", back_populates="attempts")
     user = relationship("User")
     answers = relationship("QuestionAnswer", back_populates="attempt", cascade="all, delete-orphan")
+    
+    __table_args__ = (
+        # 사용자별 시도 목록 조회(필터 + started_at 정렬) 및 시도 횟수 계산용
+        Index('ix_quiz_attempts_user_quiz_started', 'user_id', 'quiz_id', 'started_at'),
+    )
 
 
 class QuestionAnswer(Base):
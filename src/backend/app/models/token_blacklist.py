@@ -4,8 +4,10 @@ JWT 토큰 블랙리스트 모델입니다.
 이 모듈은 폐기된 JWT 토큰을 추적하기 위한 데이터베이스 모델을 정의합니다.
 """
 from datetime import datetime
+from uuid import uuid4
 
 from sqlalchemy import Column, DateTime, String, Text, func, Index
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
 
 from app.core.database import Base
 
@@ -17,18 +19,20 @@ class TokenBlacklist(Base):
     """
     __tablename__ = "token_blacklist"
     
-    id = Column(String, primary_key=True, index=True, comment="고유 ID")
+    id = Column(PGUUID(as_uuid=True), primary_key=True, default=uuid4, comment="고유 ID")
     token = Column(Text, nullable=False, index=True, comment="블랙리스트된 토큰")
     jti = Column(String, index=True, comment="JWT ID (JTI)")
-    user_id = Column(String, index=True, comment="사용자 ID")
+    user_id = Column(PGUUID(as_uuid=True), index=True, comment="사용자 ID")
     token_type = Column(String(20), default="access", comment="토큰 유형 (access, refresh, etc.)")
     reason = Column(Text, nullable=True, comment="블랙리스트 사유")
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False, comment="생성 일시")
-    expires_at = Column(DateTime, nullable=False, index=True, comment="만료 일시")
+    created_at = Column(DateTime, server_default=func.now(), nullable=False, comment="생성 일시")
+    expires_at = Column(DateTime, nullable=False, comment="만료 일시")
     
     # 복합 인덱스
     __table_args__ = (
         Index('idx_token_blacklist_user_token_type', 'user_id', 'token_type'),
+        # 만료 시각은 삽입 순서와 함께 증가하므로 B-tree 대신 BRIN 사용
+        Index('idx_token_blacklist_expires_at', 'expires_at', postgresql_using='brin'),
     )
     
     def __repr__(self) -> str:
@@ -42,6 +46,6 @@ class TokenBlacklist(Base):
             "user_id": self.user_id,
             "token_type": self.token_type,
             "reason": self.reason,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "expires_at": self.expires_at.isoformat() if self.expires_at else None,
+            "created_at": self.created_at,
+            "expires_at": self.expires_at,
         }
@@ -1,8 +1,19 @@
+"""
+사용자, 역할, 리프레시 토큰 모델을 정의합니다.
+
+User.roles와 Role.users는 lazy="raise"로 설정되어 있습니다. 역할 정보가 필요한
+조회에서는 selectinload(User.roles) 옵션을 명시적으로 지정해야 하며, 옵션 없이
+접근하면 숨은 추가 쿼리 대신 예외가 발생합니다. 역할 이름만 필요한 경우에는
+User.roles 변경 이벤트로 동기화되는 User.role_names 컬럼을 사용합니다.
+"""
 from datetime import datetime
-from typing import Optional, List, Dict, Any
-from sqlalchemy import Column, String, Boolean, DateTime, JSON, Integer, ForeignKey, Table
+from uuid import uuid4
+from typing import Optional, List, Dict, Any, FrozenSet
+from sqlalchemy import Column, String, Boolean, DateTime, JSON, Integer, ForeignKey, Table, Index, event, func, text
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import relationship
 
+from app.core.permissions import clear_permissions_on_commit, invalidate_user_permissions_on_commit
 from app.db.base import Base, metadata
 from app.utils.password import get_password_hash, verify_password
 
@@ -10,8 +21,8 @@ from app.utils.password import get_password_hash, verify_password
 user_roles = Table(
     'user_roles',
     metadata,
-    Column('user_id', String, ForeignKey('users.id', ondelete='CASCADE'), primary_key=True),
-    Column('role_id', String, ForeignKey('roles.id', ondelete='CASCADE'), primary_key=True)
+    Column('user_id', PGUUID(as_uuid=True), ForeignKey('users.id', ondelete='CASCADE'), primary_key=True),
+    Column('role_id', PGUUID(as_uuid=True), ForeignKey('roles.id', ondelete='CASCADE'), primary_key=True)
 )
 
 class User(Base):
@@ -19,7 +30,7 @@ class User(Base):
     __tablename__ = "users"
     
     # 기본 정보
-    id = Column(String, primary_key=True, index=True, comment="사용자 고유 ID (UUID)")
+    id = Column(PGUUID(as_uuid=True), primary_key=True, default=uuid4, comment="사용자 고유 ID (UUID)")
     email = Column(String, unique=True, index=True, nullable=False, comment="이메일 주소")
     username = Column(String, unique=True, index=True, nullable=False, comment="사용자명")
     full_name = Column(String, nullable=True, comment="전체 이름")
@@ -33,6 +44,7 @@ class User(Base):
     is_active = Column(Boolean, default=True, comment="계정 활성화 여부")
     is_verified = Column(Boolean, default=False, comment="이메일 인증 여부")
     is_superuser = Column(Boolean, default=False, comment="슈퍼유저 여부")
+    role_names = Column(JSON, default=list, comment="역할 이름 목록 (roles 비정규화, 권한 확인용)")
     
     # 소셜 로그인 정보
     provider = Column(String, default="email", comment="인증 제공자 (email, google, github 등)")
@@ -40,11 +52,11 @@ class User(Base):
     
     # 메타데이터
     last_login = Column(DateTime, nullable=True, comment="마지막 로그인 시간")
-    created_at = Column(DateTime, default=datetime.utcnow, comment="생성일시")
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, comment="수정일시")
+    created_at = Column(DateTime, server_default=func.now(), comment="생성일시")
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), comment="수정일시")
     
     # 관계
-    roles = relationship("Role", secondary=user_roles, back_populates="users", lazy="selectin")
+    roles = relationship("Role", secondary=user_roles, back_populates="users", lazy="raise")
     posts = relationship("Post", back_populates="author", cascade="all, delete-orphan")
     comments = relationship("Comment", back_populates="author", cascade="all, delete-orphan")
     likes = relationship("Like", back_populates="user", cascade="all, delete-orphan")
@@ -65,12 +77,28 @@ class User(Base):
             return False
         return verify_password(password, self.hashed_password)
     
+    @property
+    def role_name_set(self) -> FrozenSet[str]:
+        """역할 이름 집합 (role_names가 바뀔 때만 다시 생성)"""
+        names = self.role_names or []
+        cached = self.__dict__.get("_role_name_set_cache")
+        if cached is None or cached[0] is not names:
+            cached = (names, frozenset(names))
+            self.__dict__["_role_name_set_cache"] = cached
+        return cached[1]
+    
     def has_role(self, role_name: str) -> bool:
-        """사용자가 특정 역할을 가지고 있는지 확인합니다."""
-        return any(role.name == role_name for role in self.roles)
+        """사용자가 특정 역할을 가지고 있는지 확인합니다.
+        
+        비정규화된 role_names 컬럼을 사용하므로 roles를 로드하지 않습니다.
+        """
+        return role_name in self.role_name_set
     
     def to_dict(self) -> Dict[str, Any]:
-        """사용자 정보를 딕셔너리로 변환합니다."""
+        """사용자 정보를 딕셔너리로 변환합니다.
+        
+        datetime 값은 그대로 두고 응답 계층(ORJSONResponse)에서 직렬화합니다.
+        """
         return {
             "id": self.id,
             "email": self.email,
@@ -82,23 +110,40 @@ class User(Base):
             "is_verified": self.is_verified,
             "is_superuser": self.is_superuser,
             "provider": self.provider,
-            "roles": [role.name for role in self.roles],
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            "roles": list(self.role_names or []),
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
         }
 
 
+@event.listens_for(User.roles, "append")
+def _append_role_name(user: User, role: "Role", initiator: Any) -> None:
+    """역할 추가 시 role_names를 함께 갱신합니다."""
+    names = list(user.role_names or [])
+    if role.name not in names:
+        names.append(role.name)
+        user.role_names = names
+    invalidate_user_permissions_on_commit(user)
+
+
+@event.listens_for(User.roles, "remove")
+def _remove_role_name(user: User, role: "Role", initiator: Any) -> None:
+    """역할 제거 시 role_names를 함께 갱신합니다."""
+    user.role_names = [name for name in (user.role_names or []) if name != role.name]
+    invalidate_user_permissions_on_commit(user)
+
+
 class Role(Base):
     """사용자 역할 모델"""
     __tablename__ = "roles"
     
-    id = Column(String, primary_key=True, index=True, comment="역할 고유 ID")
+    id = Column(PGUUID(as_uuid=True), primary_key=True, default=uuid4, comment="역할 고유 ID")
     name = Column(String, unique=True, index=True, nullable=False, comment="역할 이름 (예: admin, user, moderator)")
     description = Column(String, nullable=True, comment="역할 설명")
-    permissions = Column(JSON, default={}, comment="권한 목록 (JSON 형식)")
+    permissions = Column(JSON, default=dict, comment="권한 목록 (JSON 형식)")
     
     # 관계
-    users = relationship("User", secondary=user_roles, back_populates="roles", lazy="selectin")
+    users = relationship("User", secondary=user_roles, back_populates="roles", lazy="raise")
     
     def to_dict(self) -> Dict[str, Any]:
         """역할 정보를 딕셔너리로 변환합니다."""
@@ -110,15 +155,22 @@ class Role(Base):
         }
 
 
+@event.listens_for(Role.permissions, "set")
+@event.listens_for(Role.permissions, "modified")
+def _role_permissions_changed(role: Role, *args: Any) -> None:
+    """역할 권한 변경(대입 또는 flag_modified) 시 커밋 후 권한 캐시를 비웁니다."""
+    clear_permissions_on_commit(role)
+
+
 class RefreshToken(Base):
     """리프레시 토큰 모델"""
     __tablename__ = "refresh_tokens"
     
-    id = Column(String, primary_key=True, index=True, comment="토큰 고유 ID")
-    user_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True, comment="사용자 ID")
-    token = Column(String, unique=True, index=True, nullable=False, comment="리프레시 토큰")
+    id = Column(PGUUID(as_uuid=True), primary_key=True, default=uuid4, comment="토큰 고유 ID")
+    user_id = Column(PGUUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True, comment="사용자 ID")
+    token = Column(String, nullable=False, comment="리프레시 토큰")
     expires_at = Column(DateTime, nullable=False, comment="만료 일시")
-    created_at = Column(DateTime, default=datetime.utcnow, comment="생성 일시")
+    created_at = Column(DateTime, server_default=func.now(), comment="생성 일시")
     user_agent = Column(String, nullable=True, comment="사용자 에이전트")
     ip_address = Column(String, nullable=True, comment="IP 주소")
     is_revoked = Column(Boolean, default=False, comment="취소 여부")
@@ -126,6 +178,16 @@ class RefreshToken(Base):
     # 관계
     user = relationship("User", backref="refresh_tokens")
     
+    __table_args__ = (
+        # 유효한(취소되지 않은) 토큰만 고유성을 보장하고 인덱싱
+        Index(
+            'uq_refresh_tokens_active_token',
+            'token',
+            unique=True,
+            postgresql_where=text('NOT is_revoked'),
+        ),
+    )
+    
     def is_expired(self) -> bool:
         """토큰이 만료되었는지 확인합니다."""
         return datetime.utcnow() > self.expires_at
@@ -140,7 +202,7 @@ class RefreshToken(Base):
             "id": self.id,
             "user_id": self.user_id,
             "token": self.token,
-            "expires_at": self.expires_at.isoformat() if self.expires_at else None,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "expires_at": self.expires_at,
+            "created_at": self.created_at,
             "is_revoked": self.is_revoked,
         }
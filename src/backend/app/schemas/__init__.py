@@ -10,11 +10,18 @@ from .token import Token, TokenPayload, RefreshToken
 from .content import (
     Content, ContentCreate, ContentUpdate, ContentInDB, ContentResponse,
     Section, SectionCreate, SectionUpdate, SectionInDB, SectionResponse,
-    Course, CourseCreate, CourseUpdate, CourseInDB, CourseResponse,
     Category, CategoryCreate, CategoryUpdate, CategoryInDB, CategoryResponse,
     UserContentProgress, UserContentProgressCreate, UserContentProgressUpdate, UserContentProgressResponse
 )
 
+# 강의 관련 스키마 (강의 스키마는 course 모듈에만 정의)
+from .course import (
+    CourseLevel, Course, CourseCreate, CourseUpdate, CourseInDB, CourseWithLessons, CourseStats,
+    Lesson, LessonCreate, LessonUpdate, LessonInDB,
+    Enrollment, EnrollmentCreate, EnrollmentUpdate,
+    UserProgress, UserProgressCreate, UserProgressUpdate
+)
+
 # 퀴즈 관련 스키마
 from .quiz import (
     Quiz, QuizCreate, QuizUpdate, QuizResponse, QuizListResponse,
@@ -23,7 +30,7 @@ from .quiz import (
     QuizAttempt, QuizAttemptCreate, QuizAttemptResponse, QuizAttemptSubmit,
     QuestionAnswer, QuestionAnswerCreate, QuestionAnswerUpdate, QuestionAnswerResponse,
     UserQuizProgress, UserQuizProgressResponse,
-    QuizStatistics, QuizTakeResponse, QuizResultResponse,
+    QuestionStatistics, QuizStatistics, QuizTakeResponse, QuizResultResponse,
     QuestionType, QuizAttemptStatus
 )
 
@@ -38,10 +45,15 @@ __all__ = [
     # 콘텐츠
     'Content', 'ContentCreate', 'ContentUpdate', 'ContentInDB', 'ContentResponse',
     'Section', 'SectionCreate', 'SectionUpdate', 'SectionInDB', 'SectionResponse',
-    'Course', 'CourseCreate', 'CourseUpdate', 'CourseInDB', 'CourseResponse',
     'Category', 'CategoryCreate', 'CategoryUpdate', 'CategoryInDB', 'CategoryResponse',
     'UserContentProgress', 'UserContentProgressCreate', 'UserContentProgressUpdate', 'UserContentProgressResponse',
     
+    # 강의
+    'CourseLevel', 'Course', 'CourseCreate', 'CourseUpdate', 'CourseInDB', 'CourseWithLessons', 'CourseStats',
+    'Lesson', 'LessonCreate', 'LessonUpdate', 'LessonInDB',
+    'Enrollment', 'EnrollmentCreate', 'EnrollmentUpdate',
+    'UserProgress', 'UserProgressCreate', 'UserProgressUpdate',
+    
     # 퀴즈
     'Quiz', 'QuizCreate', 'QuizUpdate', 'QuizResponse', 'QuizListResponse',
     'Question', 'QuestionCreate', 'QuestionUpdate', 'QuestionResponse',
@@ -49,6 +61,20 @@ __all__ = [
     'QuizAttempt', 'QuizAttemptCreate', 'QuizAttemptResponse', 'QuizAttemptSubmit',
     'QuestionAnswer', 'QuestionAnswerCreate', 'QuestionAnswerUpdate', 'QuestionAnswerResponse',
     'UserQuizProgress', 'UserQuizProgressResponse',
-    'QuizStatistics', 'QuizTakeResponse', 'QuizResultResponse',
+    'QuestionStatistics', 'QuizStatistics', 'QuizTakeResponse', 'QuizResultResponse',
     'QuestionType', 'QuizAttemptStatus'
 ]
+
+from pydantic import BaseModel as _BaseModel  # noqa: E402
+
+
+def rebuild_schemas() -> None:
+    """공개 스키마를 모두 빌드합니다.
+
+    임포트 비용을 줄이기 위해 일부 스키마는 defer_build로 선언되어 있으므로,
+    앱 시작 시 이 함수를 호출해 첫 요청 전에 빌드를 끝냅니다.
+    """
+    for name in __all__:
+        schema = globals()[name]
+        if isinstance(schema, type) and issubclass(schema, _BaseModel):
+            schema.model_rebuild()
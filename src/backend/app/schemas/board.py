@@ -1,5 +1,5 @@
-from pydantic import BaseModel, Field
-from typing import Optional
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter
+from typing import List, Optional
 from datetime import datetime
 
 class BoardBase(BaseModel):
@@ -24,9 +24,11 @@ class BoardInDBBase(BoardBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class Board(BoardInDBBase):
     """응답용 게시판 스키마"""
     pass
+
+# 목록 전체를 한 번에 검증/직렬화하기 위한 어댑터 (임포트 시 한 번만 생성)
+BoardListAdapter = TypeAdapter(List[Board])
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from datetime import datetime
 
 class BookmarkBase(BaseModel):
@@ -15,8 +15,7 @@ class BookmarkInDBBase(BookmarkBase):
     user_id: str
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class BookmarkResponse(BookmarkInDBBase):
     """응답용 북마크 스키마"""
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter
 from typing import Optional, List
 from datetime import datetime
 from .user import UserResponse
@@ -25,20 +25,21 @@ class CommentInDBBase(CommentBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class Comment(CommentInDBBase):
-    """응답용 댓글 스키마"""
+    """응답용 댓글 스키마 (대댓글은 parent_id로 연결)"""
     author: Optional[UserResponse] = None
     like_count: int = 0
     is_liked: bool = False
-    replies: List["Comment"] = []
 
 class CommentListResponse(BaseModel):
-    """댓글 목록 응답 스키마"""
+    """댓글 목록 응답 스키마
+    
+    items는 트리가 아닌 평탄한 목록이며, 클라이언트가 parent_id로 트리를 구성합니다.
+    """
     total: int
     items: List[Comment]
 
-# 순환 참조 해결을 위한 업데이트
-Comment.update_forward_refs()
+# 목록 전체를 한 번에 검증/직렬화하기 위한 어댑터 (임포트 시 한 번만 생성)
+CommentListAdapter = TypeAdapter(List[Comment])
@@ -1,8 +1,10 @@
 from datetime import datetime
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field, HttpUrl, validator
+from uuid import UUID
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl, TypeAdapter, field_validator
 from enum import Enum
-from typing import Optional
+
+from .course import Course
 
 # Enums
 class ContentType(str, Enum):
@@ -18,6 +20,14 @@ class DifficultyLevel(str, Enum):
     ADVANCED = "advanced"
     EXPERT = "expert"
 
+# URL은 쓰기 경로에서만 검증하고 문자열 그대로 저장/응답
+_http_url = TypeAdapter(HttpUrl)
+
+def _check_url(v: Optional[str]) -> Optional[str]:
+    if v is not None:
+        _http_url.validate_python(v)
+    return v
+
 # Base schemas
 class ContentBase(BaseModel):
     title: str = Field(..., max_length=200)
@@ -25,20 +35,21 @@ class ContentBase(BaseModel):
     content_type: ContentType
     difficulty: DifficultyLevel = DifficultyLevel.BEGINNER
     duration: int = Field(0, ge=0, description="콘텐츠 재생/학습 시간(분)")
-    thumbnail_url: Optional[HttpUrl] = None
-    content_url: Optional[HttpUrl] = None
+    thumbnail_url: Optional[str] = None
+    content_url: Optional[str] = None
     is_published: bool = False
-    tags: List[str] = []
+    tags: List[str] = Field(default_factory=list)
     metadata_: Optional[Dict[str, Any]] = Field(default_factory=dict, alias="metadata")
     section_id: Optional[int] = None
 
-    class Config:
-        from_attributes = True
-        populate_by_name = True
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
 
 # Create / Update schemas
 class ContentCreate(ContentBase):
-    pass
+    @field_validator('thumbnail_url', 'content_url')
+    @classmethod
+    def check_urls(cls, v: Optional[str]) -> Optional[str]:
+        return _check_url(v)
 
 class ContentUpdate(BaseModel):
     title: Optional[str] = Field(None, max_length=200)
@@ -46,16 +57,19 @@ class ContentUpdate(BaseModel):
     content_type: Optional[ContentType] = None
     difficulty: Optional[DifficultyLevel] = None
     duration: Optional[int] = Field(None, ge=0)
-    thumbnail_url: Optional[HttpUrl] = None
-    content_url: Optional[HttpUrl] = None
+    thumbnail_url: Optional[str] = None
+    content_url: Optional[str] = None
     is_published: Optional[bool] = None
     tags: Optional[List[str]] = None
     metadata_: Optional[Dict[str, Any]] = Field(None, alias="metadata")
     section_id: Optional[int] = None
 
-    class Config:
-        from_attributes = True
-        populate_by_name = True
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+
+    @field_validator('thumbnail_url', 'content_url')
+    @classmethod
+    def check_urls(cls, v: Optional[str]) -> Optional[str]:
+        return _check_url(v)
 
 # Response schemas
 class ContentInDBBase(ContentBase):
@@ -64,11 +78,10 @@ class ContentInDBBase(ContentBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class Content(ContentInDBBase):
-    pass
+    model_config = ConfigDict(defer_build=True, frozen=True)
 
 class ContentInDB(ContentInDBBase):
     pass
@@ -78,7 +91,7 @@ class SectionBase(BaseModel):
     title: str = Field(..., max_length=200)
     description: Optional[str] = None
     order: int = 0
-    course_id: int
+    course_id: UUID
 
 class SectionCreate(SectionBase):
     pass
@@ -93,48 +106,12 @@ class SectionInDBBase(SectionBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class Section(SectionInDBBase):
-    contents: List[Content] = []
+    contents: List[Content] = Field(default_factory=list)
 
-# Course schemas
-class CourseBase(BaseModel):
-    title: str = Field(..., max_length=200)
-    subtitle: Optional[str] = Field(None, max_length=500)
-    description: Optional[str] = None
-    thumbnail_url: Optional[HttpUrl] = None
-    is_published: bool = False
-    price: int = Field(0, ge=0)
-    discount_price: Optional[int] = Field(None, ge=0)
-    instructor_id: int
-    category_ids: List[int] = []
-
-class CourseCreate(CourseBase):
-    pass
-
-class CourseUpdate(BaseModel):
-    title: Optional[str] = Field(None, max_length=200)
-    subtitle: Optional[str] = Field(None, max_length=500)
-    description: Optional[str] = None
-    thumbnail_url: Optional[HttpUrl] = None
-    is_published: Optional[bool] = None
-    price: Optional[int] = Field(None, ge=0)
-    discount_price: Optional[int] = Field(None, ge=0)
-    category_ids: Optional[List[int]] = None
-
-class CourseInDBBase(CourseBase):
-    id: int
-    created_at: datetime
-    updated_at: datetime
-
-    class Config:
-        from_attributes = True
-
-class Course(CourseInDBBase):
-    sections: List[Section] = []
-    categories: List["Category"] = []
+    model_config = ConfigDict(frozen=True)
 
 # Category schemas
 class CategoryBase(BaseModel):
@@ -155,12 +132,13 @@ class CategoryInDBBase(CategoryBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class Category(CategoryInDBBase):
-    children: List["Category"] = []
-    courses: List[Course] = []
+    children: List["Category"] = Field(default_factory=list)
+    courses: List[Course] = Field(default_factory=list)
+
+    model_config = ConfigDict(defer_build=True, frozen=True)
 
 # User progress schemas
 class UserContentProgressBase(BaseModel):
@@ -186,13 +164,7 @@ class UserContentProgressInDBBase(UserContentProgressBase):
     completed_at: Optional[datetime] = None
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class UserContentProgress(UserContentProgressInDBBase):
     content: Content
-
-# Update forward refs for nested models
-Content.model_rebuild()
-Course.model_rebuild()
-Category.model_rebuild()
@@ -4,9 +4,11 @@
 from datetime import datetime
 from typing import List, Optional, Union
 from uuid import UUID
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field
 from enum import Enum
 
+from .examples import add_example
+
 
 class CourseLevel(str, Enum):
     """강의 난이도"""
@@ -27,17 +29,7 @@ class CourseBase(BaseModel):
     thumbnail_url: Optional[str] = Field(None, description="썸네일 이미지 URL")
     is_published: bool = Field(False, description="공개 여부")
 
-    class Config:
-        schema_extra = {
-            "example": {
-                "title": "파이썬으로 배우는 웹 개발",
-                "description": "초보자를 위한 웹 개발 강의입니다.",
-                "price": 59000,
-                "level": "beginner",
-                "thumbnail_url": "https://example.com/thumbnail.jpg",
-                "is_published": True
-            }
-        }
+    model_config = ConfigDict(json_schema_extra=add_example)
 
 
 class CourseCreate(CourseBase):
@@ -54,16 +46,7 @@ class CourseUpdate(BaseModel):
     thumbnail_url: Optional[str] = Field(None, description="썸네일 이미지 URL")
     is_published: Optional[bool] = Field(None, description="공개 여부")
 
-    class Config:
-        schema_extra = {
-            "example": {
-                "title": "파이썬으로 배우는 웹 개발 (개정판)",
-                "description": "초보자를 위한 웹 개발 강의입니다. 업데이트된 내용이 반영되었습니다.",
-                "price": 69000,
-                "level": "intermediate",
-                "is_published": True
-            }
-        }
+    model_config = ConfigDict(json_schema_extra=add_example)
 
 
 class CourseInDBBase(CourseBase):
@@ -74,13 +57,12 @@ class CourseInDBBase(CourseBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class Course(CourseInDBBase):
     """응답용 강의 스키마"""
-    pass
+    model_config = ConfigDict(frozen=True)
 
 
 class CourseInDB(CourseInDBBase):
@@ -97,17 +79,7 @@ class LessonBase(BaseModel):
     order: int = Field(0, ge=0, description="강의 내 순서")
     is_preview: bool = Field(False, description="미리보기 가능 여부")
 
-    class Config:
-        schema_extra = {
-            "example": {
-                "title": "파이썬 기초 문법",
-                "description": "파이썬의 기본 문법을 배웁니다.",
-                "video_url": "https://example.com/videos/1",
-                "duration": 1200,
-                "order": 1,
-                "is_preview": True
-            }
-        }
+    model_config = ConfigDict(json_schema_extra=add_example)
 
 
 class LessonCreate(LessonBase):
@@ -132,13 +104,12 @@ class LessonInDBBase(LessonBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class Lesson(LessonInDBBase):
     """응답용 수업 스키마"""
-    pass
+    model_config = ConfigDict(frozen=True)
 
 
 class LessonInDB(LessonInDBBase):
@@ -148,7 +119,7 @@ class LessonInDB(LessonInDBBase):
 
 class CourseWithLessons(Course):
     """수업 목록이 포함된 강의 스키마"""
-    lessons: List[Lesson] = []
+    lessons: List[Lesson] = Field(default_factory=list)
 
 
 class EnrollmentBase(BaseModel):
@@ -175,13 +146,12 @@ class EnrollmentInDBBase(EnrollmentBase):
     enrolled_at: datetime
     completed_at: Optional[datetime] = None
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class Enrollment(EnrollmentInDBBase):
     """응답용 수강 신청 스키마"""
-    pass
+    model_config = ConfigDict(frozen=True)
 
 
 class UserProgressBase(BaseModel):
@@ -210,13 +180,12 @@ class UserProgressInDBBase(UserProgressBase):
     last_accessed: datetime
     completed_at: Optional[datetime] = None
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UserProgress(UserProgressInDBBase):
     """응답용 학습 진행 상황 스키마"""
-    pass
+    model_config = ConfigDict(frozen=True)
 
 
 class CourseStats(BaseModel):
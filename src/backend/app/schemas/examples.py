@@ -0,0 +1,28 @@
+"""
+OpenAPI 문서용 스키마 예시를 제공합니다.
+
+예시 데이터는 examples.json에 모아 두고, JSON 스키마를 생성할 때(/docs,
+/openapi.json) 처음 한 번만 읽습니다.
+"""
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Type
+
+_EXAMPLES_PATH = Path(__file__).with_name("examples.json")
+
+
+@lru_cache(maxsize=None)
+def _get_examples() -> Dict[str, Dict[str, Any]]:
+    with _EXAMPLES_PATH.open(encoding="utf-8") as f:
+        return json.load(f)
+
+
+def add_example(schema: Dict[str, Any], model_cls: Type[Any]) -> None:
+    """json_schema_extra 훅: 클래스(또는 가장 가까운 상위 클래스)의 예시를 추가합니다."""
+    examples = _get_examples()
+    for klass in model_cls.__mro__:
+        example = examples.get(klass.__name__)
+        if example is not None:
+            schema["example"] = example
+            return
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, Field, HttpUrl, TypeAdapter
 from typing import Optional, List
 from datetime import datetime
 from enum import Enum
@@ -46,6 +46,9 @@ class PostListResponse(BaseModel):
     total: int
     items: List[Post]
 
+# 게시글 목록 검증/직렬화용 어댑터 (모듈 로드 시 한 번만 생성)
+PostListAdapter = TypeAdapter(List[Post])
+
 class PostSortBy(str, Enum):
     """게시글 정렬 기준"""
     LATEST = "latest"
@@ -1,6 +1,6 @@
 from typing import List, Optional, Dict, Any, Union
 from datetime import datetime
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field
 from enum import Enum
 
 # Enums
@@ -22,8 +22,7 @@ class ChoiceBase(BaseModel):
     is_correct: bool = False
     order_num: int = 0
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 class QuestionBase(BaseModel):
     question_text: str
@@ -31,10 +30,9 @@ class QuestionBase(BaseModel):
     points: int = 1
     order_num: int = 0
     explanation: Optional[str] = None
-    choices: Optional[List[ChoiceBase]] = []
+    choices: Optional[List[ChoiceBase]] = Field(default_factory=list)
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 class QuizBase(BaseModel):
     title: str
@@ -50,10 +48,10 @@ class ChoiceCreate(ChoiceBase):
     pass
 
 class QuestionCreate(QuestionBase):
-    choices: Optional[List[ChoiceBase]] = []
+    choices: Optional[List[ChoiceBase]] = Field(default_factory=list)
 
 class QuizCreate(QuizBase):
-    questions: List[QuestionCreate] = []
+    questions: List[QuestionCreate] = Field(default_factory=list)
 
 class QuizAttemptCreate(BaseModel):
     quiz_id: int
@@ -71,7 +69,7 @@ class ChoiceUpdate(ChoiceBase):
 
 class QuestionUpdate(QuestionBase):
     id: Optional[int] = None
-    choices: Optional[List[ChoiceUpdate]] = []
+    choices: Optional[List[ChoiceUpdate]] = Field(default_factory=list)
 
 class QuizUpdate(QuizBase):
     title: Optional[str] = None
@@ -81,7 +79,7 @@ class QuizUpdate(QuizBase):
     max_attempts: Optional[int] = None
     passing_score: Optional[int] = None
     is_published: Optional[bool] = None
-    questions: Optional[List[QuestionUpdate]] = []
+    questions: Optional[List[QuestionUpdate]] = Field(default_factory=list)
 
 class QuestionAnswerUpdate(BaseModel):
     id: int
@@ -96,24 +94,21 @@ class QuizGrading(BaseModel):
 class ChoiceResponse(ChoiceBase):
     id: int
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 class QuestionResponse(QuestionBase):
     id: int
-    choices: List[ChoiceResponse] = []
+    choices: List[ChoiceResponse] = Field(default_factory=list)
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 class QuizResponse(QuizBase):
     id: int
     created_at: datetime
     updated_at: Optional[datetime] = None
-    questions: List[QuestionResponse] = []
+    questions: List[QuestionResponse] = Field(default_factory=list)
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 class QuestionAnswerResponse(BaseModel):
     id: int
@@ -125,8 +120,7 @@ class QuestionAnswerResponse(BaseModel):
     graded_at: Optional[datetime] = None
     created_at: datetime
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 class QuizAttemptResponse(BaseModel):
     id: int
@@ -139,10 +133,9 @@ class QuizAttemptResponse(BaseModel):
     score: int
     passed: bool
     status: str
-    answers: List[QuestionAnswerResponse] = []
+    answers: List[QuestionAnswerResponse] = Field(default_factory=list)
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 class UserQuizProgressResponse(BaseModel):
     quiz_id: int
@@ -151,15 +144,22 @@ class UserQuizProgressResponse(BaseModel):
     passed: bool
     last_attempt_at: Optional[datetime] = None
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 # Statistics
+class QuestionStatistics(BaseModel):
+    question_text: str
+    question_type: QuestionType
+    total_answers: int = 0
+    correct_answers: int = 0
+    average_score: float = 0.0
+    answer_distribution: Dict[str, int] = Field(default_factory=dict)
+
 class QuizStatistics(BaseModel):
     total_attempts: int
     average_score: float
     pass_rate: float
-    question_stats: Dict[int, Dict[str, Any]] = {}
+    question_stats: Dict[int, QuestionStatistics] = Field(default_factory=dict)
 
 # For listing
 class QuizListResponse(QuizBase):
@@ -168,8 +168,7 @@ class QuizListResponse(QuizBase):
     question_count: int
     user_progress: Optional[UserQuizProgressResponse] = None
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 # For taking a quiz
 class QuizTakeResponse(QuizResponse):
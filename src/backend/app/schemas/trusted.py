@@ -0,0 +1,73 @@
+"""
+신뢰할 수 있는 ORM 객체를 응답 스키마로 변환하는 헬퍼입니다.
+
+DB에서 읽은 행은 이미 스키마 제약을 만족하므로, 읽기 경로에서는 필드별
+검증 없이 model_construct()로 스키마 인스턴스를 만듭니다.
+사용자 입력(*Create, *Update)에는 사용하지 마세요.
+"""
+from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar, Union, get_args, get_origin
+
+from pydantic import BaseModel
+
+ModelType = TypeVar("ModelType", bound=BaseModel)
+
+# 스키마별 필드 변환 계획 캐시: (필드명, 중첩 스키마, 목록 여부)
+_FieldPlan = List[Tuple[str, Optional[Type[BaseModel]], bool]]
+_plans: Dict[Type[BaseModel], _FieldPlan] = {}
+
+
+def _nested_model(annotation: Any) -> Tuple[Optional[Type[BaseModel]], bool]:
+    """필드 타입에서 중첩 스키마와 목록 여부를 추출합니다."""
+    origin = get_origin(annotation)
+    if origin is Union:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return _nested_model(args[0])
+        return None, False
+    if origin in (list, List):
+        args = get_args(annotation)
+        if args and isinstance(args[0], type) and issubclass(args[0], BaseModel):
+            return args[0], True
+        return None, False
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation, False
+    return None, False
+
+
+def _field_plan(model_cls: Type[BaseModel]) -> _FieldPlan:
+    plan = _plans.get(model_cls)
+    if plan is None:
+        plan = [
+            (name, *_nested_model(field.annotation))
+            for name, field in model_cls.model_fields.items()
+        ]
+        _plans[model_cls] = plan
+    return plan
+
+
+def build_trusted(model_cls: Type[ModelType], obj: Any) -> ModelType:
+    """ORM 객체로부터 검증 없이 스키마 인스턴스를 생성합니다.
+
+    중첩 스키마와 스키마 목록(예: QuizResponse.questions → choices)도
+    재귀적으로 변환합니다. ORM 객체에 없는 필드는 스키마 기본값을 사용합니다.
+    """
+    values: Dict[str, Any] = {}
+    for name, nested, is_list in _field_plan(model_cls):
+        if not hasattr(obj, name):
+            continue
+        value = getattr(obj, name)
+        if nested is not None and value is not None:
+            if is_list:
+                value = [build_trusted(nested, item) for item in value]
+            else:
+                value = build_trusted(nested, value)
+        values[name] = value
+    return model_cls.model_construct(**values)
+
+
+def dump_trusted(model_cls: Type[BaseModel], obj: Any) -> Dict[str, Any]:
+    """ORM 객체를 검증 없이 응답용 딕셔너리로 변환합니다.
+
+    ORM 값(str, Enum 값 등)이 스키마 타입과 다를 수 있으므로 직렬화 경고는 끕니다.
+    """
+    return build_trusted(model_cls, obj).model_dump(by_alias=True, warnings=False)
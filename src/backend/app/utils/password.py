@@ -1,73 +1,57 @@
 """
 Password hashing and verification utilities.
 """
-from typing import Optional, Tuple, Union
+import bcrypt
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
 
-from passlib.context import CryptContext
+# 모듈 전역 Argon2 해셔 (솔트는 해시 문자열에 포함됨)
+_hasher = PasswordHasher(
+    time_cost=3,  # 조정 가능 (시간 복잡도, 높을수록 안전하지만 느려짐)
+    memory_cost=65536,  # 64MB (메모리 사용량, 높을수록 안전하지만 메모리 사용량 증가)
+    parallelism=4,  # 병렬 처리 수
+    hash_len=32,  # 해시 길이 (바이트)
+)
 
-# 비밀번호 해싱을 위한 컨텍스트 - Argon2 권장 (설치 필요: pip install argon2-cffi)
-try:
-    pwd_context = CryptContext(
-        schemes=["argon2", "bcrypt"],
-        deprecated="auto",
-        argon2__time_cost=3,  # 조정 가능 (시간 복잡도, 높을수록 안전하지만 느려짐)
-        argon2__memory_cost=65536,  # 64MB (메모리 사용량, 높을수록 안전하지만 메모리 사용량 증가)
-        argon2__parallelism=4,  # 병렬 처리 수
-        argon2__hash_len=32,  # 해시 길이 (바이트)
-    )
-except Exception as e:
-    import logging
-    logger = logging.getLogger(__name__)
-    logger.warning(f"Argon2를 사용할 수 없어 bcrypt로 대체합니다: {e}")
-    pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# 이전(passlib) 버전에서 생성된 bcrypt 해시 접두사
+_BCRYPT_PREFIXES = ("$2a$", "$2b$", "$2y$")
 
-def get_password_hash(password: str, salt: Optional[str] = None) -> Union[str, Tuple[str, str]]:
-    """비밀번호를 해시합니다.
+
+def get_password_hash(password: str) -> str:
+    """비밀번호를 Argon2로 해시합니다.
 
     Args:
         password: 해시할 평문 비밀번호
-        salt: 사용할 솔트 (None이면 새로 생성)
 
     Returns:
-        str: salt가 None인 경우 해시된 비밀번호
-        Tuple[str, str]: salt가 주어진 경우 (해시된 비밀번호, 사용된 솔트)
+        str: 해시된 비밀번호
     """
-    if salt is None:
-        # salt 없이 단순 해시 (기본 사용)
-        return pwd_context.hash(password)
-    
-    # salt와 함께 해시 (레거시 호환용)
-    to_hash = f"{password}:{salt}"
-    hashed = pwd_context.hash(to_hash)
-    return hashed, salt
+    return _hasher.hash(password)
+
 
-def verify_password(plain_password: str, hashed_password: str, salt: Optional[str] = None) -> bool:
+def verify_password(plain_password: str, hashed_password: str) -> bool:
     """평문 비밀번호와 해시된 비밀번호가 일치하는지 확인합니다.
 
+    bcrypt 해시는 접두사로 구분하여 레거시 호환용으로만 검증합니다.
+
     Args:
         plain_password: 검증할 평문 비밀번호
         hashed_password: 저장된 해시된 비밀번호
-        salt: 비밀번호에 사용된 솔트 (선택사항, 레거시 호환용)
 
     Returns:
         bool: 비밀번호가 일치하면 True, 아니면 False
     """
-    if not all([plain_password, hashed_password]):
+    if not plain_password or not hashed_password:
         return False
-    
-    try:
-        # 저장된 해시 형식이 유효한지 확인
-        if not pwd_context.identify(hashed_password):
+
+    if hashed_password.startswith(_BCRYPT_PREFIXES):
+        try:
+            # bcrypt는 72바이트까지만 사용 (passlib과 동일하게 잘라서 검증)
+            return bcrypt.checkpw(plain_password.encode()[:72], hashed_password.encode())
+        except ValueError:
             return False
-            
-        # 비밀번호 검증
-        if salt:
-            to_verify = f"{plain_password}:{salt}"
-            is_valid = pwd_context.verify(to_verify, hashed_password)
-        else:
-            is_valid = pwd_context.verify(plain_password, hashed_password)
-        
-        return is_valid
-        
-    except Exception:
+
+    try:
+        return _hasher.verify(hashed_password, plain_password)
+    except (VerificationError, InvalidHashError):
         return False
@@ -1,4 +1,5 @@
 """Check if the test configuration is working correctly."""
+import logging
 import sys
 from pathlib import Path
 
@@ -6,20 +7,22 @@ from pathlib import Path
 project_root = Path(__file__).parent
 sys.path.append(str(project_root))
 
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger(__name__)
+
 try:
     from app.core.test_settings import test_settings
     
-    # Print settings for verification
-    print("Test configuration loaded successfully!")
-    print("=" * 40)
-    print(f"ENV: {test_settings.ENV}")
-    print(f"DEBUG: {test_settings.DEBUG}")
-    print(f"TESTING: {test_settings.TESTING}")
-    print(f"SQLALCHEMY_DATABASE_URI: {test_settings.SQLALCHEMY_DATABASE_URI}")
-    print(f"SUPABASE_URL: {test_settings.SUPABASE_URL}")
-    print(f"SECRET_KEY: {'*' * len(test_settings.SECRET_KEY) if test_settings.SECRET_KEY else 'Not set'}")
+    # Log settings for verification
+    logger.info("Test configuration loaded successfully!")
+    logger.info("=" * 40)
+    logger.info("ENV: %s", test_settings.ENV)
+    logger.info("DEBUG: %s", test_settings.DEBUG)
+    logger.info("TESTING: %s", test_settings.TESTING)
+    logger.info("SQLALCHEMY_DATABASE_URI: %s", test_settings.SQLALCHEMY_DATABASE_URI)
+    logger.info("SUPABASE_URL: %s", test_settings.SUPABASE_URL)
+    logger.info("SECRET_KEY: %s", '*' * len(test_settings.SECRET_KEY) if test_settings.SECRET_KEY else 'Not set')
     
 except Exception as e:
-    print(f"Error loading test configuration: {e}", file=sys.stderr)
+    logger.error("Error loading test configuration: %s", e)
     raise  # Re-raise the exception to see the full traceback
-    sys.exit(1)
@@ -1,18 +1,26 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Boolean
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Boolean, Index
+from sqlalchemy.orm import relationship, selectinload, joinedload, raiseload, defer
 from sqlalchemy.sql import func
 from database import Base
+from models.course import Course
+from models.user import User
 from typing import Optional
 from datetime import datetime
 from pydantic import BaseModel
 
 class Post(Base):
     __tablename__ = "posts"
+    __table_args__ = (
+        # 강의별 게시판 목록 (고정글 우선, 최신순)
+        Index('ix_posts_course_pinned_created', 'course_id', 'is_pinned', 'created_at'),
+        # 사용자별 작성글 목록
+        Index('ix_posts_user_created', 'user_id', 'created_at'),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"))
     course_id = Column(Integer, ForeignKey("courses.id"), nullable=True)
-    title = Column(String)
+    title = Column(String(300), nullable=False)
     content = Column(Text)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
@@ -20,10 +28,27 @@ class Post(Base):
     is_pinned = Column(Boolean, default=False)
 
     # Relationships
-    user = relationship("User")
-    course = relationship("Course")
-    comments = relationship("Comment", back_populates="post", cascade="all, delete-orphan")
-    likes = relationship("PostLike", back_populates="post", cascade="all, delete-orphan")
+    # 로딩 전략: 목록에 항상 표시되는 작성자는 joined, 댓글은 selectin(IN 쿼리 1회),
+    # 강의/좋아요는 목록에서 쓰지 않으므로 select(접근 시 로드)
+    user = relationship(User, lazy="joined")
+    course = relationship(Course, lazy="select")
+    comments = relationship("Comment", back_populates="post", cascade="all, delete-orphan", lazy="selectin")
+    likes = relationship("PostLike", back_populates="post", cascade="all, delete-orphan", lazy="select")
+
+    @classmethod
+    def list_options(cls):
+        """목록 조회용 로더 옵션. 지정하지 않은 관계에 접근하면 N+1 대신 예외가 발생합니다.
+
+        목록에 표시하지 않는 본문(content)은 읽지 않습니다.
+        사용 예: select(Post).options(*Post.list_options())
+        """
+        return [
+            defer(cls.content),
+            selectinload(cls.comments),
+            selectinload(cls.likes),
+            joinedload(cls.user),
+            raiseload('*'),
+        ]
 
 class Comment(Base):
     __tablename__ = "comments"
@@ -37,14 +62,19 @@ class Comment(Base):
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
     # Relationships
-    post = relationship("Post", back_populates="comments")
-    user = relationship("User")
-    parent = relationship("Comment", remote_side=[id], back_populates="replies")
-    replies = relationship("Comment", back_populates="parent")
-    likes = relationship("CommentLike", back_populates="comment", cascade="all, delete-orphan")
+    # post/parent는 보통 세션에 이미 로드되어 있어 select로도 추가 쿼리가 없음
+    post = relationship("Post", back_populates="comments", lazy="select")
+    user = relationship(User, lazy="joined")
+    parent = relationship("Comment", remote_side=[id], back_populates="replies", lazy="select")
+    replies = relationship("Comment", back_populates="parent", lazy="selectin")
+    likes = relationship("CommentLike", back_populates="comment", cascade="all, delete-orphan", lazy="select")
 
 class PostLike(Base):
     __tablename__ = "post_likes"
+    __table_args__ = (
+        Index('ix_post_likes_created_brin', 'created_at',
+              postgresql_using='brin', postgresql_with={'pages_per_range': 32}),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     post_id = Column(Integer, ForeignKey("posts.id"))
@@ -52,11 +82,15 @@ class PostLike(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
-    post = relationship("Post", back_populates="likes")
-    user = relationship("User")
+    post = relationship("Post", back_populates="likes", lazy="select")
+    user = relationship(User, lazy="joined")
 
 class CommentLike(Base):
     __tablename__ = "comment_likes"
+    __table_args__ = (
+        Index('ix_comment_likes_created_brin', 'created_at',
+              postgresql_using='brin', postgresql_with={'pages_per_range': 32}),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     comment_id = Column(Integer, ForeignKey("comments.id"))
@@ -64,8 +98,8 @@ class CommentLike(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
-    comment = relationship("Comment", back_populates="likes")
-    user = relationship("User")
+    comment = relationship("Comment", back_populates="likes", lazy="select")
+    user = relationship(User, lazy="joined")
 
 class Tag(Base):
     __tablename__ = "tags"
@@ -75,7 +109,7 @@ class Tag(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
-    posts = relationship("PostTag", back_populates="tag")
+    posts = relationship("PostTag", back_populates="tag", lazy="select")
 
 class PostTag(Base):
     __tablename__ = "post_tags"
@@ -85,5 +119,5 @@ class PostTag(Base):
     tag_id = Column(Integer, ForeignKey("tags.id"))
 
     # Relationships
-    post = relationship("Post")
-    tag = relationship("Tag", back_populates="posts")
+    post = relationship("Post", lazy="select")
+    tag = relationship("Tag", back_populates="posts", lazy="joined")
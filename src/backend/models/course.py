@@ -1,8 +1,8 @@
 from sqlalchemy import (
     Column, Integer, String, DateTime, ForeignKey, 
-    Boolean, Float, UniqueConstraint, Text, Index
+    Boolean, Float, UniqueConstraint, Text, Index, DDL, event
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, selectinload, joinedload, raiseload
 from sqlalchemy.sql import func
 from database import Base
 
@@ -11,9 +11,10 @@ class Course(Base):
     """강의를 나타내는 모델입니다."""
     __tablename__ = "courses"
     __table_args__ = (
-        Index('ix_courses_creator_id', 'creator_id'),
-        Index('ix_courses_is_published', 'is_published'),
-        Index('ix_courses_created_at', 'created_at'),
+        # 공개 강의 최신순 목록
+        Index('ix_courses_published_created', 'is_published', 'created_at'),
+        # 생성자별 강의 목록 (creator_id 단독 조회도 이 인덱스로 처리)
+        Index('ix_courses_creator_published', 'creator_id', 'is_published'),
         {'sqlite_autoincrement': True},
     )
 
@@ -50,8 +51,7 @@ class Course(Base):
         Integer,
         ForeignKey("users.id", ondelete='CASCADE'),
         nullable=False,
-        comment='생성자 ID',
-        index=True
+        comment='생성자 ID'
     )
     difficulty = Column(
         String(20),
@@ -115,23 +115,40 @@ class Course(Base):
     )
 
     # Relationships
-    creator = relationship("User", back_populates="courses")
+    # 로딩 전략: 목록에 항상 표시되는 생성자는 joined, 섹션은 selectin,
+    # 건수가 많은 수강/리뷰는 select(필요할 때 별도 쿼리로 로드)
+    creator = relationship("User", back_populates="courses", lazy="joined")
     sections = relationship(
         "CourseSection",
         back_populates="course",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        lazy="selectin"
     )
     enrollments = relationship(
         "Enrollment",
         back_populates="course",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        lazy="select"
     )
     reviews = relationship(
         "CourseReview",
         back_populates="course",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        lazy="select"
     )
 
+    @classmethod
+    def list_options(cls):
+        """
+        강의 목록 조회용 로더 옵션을 반환합니다.
+        생성자와 섹션만 함께 로드하고, 그 외 관계에 접근하면 예외가 발생합니다.
+        """
+        return [
+            joinedload(cls.creator),
+            selectinload(cls.sections),
+            raiseload('*'),
+        ]
+
 
 class CourseSection(Base):
     """강의의 섹션을 나타내는 모델입니다."""
@@ -194,11 +211,12 @@ class CourseSection(Base):
     )
 
     # Relationships
-    course = relationship("Course", back_populates="sections")
+    course = relationship("Course", back_populates="sections", lazy="select")
     lessons = relationship(
         "Lesson",
         back_populates="section",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        lazy="selectin"
     )
 
 
@@ -285,11 +303,12 @@ class Lesson(Base):
     )
 
     # Relationships
-    section = relationship("CourseSection", back_populates="lessons")
+    section = relationship("CourseSection", back_populates="lessons", lazy="select")
     completions = relationship(
         "LessonCompletion",
         back_populates="lesson",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        lazy="select"
     )
 
 
@@ -301,6 +320,12 @@ class Enrollment(Base):
             'user_id', 'course_id',
             name='_user_course_enrollment_uc'
         ),
+        # 신청 순서대로만 추가되므로 B-tree 대신 BRIN
+        Index(
+            'ix_enrollments_enrolled_brin', 'enrolled_at',
+            postgresql_using='brin',
+            postgresql_with={'pages_per_range': 32}
+        ),
         {'sqlite_autoincrement': True},
     )
 
@@ -368,12 +393,14 @@ class Enrollment(Base):
     )
 
     # Relationships
-    user = relationship("User", back_populates="enrollments")
-    course = relationship("Course", back_populates="enrollments")
+    # 수강 목록은 사용자 기준으로 조회하므로 강의를 joined로 함께 로드
+    user = relationship("User", back_populates="enrollments", lazy="select")
+    course = relationship("Course", back_populates="enrollments", lazy="joined")
     lesson_completions = relationship(
         "LessonCompletion",
         back_populates="enrollment",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        lazy="select"
     )
 
 
@@ -385,6 +412,11 @@ class CourseReview(Base):
             'user_id', 'course_id',
             name='_user_course_review_uc'
         ),
+        Index(
+            'ix_course_reviews_created_brin', 'created_at',
+            postgresql_using='brin',
+            postgresql_with={'pages_per_range': 32}
+        ),
         {'sqlite_autoincrement': True},
     )
 
@@ -444,8 +476,47 @@ class CourseReview(Base):
     )
 
     # Relationships
-    user = relationship("User", back_populates="reviews")
-    course = relationship("Course", back_populates="reviews")
+    user = relationship("User", back_populates="reviews", lazy="joined")
+    course = relationship("Course", back_populates="reviews", lazy="select")
+
+
+# 리뷰 변경 시 courses.rating / num_reviews를 DB에서 증분 갱신 (PostgreSQL 전용)
+# 애플리케이션에서 조회-계산-갱신을 하지 않으므로 동시 리뷰 작성 시에도 값이 어긋나지 않음
+_course_review_stats_function = DDL("""
+CREATE OR REPLACE FUNCTION update_course_review_stats() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('DELETE', 'UPDATE') THEN
+        UPDATE courses
+        SET rating = CASE WHEN num_reviews <= 1 THEN 0
+                          ELSE (rating * num_reviews - OLD.rating) / (num_reviews - 1) END,
+            num_reviews = GREATEST(num_reviews - 1, 0)
+        WHERE id = OLD.course_id;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        UPDATE courses
+        SET rating = (rating * num_reviews + NEW.rating) / (num_reviews + 1),
+            num_reviews = num_reviews + 1
+        WHERE id = NEW.course_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+""")
+
+_course_review_stats_trigger = DDL("""
+CREATE TRIGGER trg_course_reviews_stats
+AFTER INSERT OR DELETE OR UPDATE OF rating, course_id ON course_reviews
+FOR EACH ROW EXECUTE FUNCTION update_course_review_stats()
+""")
+
+event.listen(
+    CourseReview.__table__, 'after_create',
+    _course_review_stats_function.execute_if(dialect='postgresql')
+)
+event.listen(
+    CourseReview.__table__, 'after_create',
+    _course_review_stats_trigger.execute_if(dialect='postgresql')
+)
 
 
 class LessonCompletion(Base):
@@ -511,5 +582,5 @@ class LessonCompletion(Base):
     )
 
     # Relationships
-    enrollment = relationship("Enrollment", back_populates="lesson_completions")
-    lesson = relationship("Lesson", back_populates="completions")
+    enrollment = relationship("Enrollment", back_populates="lesson_completions", lazy="select")
+    lesson = relationship("Lesson", back_populates="completions", lazy="joined")
@@ -1,13 +1,22 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Boolean, Text, Enum, Table, JSON, Index
-from sqlalchemy.orm import relationship, validates
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Boolean, Text, Enum, Table, JSON, Index, text, insert, select
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import relationship, validates, selectinload, raiseload, Session
 from sqlalchemy.sql import func
 from database import Base
 from typing import Optional, List, Dict, Any
 from datetime import datetime, date
-from pydantic import BaseModel, EmailStr, Field, validator, HttpUrl
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl, field_validator, model_validator
 import re
 from enum import Enum as PyEnum
 
+# PostgreSQL에서는 파싱된 바이너리 형태로 저장되는 JSONB 사용 (그 외 DB는 JSON)
+JSONType = JSON().with_variant(JSONB(), 'postgresql')
+
+# 검증용 정규식 (모듈 로드 시 한 번만 컴파일)
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_USERNAME_RE = re.compile(r'^[a-zA-Z0-9_]{3,50}$')
+_PHONE_RE = re.compile(r'^\+?[0-9\s-]{10,20}$')
+
 # 사용자 역할 정의
 class UserRole(str, PyEnum):
     ADMIN = "admin"
@@ -34,13 +43,13 @@ class Role(Base):
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(50), unique=True, nullable=False, index=True)
     description = Column(Text, nullable=True)
-    is_default = Column(Boolean, default=False, index=True)
+    is_default = Column(Boolean, default=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
-    # 관계
-    permissions = relationship("Permission", secondary="role_permissions", back_populates="roles")
-    users = relationship("User", secondary=user_roles, back_populates="roles")
+    # 관계 (권한 목록은 역할과 함께 쓰이므로 selectin, 역할별 사용자는 필요할 때만 로드)
+    permissions = relationship("Permission", secondary="role_permissions", back_populates="roles", lazy="selectin")
+    users = relationship("User", secondary=user_roles, back_populates="roles", lazy="select")
 
 # 권한 모델
 class Permission(Base):
@@ -52,7 +61,7 @@ class Permission(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
     # 관계
-    roles = relationship("Role", secondary="role_permissions", back_populates="permissions")
+    roles = relationship("Role", secondary="role_permissions", back_populates="permissions", lazy="select")
 
 # 역할-권한 매핑 테이블 (다대다 관계용)
 role_permissions = Table(
@@ -69,10 +78,10 @@ role_permissions = Table(
 class User(Base):
     __tablename__ = "users"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     auth_id = Column(String(255), unique=True, index=True)  # Supabase auth id
     email = Column(String(255), unique=True, index=True, nullable=False)
-    email_verified = Column(Boolean, default=False, index=True)
+    email_verified = Column(Boolean, default=False)
     email_verified_at = Column(DateTime(timezone=True), nullable=True)
     password_hash = Column(String(255), nullable=True)  # OAuth 사용자는 null 가능
     password_reset_token = Column(String(255), unique=True, index=True, nullable=True)
@@ -85,16 +94,16 @@ class User(Base):
     avatar_url = Column(String(500), nullable=True)
     bio = Column(Text, nullable=True)
     phone_number = Column(String(20), nullable=True, index=True)
-    phone_verified = Column(Boolean, default=False, index=True)
+    phone_verified = Column(Boolean, default=False)
     date_of_birth = Column(DateTime(timezone=True), nullable=True, index=True)
-    gender = Column(String(20), nullable=True, index=True)
+    gender = Column(String(20), nullable=True)
     country = Column(String(100), nullable=True, index=True)
     timezone = Column(String(50), nullable=True, default="Asia/Seoul")
     preferred_language = Column(String(10), nullable=True, default="ko")
     
     # 계정 상태
-    is_active = Column(Boolean, default=True, index=True)
-    is_superuser = Column(Boolean, default=False, index=True)
+    is_active = Column(Boolean, default=True)
+    is_superuser = Column(Boolean, default=False)
     is_email_public = Column(Boolean, default=False)
     is_phone_public = Column(Boolean, default=False)
     is_profile_public = Column(Boolean, default=True)
@@ -107,45 +116,52 @@ class User(Base):
     account_locked_until = Column(DateTime(timezone=True), nullable=True)
     
     # 메타데이터
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     deleted_at = Column(DateTime(timezone=True), nullable=True, index=True)
     
     # 소셜 미디어 링크 (JSON 형식으로 저장)
-    social_links = Column(JSON, nullable=True, default=dict)
+    social_links = Column(JSONType, nullable=True, default=dict)
     
     # 관계
-    enrollments = relationship("Enrollment", back_populates="user", cascade="all, delete-orphan")
-    courses = relationship("Course", back_populates="creator", cascade="all, delete-orphan")
-    roles = relationship("Role", secondary=user_roles, back_populates="users")
-    activities = relationship("UserActivity", back_populates="user", cascade="all, delete-orphan")
+    # 권한 확인에 쓰이는 역할만 selectin으로 함께 로드하고,
+    # 건수가 많은 수강/강의/활동 기록은 필요할 때 로드(select)
+    enrollments = relationship("Enrollment", back_populates="user", cascade="all, delete-orphan", lazy="select")
+    courses = relationship("Course", back_populates="creator", cascade="all, delete-orphan", lazy="select")
+    roles = relationship("Role", secondary=user_roles, back_populates="users", lazy="selectin")
+    activities = relationship("UserActivity", back_populates="user", cascade="all, delete-orphan", lazy="select")
     
     # 인덱스
     __table_args__ = (
-        Index('idx_users_auth_id', 'auth_id', postgresql_using='hash'),
-        Index('idx_users_email', 'email', postgresql_using='hash'),
-        Index('idx_users_username', 'username', postgresql_using='hash'),
         Index('idx_users_created_at', 'created_at', postgresql_using='brin'),
         Index('idx_users_updated_at', 'updated_at', postgresql_using='brin'),
+        # 선택도가 낮은 불리언 컬럼은 단독 인덱스 대신 부분 인덱스 조건으로만 사용
+        Index('idx_users_active_created_at', 'created_at',
+              postgresql_where=text('is_active AND deleted_at IS NULL')),
     )
     
+    @classmethod
+    def list_options(cls):
+        # 사용자 목록에서는 역할만 로드 (다른 관계 접근 시 N+1 대신 예외 발생)
+        return [selectinload(cls.roles), raiseload('*')]
+    
     @validates('email')
     def validate_email(self, key, email):
         if not email:
             raise ValueError("Email is required")
-        if not re.match(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$', email):
+        if not _EMAIL_RE.match(email):
             raise ValueError("Invalid email format")
         return email.lower()
     
     @validates('username')
     def validate_username(self, key, username):
-        if username and not re.match(r'^[a-zA-Z0-9_]{3,50}$', username):
+        if username and not _USERNAME_RE.match(username):
             raise ValueError("Username must be 3-50 characters long and contain only letters, numbers, and underscores")
         return username
     
     @validates('phone_number')
     def validate_phone_number(self, key, phone_number):
-        if phone_number and not re.match(r'^\+?[0-9\s-]{10,20}$', phone_number):
+        if phone_number and not _PHONE_RE.match(phone_number):
             raise ValueError("Invalid phone number format")
         return phone_number
 
@@ -172,23 +188,82 @@ class UserActivity(Base):
     activity_type = Column(String(50), index=True, nullable=False)
     ip_address = Column(String(45), nullable=True)
     user_agent = Column(Text, nullable=True)
-    device_info = Column(JSON, nullable=True)
-    location = Column(JSON, nullable=True)
-    activity_metadata = Column(JSON, nullable=True, comment="추가 메타데이터 (JSON 형식)")
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+    device_info = Column(JSONType, nullable=True)
+    location = Column(JSONType, nullable=True)
+    activity_metadata = Column(JSONType, nullable=True, comment="추가 메타데이터 (JSON 형식)")
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
     
     # 관계
-    user = relationship("User", back_populates="activities")
+    user = relationship("User", back_populates="activities", lazy="select")
     
     # 인덱스
     __table_args__ = (
         Index('idx_user_activities_user_id_created_at', 'user_id', 'created_at'),
         Index('idx_user_activities_activity_type_created_at', 'activity_type', 'created_at'),
+        Index('idx_user_activities_user_id_type_created_at', 'user_id', 'activity_type', 'created_at'),
+        # 로그 테이블은 시간순으로만 쌓이므로 기간 조회는 BRIN으로 충분
+        Index('idx_user_activities_created_at', 'created_at',
+              postgresql_using='brin', postgresql_with={'pages_per_range': 32}),
     )
+    
+    # 일괄 기록 시 한 번에 보내는 행 수 (SQLite 바인드 파라미터 한도 고려)
+    BULK_CHUNK_SIZE = 500
+    
+    @classmethod
+    def bulk_log(cls, session: Session, rows: List[Dict[str, Any]]) -> int:
+        """활동 로그 여러 건을 하나의 트랜잭션에서 다중 행 INSERT로 기록합니다.
+        
+        ORM 객체를 행마다 session.add() 하는 대신 Core insert를 청크 단위로 실행하고
+        마지막에 한 번만 커밋합니다. 기록한 행 수를 반환합니다.
+        """
+        if not rows:
+            return 0
+        stmt = insert(cls)
+        for start in range(0, len(rows), cls.BULK_CHUNK_SIZE):
+            session.execute(stmt, rows[start:start + cls.BULK_CHUNK_SIZE])
+        session.commit()
+        return len(rows)
+
+# OpenAPI 문서용 예시 (클래스 이름 기준, 상속 시 가장 가까운 상위 클래스의 예시 사용)
+_EXAMPLES: Dict[str, Dict[str, Any]] = {
+    "UserBase": {
+        "email": "user@example.com",
+        "username": "johndoe",
+        "full_name": "John Doe",
+        "display_name": "John"
+    },
+    "UserUpdate": {
+        "full_name": "John Doe",
+        "display_name": "John",
+        "bio": "Software Developer",
+        "phone_number": "+821012345678",
+        "date_of_birth": "1990-01-01",
+        "gender": "male",
+        "country": "South Korea",
+        "timezone": "Asia/Seoul",
+        "preferred_language": "ko",
+        "is_email_public": True,
+        "is_phone_public": False,
+        "is_profile_public": True,
+        "avatar_url": "https://example.com/avatar.jpg",
+        "social_links": {
+            "github": "https://github.com/username",
+            "twitter": "https://twitter.com/username"
+        }
+    },
+}
+
+def _add_example(schema: Dict[str, Any], model_cls: type) -> None:
+    # JSON 스키마 생성 시에만 호출되는 json_schema_extra 훅
+    for klass in model_cls.__mro__:
+        example = _EXAMPLES.get(klass.__name__)
+        if example is not None:
+            schema["example"] = example
+            return
 
 # Pydantic 모델 (API 요청/응답용)
 class UserBase(BaseModel):
-    email: EmailStr
+    email: str
     username: Optional[str] = Field(
         None, 
         min_length=3, 
@@ -199,38 +274,53 @@ class UserBase(BaseModel):
     full_name: str = Field(..., min_length=2, max_length=100)
     display_name: Optional[str] = Field(None, min_length=2, max_length=100)
     
-    class Config:
-        from_attributes = True
-        json_schema_extra = {
-            "example": {
-                "email": "user@example.com",
-                "username": "johndoe",
-                "full_name": "John Doe",
-                "display_name": "John"
-            }
-        }
+    model_config = ConfigDict(from_attributes=True, json_schema_extra=_add_example)
+    
+    @field_validator('email', mode='before')
+    @classmethod
+    def email_format(cls, v):
+        # email-validator 대신 ORM과 같은 정규식으로 형식만 확인 (도달 가능 여부는 확인하지 않음)
+        # None은 필드 타입 검증에 맡김 (UserPublic처럼 이메일이 선택인 모델)
+        if v is None:
+            return v
+        if not isinstance(v, str) or not _EMAIL_RE.match(v):
+            raise ValueError("Invalid email format")
+        return v
 
 class UserCreate(UserBase):
     password: str = Field(..., min_length=8, max_length=100)
     password_confirm: str
     
-    @validator('password_confirm')
-    def passwords_match(cls, v, values, **kwargs):
-        if 'password' in values and v != values['password']:
+    @model_validator(mode='after')
+    def passwords_match(self):
+        if self.password != self.password_confirm:
             raise ValueError('passwords do not match')
-        return v
+        return self
     
-    @validator('password')
+    @field_validator('password')
+    @classmethod
     def password_strength(cls, v):
         if len(v) < 8:
             raise ValueError('password must be at least 8 characters')
-        if not re.search(r'[A-Z]', v):
-            raise ValueError('password must contain at least one uppercase letter')
-        if not re.search(r'[a-z]', v):
-            raise ValueError('password must contain at least one lowercase letter')
-        if not re.search(r'\d', v):
-            raise ValueError('password must contain at least one number')
-        if not re.search(r'[^A-Za-z0-9]', v):
+        # 문자열을 한 번만 순회하며 포함된 문자 종류를 비트로 기록
+        # (1: 대문자, 2: 소문자, 4: 숫자, 8: 특수문자 - 모두 ASCII 기준)
+        flags = 0
+        for c in v:
+            if 'A' <= c <= 'Z':
+                flags |= 1
+            elif 'a' <= c <= 'z':
+                flags |= 2
+            elif '0' <= c <= '9':
+                flags |= 4
+            else:
+                flags |= 8
+        if flags != 15:
+            if not flags & 1:
+                raise ValueError('password must contain at least one uppercase letter')
+            if not flags & 2:
+                raise ValueError('password must contain at least one lowercase letter')
+            if not flags & 4:
+                raise ValueError('password must contain at least one number')
             raise ValueError('password must contain at least one special character')
         return v
 
@@ -254,29 +344,7 @@ class UserUpdate(BaseModel):
     avatar_url: Optional[HttpUrl] = None
     social_links: Optional[Dict[str, Any]] = None
     
-    class Config:
-        from_attributes = True
-        json_schema_extra = {
-            "example": {
-                "full_name": "John Doe",
-                "display_name": "John",
-                "bio": "Software Developer",
-                "phone_number": "+821012345678",
-                "date_of_birth": "1990-01-01",
-                "gender": "male",
-                "country": "South Korea",
-                "timezone": "Asia/Seoul",
-                "preferred_language": "ko",
-                "is_email_public": True,
-                "is_phone_public": False,
-                "is_profile_public": True,
-                "avatar_url": "https://example.com/avatar.jpg",
-                "social_links": {
-                    "github": "https://github.com/username",
-                    "twitter": "https://twitter.com/username"
-                }
-            }
-        }
+    model_config = ConfigDict(from_attributes=True, json_schema_extra=_add_example)
 
 class UserInDB(UserBase):
     id: int
@@ -288,19 +356,44 @@ class UserInDB(UserBase):
     updated_at: datetime
     last_login_at: Optional[datetime] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 class UserPublic(UserBase):
     id: int
+    email: Optional[str] = None  # 공개 프로필에는 이메일을 노출하지 않음
     display_name: Optional[str] = None
     bio: Optional[str] = None
     avatar_url: Optional[HttpUrl] = None
     is_profile_public: bool = True
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+# UserPublic 필드에 해당하는 컬럼만 조회 (이메일, password_hash, JSON 컬럼 등은 읽지 않음)
+USER_PUBLIC_COLUMNS = (
+    User.id, User.username, User.full_name, User.display_name,
+    User.bio, User.avatar_url, User.is_profile_public, User.created_at,
+)
+
+def list_public_users(session: Session, *criteria, skip: int = 0, limit: int = 100) -> List[UserPublic]:
+    """공개 프로필 목록을 필요한 컬럼만 조회하여 검증 없이 UserPublic으로 변환합니다.
+    
+    공개 프로필이면서 활성 상태이고 삭제되지 않은 사용자만 반환하며,
+    criteria는 이 조건에 추가되는 필터입니다.
+    """
+    stmt = (
+        select(*USER_PUBLIC_COLUMNS)
+        .where(
+            User.is_profile_public.is_(True),
+            User.is_active.is_(True),
+            User.deleted_at.is_(None),
+            *criteria,
+        )
+        .order_by(User.created_at.desc())
+        .offset(skip)
+        .limit(limit)
+    )
+    return [UserPublic.model_construct(**row._mapping) for row in session.execute(stmt)]
 
 # 역할 및 권한 관련 Pydantic 모델
 class RoleBase(BaseModel):
@@ -320,8 +413,7 @@ class RoleInDB(RoleBase):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 class PermissionBase(BaseModel):
     name: str = Field(..., min_length=3, max_length=100, pattern=r'^[a-z_]+$')
@@ -334,8 +426,7 @@ class PermissionInDB(PermissionBase):
     id: int
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 # 사용자 활동 로그 Pydantic 모델
 class UserActivityBase(BaseModel):
@@ -354,5 +445,4 @@ class UserActivityInDB(UserActivityBase):
     user_id: int
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
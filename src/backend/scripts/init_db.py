@@ -11,11 +11,12 @@ import logging
 import sys
 from pathlib import Path
 
+from sqlalchemy import create_engine, exists, insert, select, text
+from sqlalchemy.engine import make_url
+
 # 프로젝트 루트 디렉토리를 시스템 경로에 추가
 sys.path.insert(0, str(Path(__file__).parent.parent.resolve()))
 
-from sqlalchemy_utils import database_exists, create_database, drop_database
-
 from app.core.config import settings
 from app.core.database import Base, engine, SessionLocal
 from app.models.user import User, Role, user_roles, RefreshToken
@@ -26,6 +27,29 @@ from app.core.security import get_password_hash
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+def ensure_database(db_url: str) -> None:
+    """PostgreSQL 데이터베이스가 없으면 생성합니다.
+    
+    maintenance DB(postgres)에 한 번만 연결하여 존재 확인과 생성을 처리합니다.
+    SQLite 등 다른 DB는 첫 연결 시 자동 생성되므로 건너뜁니다.
+    """
+    url = make_url(db_url)
+    if url.get_backend_name() != "postgresql":
+        return
+    
+    admin_engine = create_engine(url.set(database="postgres"), isolation_level="AUTOCOMMIT")
+    try:
+        with admin_engine.connect() as conn:
+            db_exists = conn.execute(
+                text("SELECT 1 FROM pg_database WHERE datname = :name"),
+                {"name": url.database},
+            ).scalar()
+            if not db_exists:
+                logger.info(f"Creating database: {url.database}")
+                conn.execute(text(f'CREATE DATABASE "{url.database}"'))
+    finally:
+        admin_engine.dispose()
+
 def init_db(drop_all: bool = False) -> None:
     """데이터베이스를 초기화합니다.
     
@@ -35,9 +59,7 @@ def init_db(drop_all: bool = False) -> None:
     db_url = str(settings.SQLALCHEMY_DATABASE_URI)
     
     # 데이터베이스가 없으면 생성
-    if not database_exists(db_url):
-        logger.info(f"Creating database: {db_url}")
-        create_database(db_url)
+    ensure_database(db_url)
     
     # 기존 테이블 삭제 옵션
     if drop_all:
@@ -53,47 +75,50 @@ def init_db(drop_all: bool = False) -> None:
     db = SessionLocal()
     
     try:
-        # 기본 역할 추가
-        admin_role = db.query(Role).filter(Role.name == "admin").first()
-        if not admin_role:
-            admin_role = Role(
-                id="role_admin",
-                name="admin",
-                description="시스템 관리자",
-                permissions={
+        # 기본 역할 추가 (없는 역할만 한 번의 INSERT로 추가, id는 모델의 uuid4 기본값 사용)
+        default_roles = [
+            {
+                "name": "admin",
+                "description": "시스템 관리자",
+                "permissions": {
                     "users": ["read", "create", "update", "delete"],
                     "posts": ["read", "create", "update", "delete", "moderate"],
                     "comments": ["read", "create", "update", "delete", "moderate"],
                     "boards": ["read", "create", "update", "delete"],
-                }
-            )
-            db.add(admin_role)
-            db.commit()
-            logger.info("Created admin role")
-        
-        user_role = db.query(Role).filter(Role.name == "user").first()
-        if not user_role:
-            user_role = Role(
-                id="role_user",
-                name="user",
-                description="일반 사용자",
-                permissions={
+                },
+            },
+            {
+                "name": "user",
+                "description": "일반 사용자",
+                "permissions": {
                     "users": ["read"],
                     "posts": ["read", "create", "update_own", "delete_own"],
                     "comments": ["read", "create", "update_own", "delete_own"],
                     "boards": ["read"],
-                }
-            )
-            db.add(user_role)
-            db.commit()
-            logger.info("Created user role")
+                },
+            },
+        ]
+        roles = {
+            role.name: role
+            for role in db.execute(
+                select(Role).where(Role.name.in_([r["name"] for r in default_roles]))
+            ).scalars()
+        }
+        missing_roles = [r for r in default_roles if r["name"] not in roles]
+        if missing_roles:
+            for role in db.execute(insert(Role).returning(Role), missing_roles).scalars():
+                roles[role.name] = role
+                logger.info(f"Created {role.name} role")
+        admin_role = roles["admin"]
         
         # 관리자 사용자 추가 (환경변수에서 가져옴)
         if settings.FIRST_SUPERUSER_EMAIL and settings.FIRST_SUPERUSER_PASSWORD:
-            admin = db.query(User).filter(User.email == settings.FIRST_SUPERUSER_EMAIL).first()
-            if not admin:
+            # 존재 여부만 확인 (행을 읽거나 ORM 객체를 만들지 않음)
+            admin_exists = db.scalar(
+                select(exists().where(User.email == settings.FIRST_SUPERUSER_EMAIL))
+            )
+            if not admin_exists:
                 admin = User(
-                    id="user_admin_1",  # 실제로는 UUID를 생성하는 것이 좋음
                     email=settings.FIRST_SUPERUSER_EMAIL,
                     username=settings.FIRST_SUPERUSER_USERNAME or "admin",
                     full_name="관리자",
@@ -104,12 +129,10 @@ def init_db(drop_all: bool = False) -> None:
                 )
                 admin.roles.append(admin_role)
                 db.add(admin)
-                db.commit()
                 logger.info(f"Created admin user: {settings.FIRST_SUPERUSER_EMAIL}")
         
         # 테스트 게시판 추가
-        board = db.query(Board).filter(Board.name == "자유게시판").first()
-        if not board:
+        if not db.scalar(select(exists().where(Board.name == "자유게시판"))):
             board = Board(
                 id="board_1",
                 name="자유게시판",
@@ -118,9 +141,9 @@ def init_db(drop_all: bool = False) -> None:
                 order=1,
             )
             db.add(board)
-            db.commit()
             logger.info("Created default board")
         
+        # 초기 데이터 전체를 하나의 트랜잭션으로 커밋
         db.commit()
         logger.info("Database initialization completed successfully!")
         
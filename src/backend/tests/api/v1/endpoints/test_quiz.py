@@ -6,6 +6,7 @@
 import pytest
 from fastapi import status
 from fastapi.testclient import TestClient
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
@@ -26,13 +27,15 @@ def test_create_quiz(
         created_by=instructor_user.id,
     )
     db.add(content)
+    db.flush()
+    # INSERT ... RETURNING으로 받은 PK를 커밋 전에 보관 (커밋 후 만료된 객체 재조회 방지)
+    content_id = content.id
     db.commit()
-    db.refresh(content)
     
     data = {
         "title": "Test Quiz",
         "description": "Test Quiz Description",
-        "content_id": str(content.id),
+        "content_id": str(content_id),
         "time_limit": 30,
         "max_attempts": 3,
         "passing_score": 70,
@@ -64,39 +67,19 @@ def test_create_quiz(
 
 
 def test_get_quiz(
-    client: TestClient, db: Session, normal_user_token_headers: dict, instructor_user: User
+    client: TestClient, db: Session, normal_user_token_headers: dict,
+    quiz_fixture: tuple, query_counter,
 ) -> None:
     """퀴즈 조회 테스트"""
-    # 테스트용 퀴즈 생성
-    content = Content(
-        title="Test Content",
-        description="Test Description",
-        content_type="quiz",
-        created_by=instructor_user.id,
-    )
-    db.add(content)
-    db.commit()
-    db.refresh(content)
+    _, quiz = quiz_fixture
     
-    quiz = Quiz(
-        title="Test Quiz",
-        description="Test Quiz Description",
-        content_id=content.id,
-        created_by=instructor_user.id,
-        time_limit=30,
-        max_attempts=3,
-        passing_score=70,
-        is_published=True,
-    )
-    db.add(quiz)
-    db.commit()
-    db.refresh(quiz)
-    
-    # 퀴즈 조회
-    response = client.get(
-        f"{settings.API_V1_STR}/quizzes/{quiz.id}",
-        headers=normal_user_token_headers,
-    )
+    # 퀴즈 조회 (사용자 조회 1 + 퀴즈/콘텐츠 1 + 문항 1 + 선택지 1)
+    with query_counter() as statements:
+        response = client.get(
+            f"{settings.API_V1_STR}/quizzes/{quiz.id}",
+            headers=normal_user_token_headers,
+        )
+    assert len(statements) <= 4
     
     assert response.status_code == status.HTTP_200_OK
     content = response.json()
@@ -105,33 +88,11 @@ def test_get_quiz(
 
 
 def test_start_quiz_attempt(
-    client: TestClient, db: Session, normal_user_token_headers: dict, normal_user: User, instructor_user: User
+    client: TestClient, db: Session, normal_user_token_headers: dict, normal_user: User,
+    quiz_fixture: tuple,
 ) -> None:
     """퀴즈 시도 시작 테스트"""
-    # 테스트용 퀴즈 생성
-    content = Content(
-        title="Test Content",
-        description="Test Description",
-        content_type="quiz",
-        created_by=instructor_user.id,
-    )
-    db.add(content)
-    db.commit()
-    db.refresh(content)
-    
-    quiz = Quiz(
-        title="Test Quiz",
-        description="Test Quiz Description",
-        content_id=content.id,
-        created_by=instructor_user.id,
-        time_limit=30,
-        max_attempts=3,
-        passing_score=70,
-        is_published=True,
-    )
-    db.add(quiz)
-    db.commit()
-    db.refresh(quiz)
+    _, quiz = quiz_fixture
     
     # 퀴즈 시도 시작
     response = client.post(
@@ -147,59 +108,31 @@ def test_start_quiz_attempt(
 
 
 def test_submit_quiz_attempt(
-    client: TestClient, db: Session, normal_user_token_headers: dict, normal_user: User, instructor_user: User
+    client: TestClient, db: Session, normal_user_token_headers: dict, normal_user: User,
+    quiz_fixture: tuple,
 ) -> None:
     """퀴즈 제출 테스트"""
-    # 테스트용 퀴즈 및 질문, 선택지 생성
-    content = Content(
-        title="Test Content",
-        description="Test Description",
-        content_type="quiz",
-        created_by=instructor_user.id,
-    )
-    db.add(content)
-    db.commit()
-    db.refresh(content)
-    
-    quiz = Quiz(
-        title="Test Quiz",
-        description="Test Quiz Description",
-        content_id=content.id,
-        created_by=instructor_user.id,
-        time_limit=30,
-        max_attempts=3,
-        passing_score=70,
-        is_published=True,
-    )
-    db.add(quiz)
-    db.commit()
-    db.refresh(quiz)
+    # 테스트용 퀴즈에 질문, 선택지 추가
+    _, quiz = quiz_fixture
     
     question = Question(
         quiz_id=quiz.id,
         question_text="What is 2+2?",
         question_type=QuestionType.MULTIPLE_CHOICE,
         points=10,
-        order=1,
+        order_num=1,
     )
     db.add(question)
-    db.commit()
-    db.refresh(question)
-    
-    choice1 = Choice(
-        question_id=question.id,
-        choice_text="3",
-        is_correct=False,
-        order=1,
-    )
-    choice2 = Choice(
-        question_id=question.id,
-        choice_text="4",
-        is_correct=True,
-        order=2,
-    )
-    db.add(choice1)
-    db.add(choice2)
+    db.flush()
+    question_id = question.id
+    
+    choice_ids = db.execute(
+        insert(Choice).returning(Choice.id),
+        [
+            {"question_id": question_id, "choice_text": "3", "is_correct": False, "order_num": 1},
+            {"question_id": question_id, "choice_text": "4", "is_correct": True, "order_num": 2},
+        ],
+    ).scalars().all()
     db.commit()
     
     # 퀴즈 시도 시작
@@ -214,9 +147,9 @@ def test_submit_quiz_attempt(
     submit_data = {
         "answers": [
             {
-                "question_id": str(question.id),
+                "question_id": str(question_id),
                 "answer_text": "4",
-                "selected_choice_ids": [str(choice2.id)],
+                "selected_choice_ids": [str(choice_ids[1])],
             }
         ]
     }
@@ -234,40 +167,21 @@ def test_submit_quiz_attempt(
 
 
 def test_get_quiz_statistics(
-    client: TestClient, db: Session, normal_user_token_headers: dict, instructor_user: User
+    client: TestClient, db: Session, normal_user_token_headers: dict, instructor_user: User,
+    quiz_fixture: tuple, query_counter,
 ) -> None:
     """퀴즈 통계 조회 테스트"""
-    # 테스트용 퀴즈 생성
-    content = Content(
-        title="Test Content",
-        description="Test Description",
-        content_type="quiz",
-        created_by=instructor_user.id,
-    )
-    db.add(content)
-    db.commit()
-    db.refresh(content)
-    
-    quiz = Quiz(
-        title="Test Quiz",
-        description="Test Quiz Description",
-        content_id=content.id,
-        created_by=instructor_user.id,
-        time_limit=30,
-        max_attempts=3,
-        passing_score=70,
-        is_published=True,
-    )
-    db.add(quiz)
-    db.commit()
-    db.refresh(quiz)
+    _, quiz = quiz_fixture
     
     # 강사 권한으로 통계 조회
+    # (사용자 1 + 퀴즈 1 + 콘텐츠 1 + 문항 1 + 시도 집계 1, 시도 수와 무관)
     instructor_headers = get_user_authentication_headers(client, instructor_user.email, "password")
-    response = client.get(
-        f"{settings.API_V1_STR}/quizzes/{quiz.id}/statistics",
-        headers=instructor_headers,
-    )
+    with query_counter() as statements:
+        response = client.get(
+            f"{settings.API_V1_STR}/quizzes/{quiz.id}/statistics",
+            headers=instructor_headers,
+        )
+    assert len(statements) <= 6
     
     assert response.status_code == status.HTTP_200_OK
     stats = response.json()
@@ -283,33 +197,11 @@ def test_get_quiz_statistics(
 
 
 def test_get_user_quiz_progress(
-    client: TestClient, db: Session, normal_user_token_headers: dict, normal_user: User, instructor_user: User
+    client: TestClient, db: Session, normal_user_token_headers: dict, normal_user: User,
+    quiz_fixture: tuple,
 ) -> None:
     """사용자 퀴즈 진행 상황 조회 테스트"""
-    # 테스트용 퀴즈 생성
-    content = Content(
-        title="Test Content",
-        description="Test Description",
-        content_type="quiz",
-        created_by=instructor_user.id,
-    )
-    db.add(content)
-    db.commit()
-    db.refresh(content)
-    
-    quiz = Quiz(
-        title="Test Quiz",
-        description="Test Quiz Description",
-        content_id=content.id,
-        created_by=instructor_user.id,
-        time_limit=30,
-        max_attempts=3,
-        passing_score=70,
-        is_published=True,
-    )
-    db.add(quiz)
-    db.commit()
-    db.refresh(quiz)
+    _, quiz = quiz_fixture
     
     # 사용자 퀴즈 진행 상황 조회
     response = client.get(
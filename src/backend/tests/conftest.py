@@ -2,15 +2,19 @@
 
 This module contains fixtures and configuration for testing the FastAPI application with Supabase.
 """
+import hashlib
 import os
+from contextlib import contextmanager
 from datetime import datetime, timedelta
-from typing import Generator
+from typing import Generator, List
 
 import pytest
 from fastapi.testclient import TestClient
 from jose import jwt
-from sqlalchemy import create_engine, text
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, event, insert, inspect, text
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.schema import CreateIndex, CreateTable
 from sqlalchemy.exc import SQLAlchemyError
 
 # Set TESTING environment variable before importing app code
@@ -33,27 +37,100 @@ os.environ.update({
 
 # Now import app and models
 from app.core.database import Base, get_db  # noqa: E402
-from app.core.security import get_password_hash  # noqa: E402
+from app.core.security import create_access_token, get_password_hash  # noqa: E402
 from app.main import app  # noqa: E402
 from app.models import Choice, Content, Question, Quiz, User  # noqa: E402
 
 # Use test settings
 settings = test_settings
 
+# Under pytest-xdist (`pytest -n auto`) each worker gets its own PostgreSQL schema
+# so that the schema reset in create_test_db() does not race between workers.
+# In-memory SQLite is already private to each worker process.
+XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER")
+TEST_SCHEMA = f"test_{XDIST_WORKER}" if XDIST_WORKER else "public"
+
+def create_test_engine(database_uri: str):
+    """Create the test engine with explicit pooling for the target database."""
+    if database_uri.startswith("sqlite"):
+        # All sessions share one connection (required for in-memory SQLite)
+        sqlite_engine = create_engine(
+            database_uri,
+            poolclass=StaticPool,
+            connect_args={"check_same_thread": False},
+        )
+
+        @event.listens_for(sqlite_engine, "connect")
+        def _disable_sqlite_durability(dbapi_conn, _connection_record):
+            # Test data is throwaway: keep the journal in memory and never fsync
+            cursor = dbapi_conn.cursor()
+            cursor.execute("PRAGMA journal_mode=MEMORY")
+            cursor.execute("PRAGMA synchronous=OFF")
+            cursor.close()
+
+        return sqlite_engine
+    return create_engine(
+        database_uri,
+        pool_size=10,
+        max_overflow=20,
+        pool_pre_ping=True,
+        pool_recycle=3600,
+        connect_args={"options": f"-csearch_path={TEST_SCHEMA}"},
+    )
+
+
 # Create test engine with Supabase PostgreSQL
-engine = create_engine(settings.SQLALCHEMY_DATABASE_URI)
+engine = create_test_engine(settings.SQLALCHEMY_DATABASE_URI)
 
 # Create test database session
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
+def schema_fingerprint() -> str:
+    """Hash the DDL of every mapped table and index.
+
+    Stored as a comment on the test schema so later runs can tell whether the
+    existing tables still match the models.
+    """
+    digest = hashlib.sha256()
+    for table in Base.metadata.sorted_tables:
+        digest.update(str(CreateTable(table).compile(dialect=engine.dialect)).encode())
+        for index in sorted(table.indexes, key=lambda i: i.name or ""):
+            digest.update(str(CreateIndex(index).compile(dialect=engine.dialect)).encode())
+    return digest.hexdigest()
+
+
 def create_test_db():
-    """Create test database tables."""
+    """Create test database tables.
+
+    On PostgreSQL the schema is kept between runs: if the tables already exist
+    and were created from the same models, they are emptied with a single
+    TRUNCATE instead of dropping and recreating the schema.
+    """
     try:
-        # Drop all tables first to ensure clean state
-        with engine.connect() as conn:
-            conn.execute(text('DROP SCHEMA public CASCADE; CREATE SCHEMA public;'))
-            conn.commit()
+        if engine.dialect.name == "postgresql":
+            fingerprint = schema_fingerprint()
+            with engine.connect() as conn:
+                stored = conn.execute(
+                    text("SELECT obj_description(oid, 'pg_namespace') FROM pg_namespace WHERE nspname = :name"),
+                    {"name": TEST_SCHEMA},
+                ).scalar()
+                if stored == fingerprint and inspect(conn).has_table("users", schema=TEST_SCHEMA):
+                    tables = ", ".join(
+                        f'"{TEST_SCHEMA}"."{table.name}"' for table in Base.metadata.sorted_tables
+                    )
+                    conn.execute(text(f"TRUNCATE TABLE {tables} RESTART IDENTITY CASCADE"))
+                    conn.commit()
+                    return
+
+                # Models changed (or first run): rebuild the schema from scratch
+                conn.execute(text(
+                    f'DROP SCHEMA IF EXISTS "{TEST_SCHEMA}" CASCADE; CREATE SCHEMA "{TEST_SCHEMA}";'
+                ))
+                Base.metadata.create_all(bind=conn)
+                conn.execute(text(f"COMMENT ON SCHEMA \"{TEST_SCHEMA}\" IS '{fingerprint}'"))
+                conn.commit()
+            return
         
         # Create all tables
         Base.metadata.create_all(bind=engine)
@@ -63,7 +140,12 @@ def create_test_db():
 
 
 def drop_test_db():
-    """Drop test database tables."""
+    """Drop test database tables.
+
+    PostgreSQL tables are kept for the next run, which only truncates them.
+    """
+    if engine.dialect.name == "postgresql":
+        return
     try:
         Base.metadata.drop_all(bind=engine)
     except SQLAlchemyError as e:
@@ -92,23 +174,73 @@ def setup_test_db():
     drop_test_db()
 
 
+@pytest.fixture(scope="session")
+def connection(setup_test_db):
+    """Open one connection and outer transaction shared by the whole test session.
+
+    Nothing is ever committed to the database: the outer transaction is rolled
+    back when the session ends.
+    """
+    conn = engine.connect()
+    transaction = conn.begin()
+    yield conn
+    transaction.rollback()
+    conn.close()
+
+
 @pytest.fixture(scope="function")
-def db():
-    """Create a new database session for a test."""
-    # Start a new transaction
-    connection = engine.connect()
-    transaction = connection.begin()
-    
-    # Create a new session bound to this connection
-    TestingSessionLocal.configure(bind=connection)
-    session = TestingSessionLocal()
+def db(connection):
+    """Create a new database session for a test.
+
+    Each test runs inside its own SAVEPOINT on the shared connection, which is
+    rolled back afterwards. The session joins that savepoint with
+    ``join_transaction_mode="create_savepoint"``, so ``db.commit()`` inside a
+    test only releases a nested savepoint. The API under test uses the same
+    session through the ``get_db`` override.
+    """
+    test_savepoint = connection.begin_nested()
+    session = Session(
+        bind=connection,
+        autoflush=False,
+        join_transaction_mode="create_savepoint",
+    )
+
+    def _override_get_db():
+        yield session
+
+    app.dependency_overrides[get_db] = _override_get_db
 
     yield session
 
-    # Clean up
+    app.dependency_overrides[get_db] = override_get_db
     session.close()
-    transaction.rollback()
-    connection.close()
+    test_savepoint.rollback()
+
+
+@pytest.fixture
+def query_counter():
+    """Return a context manager that records the SQL statements executed inside it.
+
+    Usage::
+
+        with query_counter() as statements:
+            client.get(...)
+        assert len(statements) <= 3
+    """
+    @contextmanager
+    def _count() -> Generator[List[str], None, None]:
+        statements: List[str] = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", _record)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "before_cursor_execute", _record)
+
+    return _count
 
 
 @pytest.fixture
@@ -118,19 +250,43 @@ def client() -> TestClient:
         yield test_client
 
 
+# Users inserted once per test session: fixture name -> (email, username, password)
+SEED_USERS = {
+    "test_user": ("test@example.com", "testuser", "testpassword"),
+    "instructor_user": ("instructor@example.com", "instructor", "instructorpassword"),
+    "normal_user": ("user@example.com", "normaluser", "userpassword"),
+}
+
+
+@pytest.fixture(scope="session")
+def seeded_user_ids(connection):
+    """Insert the shared test users once and return their IDs by fixture name.
+
+    The users live in the session-wide outer transaction, so every test sees
+    them while per-test changes are still rolled back with the test savepoint.
+    """
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
+    users = {
+        name: User(
+            email=email,
+            username=username,
+            hashed_password=get_password_hash(password),
+            is_active=True,
+        )
+        for name, (email, username, password) in SEED_USERS.items()
+    }
+    session.add_all(users.values())
+    session.flush()
+    ids = {name: user.id for name, user in users.items()}
+    session.commit()
+    session.close()
+    return ids
+
+
 @pytest.fixture
-def test_user(db):
-    """Create a test user."""
-    user = User(
-        email="test@example.com",
-        username="testuser",
-        hashed_password=get_password_hash("testpassword"),
-        is_active=True,
-    )
-    db.add(user)
-    db.commit()
-    db.refresh(user)
-    return user
+def test_user(db, seeded_user_ids):
+    """Return the shared test user attached to the current test session."""
+    return db.get(User, seeded_user_ids["test_user"])
 
 
 @pytest.fixture
@@ -144,7 +300,6 @@ def test_content(db, test_user):
     )
     db.add(content)
     db.commit()
-    db.refresh(content)
     return content
 
 
@@ -160,10 +315,39 @@ def test_quiz(db, test_content, test_user):
     )
     db.add(quiz)
     db.commit()
-    db.refresh(quiz)
     return quiz
 
 
+@pytest.fixture
+def quiz_fixture(db, instructor_user):
+    """Create a published quiz with its content, owned by the instructor.
+
+    Returns a ``(content, quiz)`` tuple. Both rows are inserted with a single
+    commit and rolled back with the test savepoint.
+    """
+    content = Content(
+        title="Test Content",
+        description="Test Description",
+        content_type="quiz",
+        created_by=instructor_user.id,
+    )
+    db.add(content)
+    db.flush()
+    quiz = Quiz(
+        title="Test Quiz",
+        description="Test Quiz Description",
+        content_id=content.id,
+        created_by=instructor_user.id,
+        time_limit=30,
+        max_attempts=3,
+        passing_score=70,
+        is_published=True,
+    )
+    db.add(quiz)
+    db.commit()
+    return content, quiz
+
+
 @pytest.fixture
 def test_question(db, test_quiz):
     """Create a test question."""
@@ -172,35 +356,24 @@ def test_question(db, test_quiz):
         question_text="What is 2+2?",
         question_type="multiple_choice",
         points=10,
-        order=1,
+        order_num=1,
     )
     db.add(question)
     db.commit()
-    db.refresh(question)
     return question
 
 
 @pytest.fixture
 def test_choices(db, test_question):
     """Create test choices for a question."""
-    choices = [
-        Choice(
-            question_id=test_question.id,
-            choice_text="3",
-            is_correct=False,
-            order=1,
-        ),
-        Choice(
-            question_id=test_question.id,
-            choice_text="4",
-            is_correct=True,
-            order=2,
-        ),
-    ]
-    db.add_all(choices)
+    choices = db.execute(
+        insert(Choice).returning(Choice),
+        [
+            {"question_id": test_question.id, "choice_text": "3", "is_correct": False, "order_num": 1},
+            {"question_id": test_question.id, "choice_text": "4", "is_correct": True, "order_num": 2},
+        ],
+    ).scalars().all()
     db.commit()
-    for choice in choices:
-        db.refresh(choice)
     return choices
 
 
@@ -223,55 +396,32 @@ def test_token(test_user):
 
 # User role fixtures
 @pytest.fixture
-def instructor_user(db):
-    """Create an instructor user."""
-    user = User(
-        email="instructor@example.com",
-        username="instructor",
-        hashed_password=get_password_hash("instructorpassword"),
-        is_active=True,
-    )
-    db.add(user)
-    db.commit()
-    db.refresh(user)
-    return user
+def instructor_user(db, seeded_user_ids):
+    """Return the shared instructor user attached to the current test session."""
+    return db.get(User, seeded_user_ids["instructor_user"])
 
 
 @pytest.fixture
-def normal_user(db):
-    """Create a normal user."""
-    user = User(
-        email="user@example.com",
-        username="normaluser",
-        hashed_password=get_password_hash("userpassword"),
-        is_active=True,
-    )
-    db.add(user)
-    db.commit()
-    db.refresh(user)
-    return user
+def normal_user(db, seeded_user_ids):
+    """Return the shared normal user attached to the current test session."""
+    return db.get(User, seeded_user_ids["normal_user"])
 
 
 # Authentication headers
-@pytest.fixture
-def normal_user_token_headers(client: TestClient, normal_user: User):
-    """Get authentication headers for normal user."""
-    login_data = {
-        "username": normal_user.email,
-        "password": "userpassword",
-    }
-    response = client.post("/api/auth/login", data=login_data)
-    token = response.json()["access_token"]
+def _seed_user_token_headers(seeded_user_ids, name: str) -> dict:
+    """Issue an access token for a seeded user without going through the login endpoint."""
+    email = SEED_USERS[name][0]
+    token, _ = create_access_token(str(seeded_user_ids[name]), email=email)
     return {"Authorization": f"Bearer {token}"}
 
 
-@pytest.fixture
-def instructor_token_headers(client: TestClient, instructor_user: User):
+@pytest.fixture(scope="session")
+def normal_user_token_headers(seeded_user_ids):
+    """Get authentication headers for normal user."""
+    return _seed_user_token_headers(seeded_user_ids, "normal_user")
+
+
+@pytest.fixture(scope="session")
+def instructor_token_headers(seeded_user_ids):
     """Get authentication headers for instructor user."""
-    login_data = {
-        "username": instructor_user.email,
-        "password": "instructorpassword",
-    }
-    response = client.post("/api/auth/login", data=login_data)
-    token = response.json()["access_token"]
-    return {"Authorization": f"Bearer {token}"}
+    return _seed_user_token_headers(seeded_user_ids, "instructor_user")
@@ -0,0 +1,21 @@
+"""
+콘텐츠 CRUD 테스트 모듈입니다.
+"""
+from sqlalchemy.orm import Session
+
+from app.crud.content import get_contents
+from app.models import Content
+
+
+def test_get_contents_filters_by_tag(db: Session) -> None:
+    """Only contents whose tag list contains the exact tag are returned."""
+    db.add_all([
+        Content(title="Python Basics", content_type="article", creator_id=1, tags=["python", "basics"]),
+        Content(title="Pythonic Idioms", content_type="article", creator_id=1, tags=["pythonic"]),
+        Content(title="SQL Intro", content_type="article", creator_id=1, tags=["sql"]),
+    ])
+    db.commit()
+
+    contents = get_contents(db, tag="python")
+
+    assert [content.title for content in contents] == ["Python Basics"]
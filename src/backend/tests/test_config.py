@@ -19,4 +19,4 @@ os.environ["POSTGRES_SERVER"] = ""
 os.environ["POSTGRES_USER"] = ""
 os.environ["POSTGRES_PASSWORD"] = ""
 os.environ["POSTGRES_DB"] = ""
-os.environ["SQLALCHEMY_DATABASE_URI"] = "sqlite:///./test.db"
+os.environ["SQLALCHEMY_DATABASE_URI"] = "sqlite:///:memory:"
@@ -3,15 +3,33 @@ Test utilities for the application.
 
 This module contains utility functions and classes that are used across multiple test modules.
 """
-from typing import Dict, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional
 
 from fastapi.testclient import TestClient
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
-from app.models import User
+from app.core.security import get_password_hash
+from app.models import Choice, Question, Quiz, User
 from app.schemas.user import UserCreate
 
+# INSERT ... RETURNING 문은 모듈 로드 시 한 번만 구성하여 헬퍼 호출마다 재사용
+_QUIZ_INSERT = insert(Quiz).returning(Quiz)
+_QUESTION_INSERT = insert(Question).returning(Question)
+_CHOICE_INSERT = insert(Choice).returning(Choice)
+
+
+@lru_cache(maxsize=32)
+def cached_password_hash(password: str) -> str:
+    """Hash a test password once per process.
+    
+    Password hashing is deliberately slow and tests reuse a handful of fixed
+    passwords, so the hash is computed once and shared.
+    """
+    return get_password_hash(password)
+
 
 def get_user_authentication_headers(
     client: TestClient, email: str, password: str
@@ -47,7 +65,6 @@ def create_random_user(db: Session, **kwargs) -> User:
     Returns:
         Created user
     """
-    from app.core.security import get_password_hash
     from uuid import uuid4
     
     email = kwargs.pop("email", f"user-{uuid4().hex}@example.com")
@@ -58,7 +75,7 @@ def create_random_user(db: Session, **kwargs) -> User:
     
     user = User(
         email=email,
-        hashed_password=get_password_hash(password),
+        hashed_password=cached_password_hash(password),
         full_name=full_name,
         role=role,
         is_active=is_active,
@@ -85,25 +102,20 @@ def create_random_quiz(
         Created quiz
     """
     from uuid import uuid4
-    from app.models import Quiz
-    
-    title = kwargs.pop("title", f"Test Quiz {uuid4().hex[:8]}")
-    description = kwargs.pop("description", "Test Quiz Description")
     
-    quiz = Quiz(
-        title=title,
-        description=description,
-        content_id=content_id,
-        created_by=created_by,
-        time_limit=30,
-        max_attempts=3,
-        passing_score=70,
-        is_published=True,
-        **kwargs
-    )
-    db.add(quiz)
+    row = {
+        "title": kwargs.pop("title", f"Test Quiz {uuid4().hex[:8]}"),
+        "description": kwargs.pop("description", "Test Quiz Description"),
+        "content_id": content_id,
+        "created_by": created_by,
+        "time_limit": 30,
+        "max_attempts": 3,
+        "passing_score": 70,
+        "is_published": True,
+        **kwargs,
+    }
+    quiz = db.execute(_QUIZ_INSERT, [row]).scalar_one()
     db.commit()
-    db.refresh(quiz)
     return quiz
 
 
@@ -120,24 +132,16 @@ def create_random_question(
     Returns:
         Created question
     """
-    from app.models import Question
-    
-    question_text = kwargs.pop("question_text", "What is 2+2?")
-    question_type = kwargs.pop("question_type", "multiple_choice")
-    points = kwargs.pop("points", 10)
-    order = kwargs.pop("order", 1)
-    
-    question = Question(
-        quiz_id=quiz_id,
-        question_text=question_text,
-        question_type=question_type,
-        points=points,
-        order=order,
-        **kwargs
-    )
-    db.add(question)
+    row = {
+        "quiz_id": quiz_id,
+        "question_text": kwargs.pop("question_text", "What is 2+2?"),
+        "question_type": kwargs.pop("question_type", "multiple_choice"),
+        "points": kwargs.pop("points", 10),
+        "order_num": kwargs.pop("order_num", 1),
+        **kwargs,
+    }
+    question = db.execute(_QUESTION_INSERT, [row]).scalar_one()
     db.commit()
-    db.refresh(question)
     return question
 
 
@@ -155,20 +159,34 @@ def create_random_choice(
     Returns:
         Created choice
     """
-    from app.models import Choice
-    from uuid import uuid4
+    return create_random_choices(db, question_id, [dict(is_correct=is_correct, **kwargs)])[0]
+
+
+def create_random_choices(
+    db: Session, question_id: int, choices: List[Dict]
+) -> List:
+    """Create several choices for a question with one INSERT.
     
-    choice_text = kwargs.pop("choice_text", f"Choice {uuid4().hex[:4]}")
-    order = kwargs.pop("order", 1)
+    Args:
+        db: Database session
+        question_id: ID of the question the choices belong to
+        choices: Per-choice attribute overrides (e.g. ``{"is_correct": True}``)
+        
+    Returns:
+        Created choices, in the given order
+    """
+    from uuid import uuid4
     
-    choice = Choice(
-        question_id=question_id,
-        choice_text=choice_text,
-        is_correct=is_correct,
-        order=order,
-        **kwargs
-    )
-    db.add(choice)
+    rows = [
+        {
+            "question_id": question_id,
+            "choice_text": attrs.pop("choice_text", f"Choice {uuid4().hex[:4]}"),
+            "is_correct": attrs.pop("is_correct", False),
+            "order_num": attrs.pop("order_num", position),
+            **attrs,
+        }
+        for position, attrs in enumerate((dict(c) for c in choices), start=1)
+    ]
+    created = db.execute(_CHOICE_INSERT, rows).scalars().all()
     db.commit()
-    db.refresh(choice)
-    return choice
+    return created
@@ -60,14 +60,16 @@ def check_tables():
             'enrollments', 'course_reviews', 'lesson_completions'
         ]
         
-        for table in tables:
-            try:
-                response = client.table(table).select('*', count='exact').limit(1).execute()
-                count = response.count if hasattr(response, 'count') else \
-                        len(response.data) if hasattr(response, 'data') else 0
-                print(f"- {table}: {count} records")
-            except Exception as e:
-                print(f"- {table}: Error - {str(e)}")
+        # 한 번의 RPC로 모든 테이블 행 수 조회 (create_tables.sql의 get_table_counts)
+        try:
+            response = client.rpc('get_table_counts', {'names': tables}).execute()
+            for row in response.data:
+                if row['cnt'] is None:
+                    print(f"- {row['name']}: Error - table does not exist")
+                else:
+                    print(f"- {row['name']}: {row['cnt']} records")
+        except Exception as e:
+            print(f"- Error - {str(e)}")
     except Exception as e:
         print(f"Error checking tables: {e}")
 
@@ -1,11 +1,12 @@
 import os
-from sqlalchemy import create_engine, text
+from sqlalchemy import inspect, text
 from dotenv import load_dotenv
+from db_engine import get_engine
 
 # .env 파일 로드
 load_dotenv()
 
-def test_connection():
+def test_connection(verbose=False):
     try:
         # 환경변수에서 데이터베이스 URL 가져오기
         db_url = os.getenv('DATABASE_URL')
@@ -16,23 +17,20 @@ def test_connection():
         print(f"Connecting to database: {db_url.split('@')[-1]}")
         
         # 엔진 생성 및 연결 테스트
-        engine = create_engine(db_url)
+        engine = get_engine(db_url, application_name='learnflow-test-connection')
         with engine.connect() as conn:
-            # 간단한 쿼리 실행
-            result = conn.execute(text("SELECT version()"))
-            db_version = result.scalar()
-            print(f"Successfully connected to database!\nVersion: {db_version}")
+            # 연결 확인용 최소 쿼리 (버전 문자열은 verbose일 때만 조회)
+            conn.execute(text("SELECT 1"))
+            print("Successfully connected to database!")
+            if verbose:
+                print(f"Version: {conn.execute(text('SELECT version()')).scalar()}")
             
-            # 테이블 목록 조회
+            # 테이블 목록 조회 (SQLAlchemy 리플렉션, PostgreSQL에서는 pg_catalog 조회)
+            # 같은 Inspector로 컬럼/제약 조건을 추가로 조회하면 내부 캐시가 재사용됨
+            inspector = inspect(conn)
             print("\nTables in database:")
-            tables = conn.execute(text("""
-                SELECT table_name 
-                FROM information_schema.tables 
-                WHERE table_schema = 'public'
-                ORDER BY table_name
-            """))
-            for table in tables:
-                print(f"- {table[0]}")
+            for table in sorted(inspector.get_table_names(schema='public')):
+                print(f"- {table}")
                 
         return True
         
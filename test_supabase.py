@@ -1,59 +1,188 @@
+import argparse
+import asyncio
+import json
 import os
+from types import MappingProxyType
+import sys
+from operator import itemgetter
+from pathlib import Path
+import httpx
 from dotenv import load_dotenv
-from supabase import create_client, Client
-from supabase.client import ClientOptions
+from postgrest.exceptions import APIError
+from sqlalchemy import text
+from db_engine import get_engine
+from supabase import acreate_client, AsyncClient
+from supabase.lib.client_options import AsyncClientOptions
+
+# HTTP/2는 httpx[http2](h2 패키지)가 있을 때만 사용하고, 없으면 HTTP/1.1 keep-alive로 동작
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
 
 # .env 파일 로드
 load_dotenv()
 
-def get_table_structure(supabase, table_name):
-    """테이블의 구조를 가져오는 함수"""
-    try:
-        # 테이블의 첫 번째 행을 가져와서 컬럼 정보 확인
-        result = supabase.table(table_name).select('*').limit(1).execute()
-        
-        if hasattr(result, 'error') and result.error:
-            print(f"  Error getting structure for {table_name}: {result.error}")
-            return []
-            
-        if not result.data:
-            print(f"  No data in table {table_name}")
-            return []
-            
-        # 첫 번째 행의 키를 컬럼으로 사용
-        columns = list(result.data[0].keys())
-        
-        # 각 컬럼의 타입 확인을 위해 정보 수집
-        structure = []
-        for col in columns:
-            # 간단한 타입 추론 (정확한 타입은 직접 확인 필요)
-            if not result.data[0][col] is None:  # 값이 None이 아닌 경우에만 타입 확인
-                col_type = type(result.data[0][col]).__name__
-                if col_type == 'str':
-                    col_type = 'text'
-                elif col_type == 'int':
-                    col_type = 'integer'
-                elif col_type == 'float':
-                    col_type = 'float8'
-                elif col_type == 'bool':
-                    col_type = 'boolean'
-                elif col_type == 'dict':
-                    col_type = 'jsonb'
-            else:
-                col_type = 'unknown'  # 값이 NULL인 경우
-                
-            structure.append({
-                'column_name': col,
-                'data_type': col_type,
-                'is_nullable': 'YES',  # 정확한 정보는 직접 확인 불가
-                'column_default': None  # 정확한 정보는 직접 확인 불가
+# 직접 연결 시 사용하는 컬럼 조회 쿼리
+_COLUMNS_SQL = text("""
+    SELECT table_name, column_name, data_type, is_nullable, column_default
+    FROM information_schema.columns
+    WHERE table_schema = 'public' AND table_name = ANY(:table_names)
+    ORDER BY table_name, ordinal_position
+""")
+
+def get_columns_direct(db_url, table_names):
+    """DATABASE_URL로 직접 연결해 information_schema에서 컬럼 정보를 한 번에 가져오는 함수"""
+    with get_engine(db_url).connect() as conn:
+        rows = conn.execute(_COLUMNS_SQL, {'table_names': list(table_names)}).mappings()
+        schema = {}
+        for row in rows:
+            schema.setdefault(row['table_name'], []).append({
+                'column_name': row['column_name'],
+                'data_type': row['data_type'],
+                'is_nullable': row['is_nullable'],
+                'column_default': row['column_default'],
             })
-            
-        return structure
-        
+    return schema
+
+# 컬럼 정보를 조회할 수 없을 때 사용하는 테이블별 기본 컬럼 정보 (읽기 전용)
+_FALLBACK_COLUMNS = MappingProxyType({
+    'users': (
+        MappingProxyType({'column_name': 'id', 'data_type': 'uuid', 'is_nullable': 'NO'}),
+        MappingProxyType({'column_name': 'email', 'data_type': 'text', 'is_nullable': 'NO'}),
+        MappingProxyType({'column_name': 'created_at', 'data_type': 'timestamp', 'is_nullable': 'YES'}),
+        MappingProxyType({'column_name': 'updated_at', 'data_type': 'timestamp', 'is_nullable': 'YES'}),
+    ),
+    'courses': (
+        MappingProxyType({'column_name': 'id', 'data_type': 'uuid', 'is_nullable': 'NO'}),
+        MappingProxyType({'column_name': 'title', 'data_type': 'text', 'is_nullable': 'NO'}),
+        MappingProxyType({'column_name': 'description', 'data_type': 'text', 'is_nullable': 'YES'}),
+        MappingProxyType({'column_name': 'creator_id', 'data_type': 'uuid', 'is_nullable': 'NO'}),
+        MappingProxyType({'column_name': 'created_at', 'data_type': 'timestamp', 'is_nullable': 'YES'}),
+        MappingProxyType({'column_name': 'updated_at', 'data_type': 'timestamp', 'is_nullable': 'YES'}),
+    ),
+    'course_sections': (
+        MappingProxyType({'column_name': 'id', 'data_type': 'uuid', 'is_nullable': 'NO'}),
+        MappingProxyType({'column_name': 'course_id', 'data_type': 'uuid', 'is_nullable': 'NO'}),
+        MappingProxyType({'column_name': 'title', 'data_type': 'text', 'is_nullable': 'NO'}),
+        MappingProxyType({'column_name': 'order_index', 'data_type': 'integer', 'is_nullable': 'NO'}),
+        MappingProxyType({'column_name': 'created_at', 'data_type': 'timestamp', 'is_nullable': 'YES'}),
+    ),
+    'lessons': (
+        MappingProxyType({'column_name': 'id', 'data_type': 'uuid', 'is_nullable': 'NO'}),
+        MappingProxyType({'column_name': 'section_id', 'data_type': 'uuid', 'is_nullable': 'NO'}),
+        MappingProxyType({'column_name': 'title', 'data_type': 'text', 'is_nullable': 'NO'}),
+        MappingProxyType({'column_name': 'content', 'data_type': 'text', 'is_nullable': 'YES'}),
+        MappingProxyType({'column_name': 'order_index', 'data_type': 'integer', 'is_nullable': 'NO'}),
+        MappingProxyType({'column_name': 'created_at', 'data_type': 'timestamp', 'is_nullable': 'YES'}),
+    ),
+    'enrollments': (
+        MappingProxyType({'column_name': 'id', 'data_type': 'uuid', 'is_nullable': 'NO'}),
+        MappingProxyType({'column_name': 'user_id', 'data_type': 'uuid', 'is_nullable': 'NO'}),
+        MappingProxyType({'column_name': 'course_id', 'data_type': 'uuid', 'is_nullable': 'NO'}),
+        MappingProxyType({'column_name': 'enrolled_at', 'data_type': 'timestamp', 'is_nullable': 'YES'}),
+    ),
+    'course_reviews': (
+        MappingProxyType({'column_name': 'id', 'data_type': 'uuid', 'is_nullable': 'NO'}),
+        MappingProxyType({'column_name': 'user_id', 'data_type': 'uuid', 'is_nullable': 'NO'}),
+        MappingProxyType({'column_name': 'course_id', 'data_type': 'uuid', 'is_nullable': 'NO'}),
+        MappingProxyType({'column_name': 'rating', 'data_type': 'integer', 'is_nullable': 'NO'}),
+        MappingProxyType({'column_name': 'comment', 'data_type': 'text', 'is_nullable': 'YES'}),
+        MappingProxyType({'column_name': 'created_at', 'data_type': 'timestamp', 'is_nullable': 'YES'}),
+    ),
+    'lesson_completions': (
+        MappingProxyType({'column_name': 'id', 'data_type': 'uuid', 'is_nullable': 'NO'}),
+        MappingProxyType({'column_name': 'user_id', 'data_type': 'uuid', 'is_nullable': 'NO'}),
+        MappingProxyType({'column_name': 'lesson_id', 'data_type': 'uuid', 'is_nullable': 'NO'}),
+        MappingProxyType({'column_name': 'completed_at', 'data_type': 'timestamp', 'is_nullable': 'YES'}),
+    ),
+})
+
+# 샘플 값의 파이썬 타입 -> PostgreSQL 타입 이름
+_PY_TO_PG = {
+    str: 'text',
+    int: 'integer',
+    float: 'float8',
+    bool: 'boolean',
+    dict: 'jsonb',
+}
+
+def _infer_pg_type(value):
+    """샘플 값으로 컬럼 타입을 추론 (NULL이면 unknown, 매핑에 없으면 파이썬 타입 이름)"""
+    if value is None:
+        return 'unknown'
+    return _PY_TO_PG.get(type(value), type(value).__name__)
+
+def get_table_columns(schema, table_name, sample_row=None):
+    """테이블의 컬럼 정보를 가져오는 함수
+    
+    조회한 스키마를 우선 사용하고, 없으면 샘플 행에서 타입을 추론하며,
+    샘플 행도 없으면 미리 정의한 컬럼 정보를 사용합니다.
+    """
+    if schema.get(table_name):
+        return schema[table_name]
+    if sample_row:
+        return [
+            {
+                'column_name': col,
+                'data_type': _infer_pg_type(value),
+                'is_nullable': 'YES'  # 정확한 정보는 직접 확인 불가
+            }
+            for col, value in sample_row.items()
+        ]
+    return list(_FALLBACK_COLUMNS.get(table_name, ()))
+
+async def get_public_schema(supabase, table_names):
+    """여러 테이블의 컬럼 정보를 한 번의 RPC로 가져오는 함수 (create_tables.sql의 get_public_schema)"""
+    try:
+        result = await supabase.rpc('get_public_schema', {'table_names': table_names}).execute()
     except Exception as e:
-        print(f"  Error getting structure for {table_name}: {e}")
-        return []
+        print(f"  Error getting schema (get_public_schema not installed?): {e}")
+        return {}
+    
+    schema = {}
+    for row in result.data:
+        schema.setdefault(row['table_name'], []).append({
+            'column_name': row['column_name'],
+            'data_type': row['data_type'],
+            'is_nullable': row['is_nullable'],
+        })
+    return schema
+
+# get_public_schema 결과를 스키마 해시와 함께 저장하는 로컬 캐시
+_SCHEMA_CACHE_PATH = Path.home() / '.cache' / 'learnflow' / 'supabase_schema.json'
+
+async def get_schema_fingerprint(supabase, table_names):
+    """컬럼 구성의 해시를 가져오는 함수 (create_tables.sql의 get_schema_fingerprint, 실패 시 None)"""
+    try:
+        result = await supabase.rpc('get_schema_fingerprint', {'table_names': table_names}).execute()
+    except Exception:
+        return None
+    return result.data or None
+
+def load_cached_schema(fingerprint):
+    """해시가 같을 때만 캐시된 스키마를 반환하는 함수"""
+    try:
+        cached = json.loads(_SCHEMA_CACHE_PATH.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return None
+    if cached.get('fingerprint') != fingerprint:
+        return None
+    return cached.get('schema')
+
+def save_cached_schema(fingerprint, schema):
+    """스키마를 캐시 파일에 저장하는 함수 (임시 파일에 쓴 뒤 교체)"""
+    try:
+        _SCHEMA_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = _SCHEMA_CACHE_PATH.with_suffix('.tmp')
+        tmp_path.write_text(
+            json.dumps({'fingerprint': fingerprint, 'schema': schema}, separators=(',', ':')),
+            encoding='utf-8',
+        )
+        os.replace(tmp_path, _SCHEMA_CACHE_PATH)
+    except OSError as e:
+        print(f"  Could not write schema cache: {e}")
 
 def get_table_constraints(supabase, table_name):
     """테이블의 제약 조건을 가져오는 함수 (기본 키, 외래 키, 유니크 제약 등)"""
@@ -66,110 +195,73 @@ def get_table_constraints(supabase, table_name):
         print(f"  Error getting constraints for {table_name}: {e}")
         return []
 
-def get_table_columns(supabase, table_name):
-    """테이블의 컬럼 정보를 가져오는 함수"""
+async def probe_table(supabase, schema, table, show_samples):
+    """테이블 하나를 조회하고 결과를 dict로 반환하는 함수 (출력은 호출자가 담당)"""
+    report = {'table': table, 'exists': False, 'columns': [], 'constraints': [], 'sample': None, 'error': None}
     try:
-        # 테이블의 첫 번째 행을 가져와서 컬럼 정보 확인
-        result = supabase.table(table_name).select('*').limit(1).execute()
-        
-        if hasattr(result, 'error') and result.error:
-            print(f"  Error getting columns for {table_name}: {result.error}")
-            return []
-            
-        if not result.data:
-            # 테이블이 비어있을 경우 컬럼 정보를 직접 정의
-            if table_name == 'users':
-                return [
-                    {'column_name': 'id', 'data_type': 'uuid', 'is_nullable': 'NO'},
-                    {'column_name': 'email', 'data_type': 'text', 'is_nullable': 'NO'},
-                    {'column_name': 'created_at', 'data_type': 'timestamp', 'is_nullable': 'YES'},
-                    {'column_name': 'updated_at', 'data_type': 'timestamp', 'is_nullable': 'YES'}
-                ]
-            elif table_name == 'courses':
-                return [
-                    {'column_name': 'id', 'data_type': 'uuid', 'is_nullable': 'NO'},
-                    {'column_name': 'title', 'data_type': 'text', 'is_nullable': 'NO'},
-                    {'column_name': 'description', 'data_type': 'text', 'is_nullable': 'YES'},
-                    {'column_name': 'creator_id', 'data_type': 'uuid', 'is_nullable': 'NO'},
-                    {'column_name': 'created_at', 'data_type': 'timestamp', 'is_nullable': 'YES'},
-                    {'column_name': 'updated_at', 'data_type': 'timestamp', 'is_nullable': 'YES'}
-                ]
-            elif table_name == 'course_sections':
-                return [
-                    {'column_name': 'id', 'data_type': 'uuid', 'is_nullable': 'NO'},
-                    {'column_name': 'course_id', 'data_type': 'uuid', 'is_nullable': 'NO'},
-                    {'column_name': 'title', 'data_type': 'text', 'is_nullable': 'NO'},
-                    {'column_name': 'order_index', 'data_type': 'integer', 'is_nullable': 'NO'},
-                    {'column_name': 'created_at', 'data_type': 'timestamp', 'is_nullable': 'YES'}
-                ]
-            elif table_name == 'lessons':
-                return [
-                    {'column_name': 'id', 'data_type': 'uuid', 'is_nullable': 'NO'},
-                    {'column_name': 'section_id', 'data_type': 'uuid', 'is_nullable': 'NO'},
-                    {'column_name': 'title', 'data_type': 'text', 'is_nullable': 'NO'},
-                    {'column_name': 'content', 'data_type': 'text', 'is_nullable': 'YES'},
-                    {'column_name': 'order_index', 'data_type': 'integer', 'is_nullable': 'NO'},
-                    {'column_name': 'created_at', 'data_type': 'timestamp', 'is_nullable': 'YES'}
-                ]
-            elif table_name == 'enrollments':
-                return [
-                    {'column_name': 'id', 'data_type': 'uuid', 'is_nullable': 'NO'},
-                    {'column_name': 'user_id', 'data_type': 'uuid', 'is_nullable': 'NO'},
-                    {'column_name': 'course_id', 'data_type': 'uuid', 'is_nullable': 'NO'},
-                    {'column_name': 'enrolled_at', 'data_type': 'timestamp', 'is_nullable': 'YES'}
-                ]
-            elif table_name == 'course_reviews':
-                return [
-                    {'column_name': 'id', 'data_type': 'uuid', 'is_nullable': 'NO'},
-                    {'column_name': 'user_id', 'data_type': 'uuid', 'is_nullable': 'NO'},
-                    {'column_name': 'course_id', 'data_type': 'uuid', 'is_nullable': 'NO'},
-                    {'column_name': 'rating', 'data_type': 'integer', 'is_nullable': 'NO'},
-                    {'column_name': 'comment', 'data_type': 'text', 'is_nullable': 'YES'},
-                    {'column_name': 'created_at', 'data_type': 'timestamp', 'is_nullable': 'YES'}
-                ]
-            elif table_name == 'lesson_completions':
-                return [
-                    {'column_name': 'id', 'data_type': 'uuid', 'is_nullable': 'NO'},
-                    {'column_name': 'user_id', 'data_type': 'uuid', 'is_nullable': 'NO'},
-                    {'column_name': 'lesson_id', 'data_type': 'uuid', 'is_nullable': 'NO'},
-                    {'column_name': 'completed_at', 'data_type': 'timestamp', 'is_nullable': 'YES'}
-                ]
-            return []
-            
-        # 첫 번째 행의 키를 컬럼으로 사용
-        columns = list(result.data[0].keys())
-        
-        # 각 컬럼의 타입 확인을 위해 정보 수집
-        column_info = []
-        for col in columns:
-            # 간단한 타입 추론 (정확한 타입은 직접 확인 필요)
-            col_type = 'unknown'
-            if result.data[0][col] is not None:  # 값이 None이 아닌 경우에만 타입 확인
-                col_type = type(result.data[0][col]).__name__
-                if col_type == 'str':
-                    col_type = 'text'
-                elif col_type == 'int':
-                    col_type = 'integer'
-                elif col_type == 'float':
-                    col_type = 'float8'
-                elif col_type == 'bool':
-                    col_type = 'boolean'
-                elif col_type == 'dict':
-                    col_type = 'jsonb'
-            
-            column_info.append({
-                'column_name': col,
-                'data_type': col_type,
-                'is_nullable': 'YES'  # 정확한 정보는 직접 확인 불가
-            })
-            
-        return column_info
+        # 컬럼 정보를 가져오지 못했으면 존재 여부를 확인하고, 샘플은 출력할 때만 조회
+        if show_samples or not schema:
+            # 존재 확인만 필요하면 행 없이(limit 0) 요청 (테이블이 없으면 APIError)
+            if show_samples:
+                query = supabase.table(table).select('*').limit(1)
+            else:
+                query = supabase.table(table).select('id').limit(0)
+            # supabase-py v2는 오류를 result.error가 아닌 APIError 예외로 알림
+            try:
+                result = await query.execute()
+            except APIError:
+                return report
+            report['sample'] = result.data[0] if result.data else None
+        elif table not in schema:
+            return report
         
+        report['exists'] = True
+        report['columns'] = get_table_columns(schema, table, report['sample'])
+        report['constraints'] = get_table_constraints(supabase, table)
     except Exception as e:
-        print(f"  Error getting columns for {table_name}: {e}")
-        return []
+        report['error'] = e
+    return report
+
+# 컬럼 목록의 한 줄 형식 (행마다 f-string을 다시 해석하지 않도록 미리 준비)
+_COLUMN_FIELDS = itemgetter('column_name', 'data_type', 'is_nullable')
+_COLUMN_LINE = "  {:<30} {:<15} {}".format
+
+def format_report(report, show_samples):
+    """probe_table 결과를 출력할 줄 목록으로 만드는 함수"""
+    table = report['table']
+    lines = [f"\n{'='*80}", f"TABLE: {table.upper()}", "=" * 40]
+    
+    if report['error'] is not None:
+        lines.append(f"  Error checking table {table}: {report['error']}")
+        return lines
+    if not report['exists']:
+        lines.append(f"  Table {table} does not exist or access denied")
+        return lines
+    
+    lines.append(f"  Table {table} exists")
+    
+    columns = report['columns']
+    if columns:
+        lines += ["\n  COLUMNS:", "  " + "-" * 80, f"  {'Column':<30} {'Type':<15} {'Nullable':<10}", "  " + "-" * 80]
+        lines += [_COLUMN_LINE(*_COLUMN_FIELDS(col)) for col in columns]
+    else:
+        lines.append("  Could not determine table columns")
+    
+    constraints = report['constraints']
+    if constraints:
+        lines += ["\n  CONSTRAINTS:", "  " + "-" * 80]
+        for constraint in constraints:
+            if constraint['constraint_type'] == 'FOREIGN KEY':
+                lines.append(f"  {constraint['constraint_type']}: {constraint['column_name']} -> {constraint['foreign_table_name']}({constraint['foreign_column_name']})")
+            else:
+                lines.append(f"  {constraint['constraint_type']}: {constraint.get('column_name', '')}")
+    
+    # 샘플 데이터 출력 (있을 경우)
+    if show_samples and report['sample']:
+        lines += ["\n  SAMPLE DATA (first row):", "  " + "-" * 80, f"  {report['sample']}"]
+    return lines
 
-def test_supabase_connection():
+async def test_supabase_connection(show_samples=False):
     try:
         # 환경변수에서 Supabase 설정 가져오기
         url = os.getenv("SUPABASE_URL")
@@ -181,78 +273,62 @@ def test_supabase_connection():
             
         print(f"Connecting to Supabase: {url}")
         
-        # Supabase 클라이언트 생성
-        supabase: Client = create_client(
-            url,
-            key,
-            options=ClientOptions(
-                postgrest_client_timeout=10,
-                storage_client_timeout=10,
-                schema="public",
-            )
+        # 모든 요청이 같은 연결을 공유하도록 httpx 클라이언트를 직접 전달 (supabase>=2.11)
+        # (transport를 지정하면 http2/limits는 transport 쪽 설정이 사용됨)
+        transport = httpx.AsyncHTTPTransport(
+            http2=HTTP2_AVAILABLE,
+            retries=2,
+            limits=httpx.Limits(max_keepalive_connections=10),
         )
+        async with httpx.AsyncClient(transport=transport, timeout=10) as http:
+            supabase: AsyncClient = await acreate_client(
+                url,
+                key,
+                options=AsyncClientOptions(
+                    postgrest_client_timeout=10,
+                    storage_client_timeout=10,
+                    schema="public",
+                    httpx_client=http,
+                )
+            )
         
-        # 알려진 테이블 목록 (Supabase 기본 테이블 + 우리가 생성한 테이블)
-        known_tables = [
-            'users', 'courses', 'course_sections', 'lessons', 
-            'enrollments', 'course_reviews', 'lesson_completions'
-        ]
+            # 알려진 테이블 목록 (Supabase 기본 테이블 + 우리가 생성한 테이블)
+            known_tables = [
+                'users', 'courses', 'course_sections', 'lessons', 
+                'enrollments', 'course_reviews', 'lesson_completions'
+            ]
         
-        print("\nChecking tables...")
+            print("\nChecking tables...")
         
-        # 각 테이블 확인
-        for table in known_tables:
-            print(f"\n{'='*80}")
-            print(f"TABLE: {table.upper()}")
-            print("=" * 40)
-            
-            try:
-                # 테이블 존재 여부 확인
-                result = supabase.table(table).select('*').limit(1).execute()
-                
-                if hasattr(result, 'error') and result.error:
-                    print(f"  Table {table} does not exist or access denied")
-                    continue
-                
-                print(f"  Table {table} exists")
-                
-                # 테이블 구조 가져오기
-                structure = get_table_structure(supabase, table)
-                
-                if not structure:
-                    print("  Could not determine table structure")
-                else:
-                    # 컬럼 정보 가져오기
-                    columns = get_table_columns(supabase, table)
-                    if columns:
-                        print("\n  COLUMNS:")
-                        print("  " + "-" * 80)
-                        print(f"  {'Column':<30} {'Type':<15} {'Nullable':<10}")
-                        print("  " + "-" * 80)
-                        for col in columns:
-                            print(f"  {col['column_name']:<30} {col['data_type']:<15} {col['is_nullable']}")
-                    else:
-                        print("  Could not determine table columns")
-                
-                # 제약 조건 정보 가져오기
-                constraints = get_table_constraints(supabase, table)
-                if constraints:
-                    print("\n  CONSTRAINTS:")
-                    print("  " + "-" * 80)
-                    for constraint in constraints:
-                        if constraint['constraint_type'] == 'FOREIGN KEY':
-                            print(f"  {constraint['constraint_type']}: {constraint['column_name']} -> {constraint['foreign_table_name']}({constraint['foreign_column_name']})")
-                        else:
-                            print(f"  {constraint['constraint_type']}: {constraint.get('column_name', '')}")
-                
-                # 샘플 데이터 출력 (있을 경우)
-                if result.data:
-                    print("\n  SAMPLE DATA (first row):")
-                    print("  " + "-" * 80)
-                    print(f"  {result.data[0]}")
-                
-            except Exception as e:
-                print(f"  Error checking table {table}: {e}")
+            # 모든 테이블의 컬럼 정보를 한 번에 조회
+            # DATABASE_URL이 있으면 직접 연결, 없으면 RPC 사용 (스키마 해시가 같으면 로컬 캐시 사용)
+            db_url = os.getenv("DATABASE_URL")
+            if db_url:
+                schema = await asyncio.to_thread(get_columns_direct, db_url, known_tables)
+            else:
+                fingerprint = await get_schema_fingerprint(supabase, known_tables)
+                schema = load_cached_schema(fingerprint) if fingerprint else None
+                if schema is None:
+                    schema = await get_public_schema(supabase, known_tables)
+                    if fingerprint and schema:
+                        save_cached_schema(fingerprint, schema)
+            if not schema:
+                print(
+                    "  Warning: could not read column information. "
+                    "Run create_tables.sql (get_public_schema) or set DATABASE_URL; "
+                    "showing inferred/built-in column definitions instead."
+                )
+        
+            # 테이블별 요청은 네트워크 대기 시간이 대부분이므로 동시에 실행 (gather는 입력 순서대로 반환)
+            reports = await asyncio.gather(
+                *(probe_table(supabase, schema, table, show_samples) for table in known_tables)
+            )
+        
+            # 출력 순서가 섞이지 않도록 결과는 순서대로 모아서 한 번에 출력
+            lines = []
+            for report in reports:
+                lines.extend(format_report(report, show_samples))
+            sys.stdout.write('\n'.join(lines) + '\n')
         
         return True
         
@@ -261,4 +337,12 @@ def test_supabase_connection():
         return False
 
 if __name__ == "__main__":
-    test_supabase_connection()
+    parser = argparse.ArgumentParser(description="Supabase 테이블 구조 확인 스크립트")
+    parser.add_argument(
+        "-v", "--verbose",
+        action="store_true",
+        help="테이블별 샘플 데이터(첫 번째 행)를 함께 출력합니다."
+    )
+    args = parser.parse_args()
+    
+    asyncio.run(test_supabase_connection(show_samples=args.verbose))